@@ -5,3 +5,29 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 from .consts import *
 from .profile import *
 from .tools import BLETools, printf
+from .uuids import make_uuid
+
+
+# 以下属性在首次访问（如 from ble import ValueStore）时才导入对应子模块：
+# - 特征值存储只有声明了默认特征值的配置文件（generic、hid、time、alert）需要，由其直接导入 ble.values，
+#   findme、uart 等不使用这些配置文件的设备不会加载
+# - 密钥读写只有需要绑定的设备调用
+# 常量、配置文件类、BLETools、printf 和 make_uuid 几乎每个设备都要使用，仍在导入时加载，
+# 且 from ble import * 不会触发按需加载
+__LAZY_ATTRS = {
+	'ValueStore': 'values',
+	'collect_values': 'values',
+	'apply_values': 'values',
+	'load_secrets': 'secrets',
+	'save_secrets': 'secrets',
+}
+
+def __getattr__(name):
+	if name not in __LAZY_ATTRS:
+		raise AttributeError(name)
+
+	module = __import__(f'ble.{__LAZY_ATTRS[name]}', None, None, (name,))
+	value  = getattr(module, name)
+
+	globals()[name] = value
+	return value
@@ -8,6 +8,10 @@ from micropython import const
 MAX_PAYLOAD_LENGTH = 31 # bytes
 
 
+# 修改下列常量类后需运行 scripts/gen_consts.py 重新生成 ble/flat_consts.py，
+# 其中的扁平常量（如 IRQ_GATTS_WRITE）用于 IRQ 回调等频繁比较的场合
+
+
 # Service UUIDs
 # 	https://bitbucket.org/bluetooth-SIG/public/src/main/assigned_numbers/uuids/service_uuids.yaml
 
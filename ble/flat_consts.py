@@ -0,0 +1,93 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+由 scripts/gen_consts.py 根据 ble/consts.py 自动生成，请勿手动修改
+"""
+from micropython import const
+
+
+# AddressMode
+ADDRESS_MODE_PUBLIC = const(0x00) # Use the controller’s public address
+ADDRESS_MODE_RANDOM = const(0x01) # Use a generated static address
+ADDRESS_MODE_RPA = const(0x02) # Use resolvable private addresses
+ADDRESS_MODE_NRPA = const(0x03) # Use non-resolvable private addresses
+
+# ADVType
+ADV_TYPE_IND = const(0x00) # connectable and scannable undirected advertising
+ADV_TYPE_DIRECT_IND = const(0x01) # connectable directed advertising
+ADV_TYPE_SCAN_IND = const(0x02) # scannable undirected advertising
+ADV_TYPE_NONCONN_IND = const(0x03) # non-connectable undirected advertising
+ADV_TYPE_SCAN_RSP = const(0x04) # scan response
+
+# IRQ
+IRQ_CENTRAL_CONNECT = const(1)
+IRQ_CENTRAL_DISCONNECT = const(2)
+IRQ_GATTS_WRITE = const(3)
+IRQ_GATTS_READ_REQUEST = const(4)
+IRQ_SCAN_RESULT = const(5)
+IRQ_SCAN_DONE = const(6)
+IRQ_PERIPHERAL_CONNECT = const(7)
+IRQ_PERIPHERAL_DISCONNECT = const(8)
+IRQ_GATTC_SERVICE_RESULT = const(9)
+IRQ_GATTC_SERVICE_DONE = const(10)
+IRQ_GATTC_CHARACTERISTIC_RESULT = const(11)
+IRQ_GATTC_CHARACTERISTIC_DONE = const(12)
+IRQ_GATTC_DESCRIPTOR_RESULT = const(13)
+IRQ_GATTC_DESCRIPTOR_DONE = const(14)
+IRQ_GATTC_READ_RESULT = const(15)
+IRQ_GATTC_READ_DONE = const(16)
+IRQ_GATTC_WRITE_DONE = const(17)
+IRQ_GATTC_NOTIFY = const(18)
+IRQ_GATTC_INDICATE = const(19)
+IRQ_GATTS_INDICATE_DONE = const(20)
+IRQ_MTU_EXCHANGED = const(21)
+IRQ_L2CAP_ACCEPT = const(22)
+IRQ_L2CAP_CONNECT = const(23)
+IRQ_L2CAP_DISCONNECT = const(24)
+IRQ_L2CAP_RECV = const(25)
+IRQ_L2CAP_SEND_READY = const(26)
+IRQ_CONNECTION_UPDATE = const(27)
+IRQ_ENCRYPTION_UPDATE = const(28)
+IRQ_GET_SECRET = const(29)
+IRQ_SET_SECRET = const(30)
+IRQ_PASSKEY_ACTION = const(31)
+
+# IOCapability
+IO_CAPABILITY_DISPLAY_ONLY = const(0)
+IO_CAPABILITY_DISPLAY_YESNO = const(1)
+IO_CAPABILITY_KEYBOARD_ONLY = const(2)
+IO_CAPABILITY_NO_INPUT_OUTPUT = const(3)
+IO_CAPABILITY_KEYBOARD_DISPLAY = const(4)
+
+# PasskeyAction
+PASSKEY_ACTION_NONE = const(0)
+PASSKEY_ACTION_INPUT = const(2)
+PASSKEY_ACTION_DISPLAY = const(3)
+PASSKEY_ACTION_NUMERIC_COMPARISON = const(4)
+
+# GATTSErrorCode
+GATTS_ERROR_CODE_NO_ERROR = const(0x00)
+GATTS_ERROR_CODE_READ_NOT_PERMITTED = const(0x02)
+GATTS_ERROR_CODE_WRITE_NOT_PERMITTED = const(0x03)
+GATTS_ERROR_CODE_INSUFFICIENT_AUTHENTICATION = const(0x05)
+GATTS_ERROR_CODE_INSUFFICIENT_AUTHORIZATION = const(0x08)
+GATTS_ERROR_CODE_INSUFFICIENT_ENCRYPTION = const(0x0f)
+
+# Flag
+FLAG_BROADCAST = const(0x0001)
+FLAG_READ = const(0x0002)
+FLAG_WRITE_NO_RESPONSE = const(0x0004)
+FLAG_WRITE = const(0x0008)
+FLAG_NOTIFY = const(0x0010)
+FLAG_INDICATE = const(0x0020)
+FLAG_AUTHENTICATED_SIGNED_WRITE = const(0x0040)
+FLAG_AUX_WRITE = const(0x0100)
+FLAG_READ_ENCRYPTED = const(0x0200)
+FLAG_READ_AUTHENTICATED = const(0x0400)
+FLAG_READ_AUTHORIZED = const(0x0800)
+FLAG_WRITE_ENCRYPTED = const(0x1000)
+FLAG_WRITE_AUTHENTICATED = const(0x2000)
+FLAG_WRITE_AUTHORIZED = const(0x4000)
+FLAG_READ_WRITE = const(FLAG_READ | FLAG_WRITE)
+FLAG_READ_NOTIFY = const(FLAG_READ | FLAG_NOTIFY)
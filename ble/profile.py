@@ -2,34 +2,241 @@
 Copyright © 2024 Walkline Wang (https://walkline.wang)
 Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
+from array import array
+from .consts import GATTSErrorCode
+
+
 class Profile(object):
 	def __dir__(self):
 		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
 
 	def __init__(self):
+		# 服务按添加顺序保存在列表中，并以 UUID 建立索引，
+		# 移除服务时只将对应位置置为 None，合并、移除和替换均无需遍历服务列表
 		self.__services = []
+		self.__index    = {} # uuid: position
+
+		# 编译后的服务定义和服务 UUID 列表，服务变化后需重新编译
+		self.__compiled = None
+		self.__dirty    = True
+		self.__revision = 0 # 编译时各服务修改次数之和，服务在添加后被修改时据此重新编译
 
 	def add_services(self, *services):
-		'''添加服务'''
+		'''添加服务，UUID 相同的服务将合并特征'''
 		for service in services:
-			update = False
+			position = self.__index.get(service.uuid)
 
-			for old_service in self.__services:
-				if service.__uuid == old_service.__uuid:
-					old_service.__characteristics += service.__characteristics
-					update = True
-					break
-
-			if not update:
+			if position is None:
+				self.__index[service.uuid] = len(self.__services)
 				self.__services.append(service)
+			else:
+				self.__services[position].add_characteristics(*service.characteristics)
+
+		self.__dirty = True
+		return self
+
+	def remove_services(self, *uuids):
+		'''按 UUID 移除服务'''
+		for uuid in uuids:
+			position = self.__index.pop(uuid, None)
+
+			if position is not None:
+				self.__services[position] = None
+
+		self.__dirty = True
+		return self
+
+	def replace_service(self, service):
+		'''替换 UUID 相同的服务并保持其原有位置，不存在时添加服务'''
+		position = self.__index.get(service.uuid)
 
-	def get_services(self) -> list:
+		if position is None:
+			self.add_services(service)
+		else:
+			self.__services[position] = service
+			self.__dirty = True
+
+		return self
+
+	def get_service(self, uuid):
+		'''按 UUID 获取服务对象，不存在时返回 None'''
+		position = self.__index.get(uuid)
+		return None if position is None else self.__services[position]
+
+	def __compile(self) -> tuple:
+		'''将服务树编译为不可变的元组结构并缓存，只在服务变化后重新编译'''
+		revision = 0
+
+		for service in self.__services:
+			if service is not None:
+				revision += service.revision
+
+		if self.__dirty or revision != self.__revision:
+			services = tuple(service for service in self.__services if service is not None)
+
+			self.__compiled = (
+				tuple(service.get_service() for service in services),
+				tuple(service.uuid for service in services),
+				tuple(attribute for service in services for attribute in service.get_attributes()),
+			)
+			self.__dirty    = False
+			self.__revision = revision
+
+		return self.__compiled
+
+	def get_services(self) -> tuple:
 		'''获取配置文件的服务、特征和描述符列表'''
-		return [service.get_service() for service in self.__services]
+		return self.__compile()[0]
 
-	def get_services_uuid(self) -> list:
+	def get_services_uuid(self) -> tuple:
 		'''获取配置文件的服务、特征和描述符 UUID 列表'''
-		return [service.__uuid for service in self.__services]
+		return self.__compile()[1]
+
+	def get_attributes(self) -> tuple:
+		'''获取按注册顺序排列的特征和描述符列表，与注册服务后得到的句柄一一对应'''
+		return self.__compile()[2]
+
+	def register(self, ble, *profiles) -> 'HandleMap':
+		'''
+		注册当前配置文件及附加配置文件的全部服务，返回句柄映射表
+
+		同一设备只能注册一次服务，多个配置文件需要通过 profiles 参数一并注册
+		'''
+		services   = self.get_services()
+		attributes = self.get_attributes()
+
+		for profile in profiles:
+			services   += profile.get_services()
+			attributes += profile.get_attributes()
+
+		handles = ble.gatts_register_services(services)
+
+		return HandleMap(attributes, [handle for service in handles for handle in service])
+
+
+class CompiledProfile(Profile):
+	'''
+	由 scripts/gen_profiles.py 生成的服务表构建的配置文件
+
+	服务表模块中的 SERVICES、SERVICES_UUID 和 ATTRIBUTES 均为预先生成的元组，
+	启动时无需创建服务、特征和描述符对象，注册后可以通过名称获取句柄：
+
+		from profiles.tables import findme
+		handles = CompiledProfile(findme).register(ble)
+		handles['AlertLevel']
+	'''
+	def __init__(self, table):
+		super().__init__()
+		self.__table = table
+
+	def __read_only(self, *args):
+		raise TypeError('compiled profile is read-only, edit scripts/specs/ instead')
+
+	# 服务表在生成时已确定，全部修改方法均不可用
+	add_services    = __read_only
+	remove_services = __read_only
+	replace_service = __read_only
+
+	def get_services(self) -> tuple:
+		return self.__table.SERVICES
+
+	def get_services_uuid(self) -> tuple:
+		return self.__table.SERVICES_UUID
+
+	def get_attributes(self) -> tuple:
+		return self.__table.ATTRIBUTES
+
+
+class HandleMap(object):
+	'''
+	服务注册后的句柄映射表
+
+	句柄按注册顺序保存在 array('H') 中，可以通过特征/描述符对象或名称（类名）获取：
+
+		handles[characteristic]   # 对象
+		handles['DeviceName']     # 名称，同名时返回第一个
+		handles.get_all('Report') # 同名的全部句柄
+
+	同时按句柄建立读/写处理函数表，在中断回调中直接以 attr_handle 为下标分发：
+
+		handles.on_write(handle, handler) # handler(conn_handle, attr_handle)
+		handles.dispatch_write(conn_handle, attr_handle)
+	'''
+	def __init__(self, attributes: tuple, handles: list):
+		assert len(attributes) == len(handles), 'attributes and handles count mismatch'
+
+		self.__handles = array('H', handles)
+		self.__index   = {} # attribute or name: position
+		self.__names   = {} # name: [position, ...]
+
+		for position, attribute in enumerate(attributes):
+			name = attribute if isinstance(attribute, str) else attribute.name
+
+			if not isinstance(attribute, str):
+				self.__index[attribute] = position
+
+			if name in self.__names:
+				self.__names[name].append(position)
+			else:
+				self.__names[name] = [position]
+				self.__index[name] = position
+
+		# 句柄从 1 开始连续分配，以句柄为下标的列表即可实现常数时间查找
+		size = max(handles) + 1 if handles else 0
+
+		self.__readers = [None] * size
+		self.__writers = [None] * size
+
+	def __getitem__(self, key) -> int:
+		return self.__handles[self.__index[key]]
+
+	def __contains__(self, key) -> bool:
+		return key in self.__index
+
+	def __len__(self) -> int:
+		return len(self.__handles)
+
+	def get_all(self, name: str) -> tuple:
+		'''按注册顺序获取同名特征或描述符的全部句柄'''
+		return tuple(self.__handles[position] for position in self.__names.get(name, ()))
+
+	@property
+	def handles(self) -> array:
+		return self.__handles
+
+	# region Dispatch related
+	def on_read(self, handle: int, handler):
+		'''
+		设置读请求处理函数 handler(conn_handle, attr_handle)，
+		返回值作为 GATTS 错误码，返回 None 视为 NO_ERROR
+
+		特征需要包含 Flag.READ_AUTHORIZED（FLAG_READ_AUTHORIZED）标志才会产生读请求事件
+		'''
+		self.__readers[handle] = handler
+
+	def on_write(self, handle: int, handler):
+		'''设置写入处理函数 handler(conn_handle, attr_handle)'''
+		self.__writers[handle] = handler
+
+	def dispatch_read(self, conn_handle: int, attr_handle: int) -> int:
+		'''在 IRQ_GATTS_READ_REQUEST 事件中调用，返回 GATTS 错误码'''
+		handler = self.__readers[attr_handle] if attr_handle < len(self.__readers) else None
+
+		if handler is not None:
+			return handler(conn_handle, attr_handle) or GATTSErrorCode.NO_ERROR
+
+		return GATTSErrorCode.NO_ERROR
+
+	def dispatch_write(self, conn_handle: int, attr_handle: int) -> bool:
+		'''在 IRQ_GATTS_WRITE 事件中调用，返回是否存在对应的处理函数'''
+		handler = self.__writers[attr_handle] if attr_handle < len(self.__writers) else None
+
+		if handler is not None:
+			handler(conn_handle, attr_handle)
+			return True
+
+		return False
+	# endregion
 
 
 class Service(object):
@@ -38,17 +245,69 @@ class Service(object):
 
 	def __init__(self, uuid):
 		self.__uuid = uuid
+
+		# 与 Profile 相同，以对象建立索引，移除的特征位置置为 None
 		self.__characteristics = []
+		self.__index           = {} # characteristic: position
+		self.__revision        = 0  # 修改次数，只增不减
 
 	def add_characteristics(self, *characteristics):
 		'''添加特征'''
 		for characteristic in characteristics:
+			self.__index[characteristic] = len(self.__characteristics)
 			self.__characteristics.append(characteristic)
+
+		self.__revision += 1
 		return self
 
-	def get_service(self) -> list:
+	def remove_characteristics(self, *characteristics):
+		'''移除特征'''
+		for characteristic in characteristics:
+			position = self.__index.pop(characteristic, None)
+
+			if position is not None:
+				self.__characteristics[position] = None
+
+		self.__revision += 1
+		return self
+
+	def replace_characteristic(self, old, new):
+		'''替换特征并保持其原有位置'''
+		position = self.__index.pop(old)
+
+		self.__index[new] = position
+		self.__characteristics[position] = new
+
+		self.__revision += 1
+		return self
+
+	def get_service(self) -> tuple:
 		'''获取当前服务列表'''
-		return [self.__uuid, [char.get_characteristic() for char in self.__characteristics]]
+		return (self.__uuid, tuple(char.get_characteristic() for char in self.characteristics))
+
+	def get_attributes(self) -> tuple:
+		'''获取当前服务中按注册顺序排列的特征和描述符'''
+		return tuple(attribute for char in self.characteristics for attribute in char.get_attributes())
+
+	@property
+	def uuid(self):
+		return self.__uuid
+
+	@property
+	def revision(self) -> int:
+		'''服务及其特征的修改次数之和，Profile 据此判断已缓存的编译结果是否失效'''
+		revision = self.__revision
+
+		for char in self.__characteristics:
+			if char is not None:
+				revision += char.revision
+
+		return revision
+
+	@property
+	def characteristics(self) -> tuple:
+		'''按添加顺序排列的特征'''
+		return tuple(char for char in self.__characteristics if char is not None)
 
 
 class Characteristic(object):
@@ -59,19 +318,39 @@ class Characteristic(object):
 		self.__descriptors = []
 		self.__uuid = uuid
 		self.__flags = flags
+		self.__revision = 0 # 修改次数，只增不减
 
 	def add_descriptors(self, *descriptors):
 		'''添加描述符'''
 		for descriptor in descriptors:
 			self.__descriptors.append(descriptor)
+
+		self.__revision += 1
 		return self
 
-	def get_characteristic(self) -> list:
+	def get_characteristic(self) -> tuple:
 		'''获取当前特征列表'''
 		if self.__descriptors:
-			return [self.__uuid, self.__flags, [descriptor.get_descriptor() for descriptor in self.__descriptors]]
+			return (self.__uuid, self.__flags, tuple(descriptor.get_descriptor() for descriptor in self.__descriptors))
 		else:
-			return [self.__uuid, self.__flags]
+			return (self.__uuid, self.__flags)
+
+	def get_attributes(self) -> tuple:
+		'''获取特征自身及其描述符，顺序与注册后得到的句柄一致'''
+		return (self,) + tuple(self.__descriptors)
+
+	@property
+	def uuid(self):
+		return self.__uuid
+
+	@property
+	def revision(self) -> int:
+		'''添加描述符的次数，计入所属服务的修改次数'''
+		return self.__revision
+
+	@property
+	def name(self) -> str:
+		return type(self).__name__
 
 
 class Descriptor(object):
@@ -82,6 +361,10 @@ class Descriptor(object):
 		self.__uuid = uuid
 		self.__flags = flags
 
-	def get_descriptor(self) -> list:
+	def get_descriptor(self) -> tuple:
 		'''获取当前描述符列表'''
-		return [self.__uuid, self.__flags]
+		return (self.__uuid, self.__flags)
+
+	@property
+	def name(self) -> str:
+		return type(self).__name__
@@ -0,0 +1,39 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+import json
+import binascii
+
+
+def load_secrets(filename: str = 'secrets.json') -> dict:
+	'''从文件读取配对密钥'''
+	secrets = dict()
+
+	try:
+		with open(filename, 'r') as file:
+			entries = json.load(file)
+
+			for sec_type, key, value in entries:
+				secrets[sec_type, binascii.a2b_base64(key)] = binascii.a2b_base64(value)
+	except:
+		pass
+	finally:
+		return secrets
+
+def save_secrets(secrets: dict, filename: str = 'secrets.json') -> bool:
+	'''将配对密钥写入文件'''
+	result = False
+
+	try:
+		with open(filename, 'w') as file:
+			json_secrets = [
+				(sec_type, binascii.b2a_base64(key), binascii.b2a_base64(value))
+				for (sec_type, key), value in secrets.items()
+			]
+			json.dump(json_secrets, file)
+		result = True
+	except:
+		pass
+	finally:
+		return result
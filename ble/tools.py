@@ -2,8 +2,6 @@
 Copyright © 2024 Walkline Wang (https://walkline.wang)
 Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
-import json
-import binascii
 from micropython import const
 from struct import pack, unpack
 from bluetooth import UUID
@@ -26,6 +24,34 @@ class ADType(object):
 
 
 class BLETools(object):
+	# 最近一次通过 activate() 写入协议栈的配置项
+	__config = {}
+
+	# region Activation related
+	@staticmethod
+	def activate(ble, **config):
+		'''
+		激活蓝牙并一次性应用配置
+
+		协议栈已激活时不再执行 active(False)/active(True) 重启，
+		且只写入与上次取值不同的配置项
+		'''
+		if not ble.active():
+			BLETools.__config.clear()
+
+			printf('Activating BLE...')
+			ble.active(True)
+
+		changed = {key: value for key, value in config.items() if BLETools.__config.get(key) != value}
+
+		if changed:
+			ble.config(**changed)
+			BLETools.__config.update(changed)
+
+		printf('BLE Activated')
+	# endregion
+
+
 	# region Payload data related
 	@staticmethod
 	def generate_advertising_payload(services: list = None, *,
@@ -124,34 +150,14 @@ class BLETools(object):
 
 	@staticmethod
 	def load_secrets(filename: str = 'secrets.json') -> dict:
-		secrets = dict()
-
-		try:
-			with open(filename, 'r') as file:
-				entries = json.load(file)
-
-				for sec_type, key, value in entries:
-					secrets[sec_type, binascii.a2b_base64(key)] = binascii.a2b_base64(value)
-		except:
-			pass
-		finally:
-			return secrets
+		# json 和 binascii 只在绑定设备时需要，按需导入
+		from .secrets import load_secrets
+		return load_secrets(filename)
 
+	@staticmethod
 	def save_secrets(secrets: dict, filename: str = 'secrets.json') -> bool:
-		result = False
-
-		try:
-			with open(filename, 'w') as file:
-				json_secrets = [
-					(sec_type, binascii.b2a_base64(key), binascii.b2a_base64(value))
-					for (sec_type, key), value in secrets.items()
-				]
-				json.dump(json_secrets, file)
-			result = True
-		except:
-			pass
-		finally:
-			return result
+		from .secrets import save_secrets
+		return save_secrets(secrets, filename)
 
 	@staticmethod
 	def make_appearance(category:int, subcategory:int) -> int:
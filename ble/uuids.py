@@ -0,0 +1,21 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+from bluetooth import UUID
+
+
+# 已创建的 UUID 对象，键为 16 位整数或 128 位字符串（取值见 backup/uuids.py 中的 assigned numbers）
+__uuids = {}
+
+def make_uuid(value: int | str) -> UUID:
+	'''
+	获取 value 对应的 UUID 对象，相同的值始终返回同一个对象
+
+	用于配置文件定义和中断回调中的 UUID 比较，避免重复创建 UUID 对象
+	'''
+	try:
+		return __uuids[value]
+	except KeyError:
+		uuid = __uuids[value] = UUID(value)
+		return uuid
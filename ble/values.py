@@ -0,0 +1,90 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+
+
+class ValueStore(object):
+	'''
+	特征值存储基类
+
+	子类在 setter 中打包特征值并调用 _update() 保存，getter 通过 _value() 直接返回已打包的字节串，
+	只有值发生变化时才会标记为待写入；绑定句柄后调用 flush() 只写入发生变化的特征值：
+
+		values.bind(manufacturer_name=handle, ...)
+		values.flush(ble.gatts_write)
+	'''
+	def __init__(self):
+		self.__packed  = {} # name: bytes
+		self.__handles = {} # name: handle
+		self.__dirty   = set()
+
+	def _update(self, name: str, value):
+		if self.__packed.get(name) != value:
+			self.__packed[name] = value
+			self.__dirty.add(name)
+
+	def _value(self, name: str):
+		return self.__packed[name]
+
+	def bind(self, **handles):
+		'''绑定特征值名称和句柄，新绑定的特征值将在下次 flush() 时写入'''
+		for name, handle in handles.items():
+			self.__handles[name] = handle
+			self.__dirty.add(name)
+
+	def is_dirty(self, name: str) -> bool:
+		return name in self.__dirty
+
+	def collect(self, table: dict = None) -> dict:
+		'''
+		将已绑定且发生变化的特征值加入 {handle: bytes} 表并清除其变化标记，
+		配合 apply_values() 在启动时一次性写入多个特征值
+		'''
+		if table is None:
+			table = {}
+
+		for name in tuple(self.__dirty):
+			handle = self.__handles.get(name)
+
+			if handle is not None:
+				table[handle] = self.__packed[name]
+				self.__dirty.discard(name)
+
+		return table
+
+	def flush(self, write) -> int:
+		'''将已绑定且发生变化的特征值写入协议栈，write 通常为 gatts_write，返回写入数量'''
+		count = 0
+
+		for name in tuple(self.__dirty):
+			handle = self.__handles.get(name)
+
+			if handle is not None:
+				write(handle, self.__packed[name])
+				self.__dirty.discard(name)
+				count += 1
+
+		return count
+
+
+def collect_values(*stores, table: dict = None) -> dict:
+	'''从多个 ValueStore 中收集待写入的特征值，返回 {handle: bytes} 表'''
+	if table is None:
+		table = {}
+
+	for store in stores:
+		store.collect(table)
+
+	return table
+
+def apply_values(write, table: dict) -> int:
+	'''
+	按句柄顺序一次性写入 {handle: bytes} 表，write 通常为 gatts_write，返回写入数量
+
+	启动时用于代替逐个调用 gatts_write 初始化特征值
+	'''
+	for handle in sorted(table):
+		write(handle, table[handle])
+
+	return len(table)
@@ -4,7 +4,8 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 import bluetooth
 from struct import unpack
-from ble import BLETools, ADVType, IRQ, printf
+from ble import BLETools, ADVType, printf, make_uuid
+from ble.flat_consts import *
 from profiles.alert import AlertNotificationValues as Values
 
 
@@ -55,30 +56,27 @@ class AlertNotificationClient(object):
 		self.__unread_alert_status_cb    = unread_alert_status_cb
 		self.__request_alert_category_cb = request_alert_category_cb
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			mtu=256,
+		)
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.SCAN_RESULT:
+		if event == IRQ_SCAN_RESULT:
 			if self.__check(data):
 				self.__target = Device(data)
 				self.__ble.gap_scan(None)
 
-		elif event == IRQ.SCAN_DONE:
+		elif event == IRQ_SCAN_DONE:
 			printf(f'Scan Completed, Alert Notification Server{"" if self.__target else " not"} found')
 
 			if self.__target:
 				printf(f'Connecting to [{self.__target.name}]')
 				self.__ble.gap_connect(self.__target.addr_type, self.__target.addr)
 
-		elif event == IRQ.PERIPHERAL_CONNECT:
+		elif event == IRQ_PERIPHERAL_CONNECT:
 			conn_handle, _, _ = data
 
 			if self.__target:
@@ -87,40 +85,40 @@ class AlertNotificationClient(object):
 				self.__target.conn_handle = conn_handle
 				self.__ble.gattc_discover_services(conn_handle)
 
-		elif event == IRQ.PERIPHERAL_DISCONNECT:
+		elif event == IRQ_PERIPHERAL_DISCONNECT:
 			if self.__target:
 				printf(f'[{self.__target.name}] Disconnected')
 				self.__target = None
 
-		elif event == IRQ.GATTC_SERVICE_RESULT:
+		elif event == IRQ_GATTC_SERVICE_RESULT:
 			_, start_handle, end_handle, uuid = data
 
-			if uuid == bluetooth.UUID(Values.UUIDS.ALERT_NOTIFICATION_SERVICE):
+			if uuid == make_uuid(Values.UUIDS.ALERT_NOTIFICATION_SERVICE):
 				self.__target.start_handle = start_handle
 				self.__target.end_handle   = end_handle
 
-		elif event == IRQ.GATTC_SERVICE_DONE:
+		elif event == IRQ_GATTC_SERVICE_DONE:
 			conn_handle, _ = data
 
 			if self.__target.start_handle and self.__target.end_handle:
 				self.__ble.gattc_discover_characteristics(conn_handle,
 					self.__target.start_handle, self.__target.end_handle)
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_RESULT:
+		elif event == IRQ_GATTC_CHARACTERISTIC_RESULT:
 			_, _, value_handle, _, uuid = data
 
-			if   uuid == bluetooth.UUID(Values.UUIDS.SUPPORTED_NEW_ALERT_CATEGORY):
+			if   uuid == make_uuid(Values.UUIDS.SUPPORTED_NEW_ALERT_CATEGORY):
 				self.__target.__handle_supported_new_alert_category = value_handle
-			elif uuid == bluetooth.UUID(Values.UUIDS.NEW_ALERT):
+			elif uuid == make_uuid(Values.UUIDS.NEW_ALERT):
 				self.__target.__handle_new_alert = value_handle
-			elif uuid == bluetooth.UUID(Values.UUIDS.SUPPORTED_UNREAD_ALERT_CATEGORY):
+			elif uuid == make_uuid(Values.UUIDS.SUPPORTED_UNREAD_ALERT_CATEGORY):
 				self.__target.__handle_supported_unread_alert_category = value_handle
-			elif uuid == bluetooth.UUID(Values.UUIDS.UNREAD_ALERT_STATUS):
+			elif uuid == make_uuid(Values.UUIDS.UNREAD_ALERT_STATUS):
 				self.__target.__handle_unread_alert_status = value_handle
-			elif uuid == bluetooth.UUID(Values.UUIDS.ALERT_NOTIFICATION_CONTROL_POINT):
+			elif uuid == make_uuid(Values.UUIDS.ALERT_NOTIFICATION_CONTROL_POINT):
 				self.__target.__handle_alert_notification_control_point = value_handle
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_DONE:
+		elif event == IRQ_GATTC_CHARACTERISTIC_DONE:
 			if self.__target.__handle_supported_new_alert_category and\
 			   self.__target.__handle_new_alert and\
 			   self.__target.__handle_supported_unread_alert_category and\
@@ -131,7 +129,7 @@ class AlertNotificationClient(object):
 				if self.__found_target_cb:
 					self.__found_target_cb()
 
-		elif event == IRQ.GATTC_READ_RESULT:
+		elif event == IRQ_GATTC_READ_RESULT:
 			_, value_handle, char_data = data
 
 			if value_handle == self.__target.__handle_supported_new_alert_category:
@@ -141,13 +139,13 @@ class AlertNotificationClient(object):
 				self.__supported_unread_alert_category = [int(c) for c in f'{unpack('<H', char_data)[0]:0>10b}']
 				self.__supported_unread_alert_category.reverse()
 
-		elif event == IRQ.GATTC_READ_DONE:
+		elif event == IRQ_GATTC_READ_DONE:
 			if self.__supported_new_alert_category and self.__supported_unread_alert_category:
 				if self.__request_alert_category_cb:
 					self.__request_alert_category_cb(
 						self.__supported_new_alert_category, self.__supported_unread_alert_category)
 
-		elif event == IRQ.GATTC_NOTIFY:
+		elif event == IRQ_GATTC_NOTIFY:
 			_, value_handle, notify_data = data
 
 			if value_handle == self.__target.__handle_new_alert:
@@ -158,15 +156,15 @@ class AlertNotificationClient(object):
 				if self.__unread_alert_status_cb:
 					self.__unread_alert_status_cb(*unpack('<BB', notify_data))
 
-		elif event == IRQ.GATTC_INDICATE:
+		elif event == IRQ_GATTC_INDICATE:
 			conn_handle, value_handle, status = data
 			printf(f'GATTS Indicate Done [Handle: {conn_handle}, Value_Handle: {value_handle}, Status: {bytes(status)}]')
 
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			pass
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
 		else:
 			printf(f'Uncaught IRQ Event: {event}, Data: {data}')
@@ -175,7 +173,7 @@ class AlertNotificationClient(object):
 		_, _, adv_type, rssi, adv_data = data
 
 		return (BLETools.decode_name(adv_data) == self.__target_name or\
-			   bluetooth.UUID(Values.UUIDS.ALERT_NOTIFICATION_SERVICE) in BLETools.decode_services(adv_data)) and\
+			   make_uuid(Values.UUIDS.ALERT_NOTIFICATION_SERVICE) in BLETools.decode_services(adv_data)) and\
 			   adv_type in (ADVType.IND, ADVType.DIRECT_IND, ADVType.SCAN_RSP) and rssi >= -80
 
 
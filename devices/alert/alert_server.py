@@ -5,7 +5,9 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 import bluetooth
 from struct import unpack
 from ble import *
-from profiles.alert import AlertNotificationProfile, AlertNotificationValues
+from ble.flat_consts import *
+from profiles.alert import AlertNotificationValues
+from profiles.tables import alert as alert_table
 
 
 class AlertNotificationServer(object):
@@ -20,21 +22,18 @@ class AlertNotificationServer(object):
 		self.__control_point_cb = control_point_cb
 		self.__conn_handles     = set()
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(addr_mode=AddressMode.RPA, mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			addr_mode=AddressMode.RPA, mtu=256,
+		)
 
-		alert_profile = AlertNotificationProfile()
+		alert_profile = CompiledProfile(alert_table)
 
 		self.__alert_values = AlertNotificationValues()
 
-		self.__register_services(alert_profile.get_services())
+		self.__register_services(alert_profile.register(self.__ble))
 
 		adv_payload = BLETools.generate_advertising_payload(
 			alert_profile.get_services_uuid(),
@@ -52,16 +51,19 @@ class AlertNotificationServer(object):
 
 		self.__advertise(adv_payload, resp_payload)
 
-	def __register_services(self, services: list):
-		(
-			(
-				self.__handle_supported_new_alert_category,
-				self.__handle_new_alert,
-				self.__handle_supported_unread_alert_category,
-				self.__handle_unread_alert_status,
-				self.__handle_alert_notification_control_point,
-			),
-		) = self.__ble.gatts_register_services(services)
+	def __register_services(self, handles: HandleMap):
+		self.__handle_supported_new_alert_category     = handles['SupportedNewAlertCategory']
+		self.__handle_new_alert                        = handles['NewAlert']
+		self.__handle_supported_unread_alert_category  = handles['SupportedUnreadAlertCategory']
+		self.__handle_unread_alert_status              = handles['UnreadAlertStatus']
+		self.__handle_alert_notification_control_point = handles['AlertNotificationControlPoint']
+
+		# 支持的类别只在启用或禁用时写入
+		self.__alert_values.alert_notification_service.bind(
+			new_alert_category=self.__handle_supported_new_alert_category,
+			unread_alert_category=self.__handle_supported_unread_alert_category,
+		)
+		self.__alert_values.alert_notification_service.flush(self.__ble.gatts_write)
 
 		printf('Services Registered')
 
@@ -84,7 +86,7 @@ class AlertNotificationServer(object):
 		printf('Advertising Payload...')
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.CENTRAL_CONNECT:
+		if event == IRQ_CENTRAL_CONNECT:
 			conn_handle, _, addr, = data
 
 			self.__conn_handles.add(conn_handle)
@@ -92,7 +94,7 @@ class AlertNotificationServer(object):
 
 			printf(f'[{BLETools.decode_mac(addr)}] Connected [Handle: {conn_handle}]')
 
-		elif event == IRQ.CENTRAL_DISCONNECT:
+		elif event == IRQ_CENTRAL_DISCONNECT:
 			conn_handle, _, addr, = data
 
 			if conn_handle in self.__conn_handles:
@@ -102,21 +104,10 @@ class AlertNotificationServer(object):
 
 			self.__advertise()
 
-		elif event == IRQ.GATTS_READ_REQUEST:
-			_, attr_handle = data
-
-			if attr_handle == self.__handle_supported_new_alert_category:
-				self.__ble.gatts_write(
-					self.__handle_supported_new_alert_category,
-					self.__alert_values.alert_notification_service.new_alert_category)
-			elif attr_handle == self.__handle_supported_unread_alert_category:
-				self.__ble.gatts_write(
-					self.__handle_supported_unread_alert_category,
-					self.__alert_values.alert_notification_service.unread_alert_category)
-
+		elif event == IRQ_GATTS_READ_REQUEST:
 			return GATTSErrorCode.NO_ERROR
 
-		elif event == IRQ.GATTS_WRITE:
+		elif event == IRQ_GATTS_WRITE:
 			_, attr_handle = data
 
 			if attr_handle == self.__handle_alert_notification_control_point:
@@ -126,11 +117,11 @@ class AlertNotificationServer(object):
 				if self.__control_point_cb:
 					self.__control_point_cb(command, category)
 
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			pass
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
 		else:
 			printf(f'Uncaught IRQ Event: {event}, Data: {data}')
@@ -138,15 +129,19 @@ class AlertNotificationServer(object):
 	# region Class Methods
 	def enable_new_alert(self, category: int):
 		self.__alert_values.alert_notification_service.enable_category(category, True)
+		self.__alert_values.alert_notification_service.flush(self.__ble.gatts_write)
 
 	def disable_new_alert(self, category: int):
 		self.__alert_values.alert_notification_service.disable_category(category, True)
+		self.__alert_values.alert_notification_service.flush(self.__ble.gatts_write)
 
 	def enable_unread_alert_status(self, category: int):
 		self.__alert_values.alert_notification_service.enable_category(category, False)
+		self.__alert_values.alert_notification_service.flush(self.__ble.gatts_write)
 
 	def disable_unread_alert_status(self, category: int):
 		self.__alert_values.alert_notification_service.disable_category(category, False)
+		self.__alert_values.alert_notification_service.flush(self.__ble.gatts_write)
 
 	def send_new_alert(self, category_id: int, number: int, text: str):
 		if self.__alert_values.alert_notification_service.make_new_alert(category_id, number, text):
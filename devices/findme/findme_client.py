@@ -3,7 +3,8 @@ Copyright © 2024 Walkline Wang (https://walkline.wang)
 Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 import bluetooth
-from ble import BLETools, ADVType, IRQ, printf
+from ble import BLETools, ADVType, printf, make_uuid
+from ble.flat_consts import *
 from profiles.findme import FindMeValues as Values
 
 
@@ -40,30 +41,27 @@ class FindMeClient(object):
 
 		self.__found_target_cb = found_target_cb
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			mtu=256,
+		)
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.SCAN_RESULT:
+		if event == IRQ_SCAN_RESULT:
 			if self.__check(data):
 				self.__target = Device(data)
 				self.__ble.gap_scan(None)
 
-		elif event == IRQ.SCAN_DONE:
+		elif event == IRQ_SCAN_DONE:
 			printf(f'Scan Completed, Find Me Server{"" if self.__target else " not"} found')
 
 			if self.__target:
 				printf(f'Connecting to [{self.__target.name}]')
 				self.__ble.gap_connect(self.__target.addr_type, self.__target.addr)
 
-		elif event == IRQ.PERIPHERAL_CONNECT:
+		elif event == IRQ_PERIPHERAL_CONNECT:
 			conn_handle, _, _ = data
 
 			if self.__target:
@@ -72,45 +70,45 @@ class FindMeClient(object):
 				self.__target.conn_handle = conn_handle
 				self.__ble.gattc_discover_services(conn_handle)
 
-		elif event == IRQ.PERIPHERAL_DISCONNECT:
+		elif event == IRQ_PERIPHERAL_DISCONNECT:
 			if self.__target:
 				printf(f'[{self.__target.name}] Disconnected')
 				self.__target = None
 
-		elif event == IRQ.GATTC_SERVICE_RESULT:
+		elif event == IRQ_GATTC_SERVICE_RESULT:
 			_, start_handle, end_handle, uuid = data
 
-			if uuid == bluetooth.UUID(Values.UUIDS.IMMEDIATE_ALERT_SERVICE):
+			if uuid == make_uuid(Values.UUIDS.IMMEDIATE_ALERT_SERVICE):
 				self.__target.start_handle = start_handle
 				self.__target.end_handle   = end_handle
 
-		elif event == IRQ.GATTC_SERVICE_DONE:
+		elif event == IRQ_GATTC_SERVICE_DONE:
 			conn_handle, _ = data
 
 			if self.__target.start_handle and self.__target.end_handle:
 				self.__ble.gattc_discover_characteristics(conn_handle,
 					self.__target.start_handle, self.__target.end_handle)
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_RESULT:
+		elif event == IRQ_GATTC_CHARACTERISTIC_RESULT:
 			_, _, value_handle, _, uuid = data
 
-			if uuid == bluetooth.UUID(Values.UUIDS.ALERT_LEVEL):
+			if uuid == make_uuid(Values.UUIDS.ALERT_LEVEL):
 				self.__target.handle_alert_level = value_handle
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_DONE:
+		elif event == IRQ_GATTC_CHARACTERISTIC_DONE:
 			if self.__target.handle_alert_level:
 				if self.__found_target_cb is not None:
 					self.__found_target_cb()
 
-		elif event == IRQ.GATTC_INDICATE:
+		elif event == IRQ_GATTC_INDICATE:
 			conn_handle, value_handle, status = data
 			printf(f'GATTS Indicate Done [Handle: {conn_handle}, Value_Handle: {value_handle}, Status: {bytes(status)}]')
 
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			pass
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
 		else:
 			printf(f'event: {event}, data: {data}')
@@ -119,7 +117,7 @@ class FindMeClient(object):
 		_, _, adv_type, rssi, adv_data = data
 
 		return (BLETools.decode_name(adv_data) == self.__target_name or\
-			   bluetooth.UUID(Values.UUIDS.IMMEDIATE_ALERT_SERVICE) in BLETools.decode_services(adv_data)) and\
+			   make_uuid(Values.UUIDS.IMMEDIATE_ALERT_SERVICE) in BLETools.decode_services(adv_data)) and\
 			   adv_type in (ADVType.IND, ADVType.DIRECT_IND, ADVType.SCAN_RSP) and rssi >= -80
 
 	# region Class Methods
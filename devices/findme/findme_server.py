@@ -4,7 +4,8 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 import bluetooth
 from ble import *
-from profiles.findme import FindMeProfile
+from ble.flat_consts import *
+from profiles.tables import findme as findme_table
 
 
 class FindMeServer(object):
@@ -20,19 +21,16 @@ class FindMeServer(object):
 		self.__conn_handles     = set()
 		self.__last_alert_level = 0
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(addr_mode=AddressMode.RPA, mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			addr_mode=AddressMode.RPA, mtu=256,
+		)
 
-		findme_profile = FindMeProfile()
+		findme_profile = CompiledProfile(findme_table)
 
-		self.__register_services(findme_profile.get_services())
+		self.__register_services(findme_profile.register(self.__ble))
 
 		adv_payload = BLETools.generate_advertising_payload(
 			findme_profile.get_services_uuid(),
@@ -50,12 +48,8 @@ class FindMeServer(object):
 
 		self.__advertise(adv_payload, resp_payload)
 
-	def __register_services(self, services: list):
-		(
-			(
-				self.__handle_alert_level,
-			),
-		) = self.__ble.gatts_register_services(services)
+	def __register_services(self, handles: HandleMap):
+		self.__handle_alert_level = handles['AlertLevel']
 
 		printf('Services Registered')
 
@@ -69,7 +63,7 @@ class FindMeServer(object):
 		printf('Advertising Payload...')
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.CENTRAL_CONNECT:
+		if event == IRQ_CENTRAL_CONNECT:
 			conn_handle, _, addr, = data
 
 			self.__conn_handles.add(conn_handle)
@@ -77,7 +71,7 @@ class FindMeServer(object):
 
 			printf(f'[{BLETools.decode_mac(addr)}] Connected [Handle: {conn_handle}]')
 
-		elif event == IRQ.CENTRAL_DISCONNECT:
+		elif event == IRQ_CENTRAL_DISCONNECT:
 			conn_handle, _, addr, = data
 
 			if conn_handle in self.__conn_handles:
@@ -87,7 +81,7 @@ class FindMeServer(object):
 
 			self.__advertise()
 
-		elif event == IRQ.GATTS_WRITE:
+		elif event == IRQ_GATTS_WRITE:
 			_, attr_handle = data
 
 			if attr_handle == self.__handle_alert_level:
@@ -98,15 +92,15 @@ class FindMeServer(object):
 				if self.__alert_level_cb:
 					self.__alert_level_cb(self.__last_alert_level)
 
-		elif event == IRQ.GATTC_INDICATE:
+		elif event == IRQ_GATTC_INDICATE:
 			conn_handle, value_handle, data = data
 			printf(f'GATTC Indicate [Handle: {conn_handle}, Value_Handle: {value_handle}, Data: {bytes(data)}]')
 
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			pass
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
 		else:
 			printf(f'Uncaught IRQ Event: {event}, Data: {data}')
@@ -0,0 +1,143 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+电池电量采集，按 采样 -> 滑动平均 -> 换算百分比 -> 滞回 的顺序处理，
+百分比发生变化时才调用 update_battery_level() 写入并通知：
+
+	from devices.hid.battery import BatteryMonitor, ADCSource
+
+	monitor = BatteryMonitor(keyboard, ADCSource(1))
+	monitor.start()
+"""
+import machine
+from micropython import const
+from devices.hid.timer import DeferredCall, DEFAULT_TIMER_ID
+
+
+# 默认采样间隔（毫秒）
+DEFAULT_PERIOD_MS = const(10000)
+
+
+class ADCSource(object):
+	'''
+	通过 ADC 读取电池电压，调用时返回毫伏值
+
+	电池电压经电阻分压后接入 ADC 引脚时，divider 为分压比，如两个等值电阻分压时为 2
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, pin: int, divider: int = 2):
+		self.__adc     = machine.ADC(machine.Pin(pin))
+		self.__divider = divider
+
+	def __call__(self) -> int:
+		return self.__adc.read_uv() * self.__divider // 1000
+
+
+class BatteryMonitor(object):
+	'''
+	电池电量监测
+
+	source 为任意返回电池电压（毫伏）的函数，如 ADCSource 的实例，
+	最近 window 次采样取平均值后按 empty_mv ~ full_mv 线性换算为百分比，
+	与上次上报的电量相差不足 hysteresis 时保持不变，避免电压波动导致电量来回跳变
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self,
+			device,
+			source: function,
+			*,
+			window: int = 8,
+			hysteresis: int = 2,
+			empty_mv: int = 3300,
+			full_mv: int = 4200,
+			period_ms: int = DEFAULT_PERIOD_MS,
+			timer_id: int = DEFAULT_TIMER_ID,
+		):
+		'''
+		参数：
+		- device：HIDDevice 及其子类的实例
+		- source：采样函数，返回电池电压（毫伏）
+		- window：滑动平均的采样次数
+		- hysteresis：上报电量需要变化的最小百分比
+		- empty_mv、full_mv：电量为 0% 和 100% 时的电压
+		- period_ms：start() 后的采样间隔
+		- timer_id：用于定时采样的定时器 ID，见 devices.hid.timer
+		'''
+		self.__device     = device
+		self.__source     = source
+		self.__hysteresis = hysteresis
+		self.__empty_mv   = empty_mv
+		self.__full_mv    = full_mv
+		self.__period_ms  = period_ms
+
+		self.__samples = [0] * window
+		self.__index   = 0
+		self.__total   = 0
+		self.__level   = None # 最近一次上报的电量
+
+		self.__running     = False
+		self.__sample_call = DeferredCall(self.__periodic_sample, timer_id)
+
+	def __periodic_sample(self):
+		if self.__running:
+			self.sample()
+			self.__sample_call.schedule(self.__period_ms)
+
+	def __to_percent(self, millivolts: int) -> int:
+		if millivolts <= self.__empty_mv:
+			return 0
+
+		if millivolts >= self.__full_mv:
+			return 100
+
+		return (millivolts - self.__empty_mv) * 100 // (self.__full_mv - self.__empty_mv)
+
+	def sample(self) -> int:
+		'''采样一次，电量变化超过滞回范围时上报，返回当前上报的电量'''
+		value   = self.__source()
+		samples = self.__samples
+
+		if self.__level is None:
+			# 第一次采样填满窗口，避免平均值从 0 开始上升
+			for index in range(len(samples)):
+				samples[index] = value
+
+			self.__total = value * len(samples)
+		else:
+			self.__total += value - samples[self.__index]
+			samples[self.__index] = value
+			self.__index = (self.__index + 1) % len(samples)
+
+		percent = self.__to_percent(self.__total // len(samples))
+
+		# 充满和耗尽时不受滞回限制，保证能够上报 0% 和 100%
+		if self.__level is None or abs(percent - self.__level) >= self.__hysteresis or (percent in (0, 100) and percent != self.__level):
+			self.__level = percent
+			self.__device.update_battery_level(percent)
+
+		return self.__level
+
+	def start(self):
+		'''立即采样一次，然后按 period_ms 定时采样'''
+		self.__running = True
+		self.sample()
+		self.__sample_call.schedule(self.__period_ms)
+
+	def stop(self):
+		self.__running = False
+		self.__sample_call.cancel()
+
+	@property
+	def level(self) -> int:
+		'''最近一次上报的电量，尚未采样时为 None'''
+		return self.__level
+
+	@property
+	def millivolts(self) -> int:
+		'''滑动平均后的电压'''
+		return self.__total // len(self.__samples)
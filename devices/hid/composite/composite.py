@@ -0,0 +1,86 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+from profiles.hid import HIDKeyboard, USAGE_PAGE_CONSUMER, USAGE_PAGE_BUTTON
+from .reportmap import REPORT_MAP_DATA, REPORT_ID_CONSUMER, REPORT_ID_MOUSE
+
+
+class BLECompositeHID(HIDKeyboard):
+	'''
+	复合 HID 设备，一个连接同时提供键盘、消费类控制和鼠标
+
+	键盘部分与 BLEKeyboard104 相同（press/release/send_kb_key），
+	消费类控制使用 16 位用途值，鼠标按键使用 bit 0~4 表示左、右、中、后退、前进
+	'''
+	CONSUMER_VOLUME_UP   = 0xE9
+	CONSUMER_VOLUME_DOWN = 0xEA
+	CONSUMER_MUTE        = 0xE2
+	CONSUMER_PLAY_PAUSE  = 0xCD
+
+	MOUSE_LEFT   = 0x01
+	MOUSE_RIGHT  = 0x02
+	MOUSE_MIDDLE = 0x04
+
+	def __init__(self, device_name: str = 'MP_HID', led_status_cb: function = None):
+		super().__init__(device_name, REPORT_MAP_DATA,
+			appearance=960, # (0x00f, 0x00) Generic HID
+			input_sizes={USAGE_PAGE_CONSUMER: 2, USAGE_PAGE_BUTTON: 4},
+			led_status_cb=led_status_cb,
+		)
+
+		self.__consumer = self.report_buffer(REPORT_ID_CONSUMER)
+		self.__mouse    = self.report_buffer(REPORT_ID_MOUSE)
+
+
+	# region Consumer control
+	def consumer_press(self, usage: int):
+		self.__consumer[0] = usage & 0xFF
+		self.__consumer[1] = usage >> 8
+		self.send_report(REPORT_ID_CONSUMER)
+
+	def consumer_release(self):
+		self.__consumer[0] = self.__consumer[1] = 0
+		self.send_report(REPORT_ID_CONSUMER)
+	# endregion
+
+
+	# region Mouse
+	def mouse_move(self, x: int = 0, y: int = 0, wheel: int = 0):
+		'''相对移动，超出 -127~127 时拆分为多个 report 依次发送'''
+		mouse = self.__mouse
+
+		try:
+			while True:
+				step_x     = max(-127, min(127, x))
+				step_y     = max(-127, min(127, y))
+				step_wheel = max(-127, min(127, wheel))
+
+				mouse[1] = step_x & 0xFF
+				mouse[2] = step_y & 0xFF
+				mouse[3] = step_wheel & 0xFF
+
+				self.send_report(REPORT_ID_MOUSE)
+
+				x     -= step_x
+				y     -= step_y
+				wheel -= step_wheel
+
+				if not (x or y or wheel):
+					break
+		finally:
+			# 发送失败时也要清零，避免之后的按键 report 重复携带位移
+			mouse[1] = mouse[2] = mouse[3] = 0
+
+	def mouse_press(self, buttons: int):
+		self.__mouse[0] |= buttons
+		self.send_report(REPORT_ID_MOUSE)
+
+	def mouse_release(self, buttons: int = 0x1F):
+		self.__mouse[0] &= ~buttons
+		self.send_report(REPORT_ID_MOUSE)
+
+	def mouse_click(self, buttons: int = 0x01):
+		self.mouse_press(buttons)
+		self.mouse_release(buttons)
+	# endregion
@@ -0,0 +1,93 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+'''
+Report ID 1：键盘，8 字节输入（修饰键, 保留, 6 个键值），1 字节 LED 输出
+Report ID 2：消费类控制，2 字节输入（16 位用途，如 0xE9 音量+）
+Report ID 3：鼠标，4 字节输入（按键, X, Y, 滚轮）
+'''
+REPORT_ID_KEYBOARD = 1
+REPORT_ID_CONSUMER = 2
+REPORT_ID_MOUSE    = 3
+
+REPORT_MAP_DATA = [
+	# 键盘
+	0x05, 0x01,	# Usage Page (Generic Desktop Ctrls)
+	0x09, 0x06,	# Usage (Keyboard)
+	0xA1, 0x01,	# Collection (Application)
+	0x85, 0x01,	#   Report ID (1)
+	0x05, 0x07,	#   Usage Page (Kbrd/Keypad)
+	0x19, 0xE0,	#     Usage Minimum (0xE0)
+	0x29, 0xE7,	#     Usage Maximum (0xE7)
+	0x15, 0x00,	#     Logical Minimum (0)
+	0x25, 0x01,	#     Logical Maximum (1)
+	0x95, 0x08,	#     Report Count (8)
+	0x75, 0x01,	#     Report Size (1)
+	0x81, 0x02,	#     Input (Data,Var,Abs)
+	0x95, 0x01,	#     Report Count (1)
+	0x75, 0x08,	#     Report Size (8)
+	0x81, 0x03,	#     Input (Const,Var,Abs)
+	0x05, 0x07,	#   Usage Page (Kbrd/Keypad)
+	0x19, 0x00,	#     Usage Minimum (0x00)
+	0x29, 0x65,	#     Usage Maximum (0x65)
+	0x15, 0x00,	#     Logical Minimum (0)
+	0x25, 0x65,	#     Logical Maximum (101)
+	0x95, 0x06,	#     Report Count (6)
+	0x75, 0x08,	#     Report Size (8)
+	0x81, 0x00,	#     Input (Data,Array,Abs)
+	0x05, 0x08,	#   Usage Page (LEDs)
+	0x95, 0x05,	#     Report Count (5)
+	0x75, 0x01,	#     Report Size (1)
+	0x19, 0x01,	#     Usage Minimum (Num Lock)
+	0x29, 0x05,	#     Usage Maximum (Kana)
+	0x91, 0x02,	#     Output (Data,Var,Abs)
+	0x95, 0x01,	#     Report Count (1)
+	0x75, 0x03,	#     Report Size (3)
+	0x91, 0x03,	#     Output (Const,Var,Abs)
+	0xC0,		# End Collection
+
+	# 消费类控制
+	0x05, 0x0C,	# Usage Page (Consumer)
+	0x09, 0x01,	# Usage (Consumer Control)
+	0xA1, 0x01,	# Collection (Application)
+	0x85, 0x02,	#   Report ID (2)
+	0x15, 0x00,	#   Logical Minimum (0)
+	0x26, 0xFF, 0x03,	#   Logical Maximum (1023)
+	0x19, 0x00,	#   Usage Minimum (Unassigned)
+	0x2A, 0xFF, 0x03,	#   Usage Maximum (0x03FF)
+	0x75, 0x10,	#   Report Size (16)
+	0x95, 0x01,	#   Report Count (1)
+	0x81, 0x00,	#   Input (Data,Array,Abs)
+	0xC0,		# End Collection
+
+	# 鼠标
+	0x05, 0x01,	# Usage Page (Generic Desktop Ctrls)
+	0x09, 0x02,	# Usage (Mouse)
+	0xA1, 0x01,	# Collection (Application)
+	0x85, 0x03,	#   Report ID (3)
+	0x09, 0x01,	#   Usage (Pointer)
+	0xA1, 0x00,	#   Collection (Physical)
+	0x05, 0x09,	#     Usage Page (Button)
+	0x19, 0x01,	#     Usage Minimum (0x01)
+	0x29, 0x05,	#     Usage Maximum (0x05)
+	0x15, 0x00,	#     Logical Minimum (0)
+	0x25, 0x01,	#     Logical Maximum (1)
+	0x95, 0x05,	#     Report Count (5)
+	0x75, 0x01,	#     Report Size (1)
+	0x81, 0x02,	#     Input (Data,Var,Abs)
+	0x95, 0x01,	#     Report Count (1)
+	0x75, 0x03,	#     Report Size (3)
+	0x81, 0x03,	#     Input (Const,Var,Abs)
+	0x05, 0x01,	#     Usage Page (Generic Desktop Ctrls)
+	0x09, 0x30,	#     Usage (X)
+	0x09, 0x31,	#     Usage (Y)
+	0x09, 0x38,	#     Usage (Wheel)
+	0x15, 0x81,	#     Logical Minimum (-127)
+	0x25, 0x7F,	#     Logical Maximum (127)
+	0x75, 0x08,	#     Report Size (8)
+	0x95, 0x03,	#     Report Count (3)
+	0x81, 0x06,	#     Input (Data,Var,Rel)
+	0xC0,		#   End Collection
+	0xC0,		# End Collection
+]
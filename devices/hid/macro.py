@@ -0,0 +1,244 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+HID 宏录制和回放
+
+宏文件格式（小端）：
+	文件头：b'HM' + 版本号(1 字节)
+	记录：  间隔毫秒(2 字节), Report ID(1 字节), 数据长度(1 字节), report 数据
+	间隔超过 65535 毫秒时插入 Report ID 为 0、数据长度为 0 的等待记录
+
+回放时按块读取文件，不会将整个宏文件加载到内存中：
+
+	player = MacroPlayer(keyboard, 'macro.bin')
+	player.play()
+"""
+from micropython import const
+from struct import pack_into, unpack_from
+from time import ticks_ms, ticks_add, ticks_diff
+from errno import ENOMEM
+from devices.hid.timer import DeferredCall, DEFAULT_TIMER_ID
+
+
+MACRO_MAGIC   = b'HM'
+MACRO_VERSION = const(1)
+
+HEADER_SIZE = const(3)
+RECORD_SIZE = const(4) # 不含 report 数据
+MAX_DELTA   = const(0xFFFF)
+
+# 控制器缓冲区已满时重试的间隔（毫秒）
+RETRY_MS = const(10)
+
+# 主机挂起时重新检查的间隔（毫秒）
+SUSPEND_RETRY_MS = const(100)
+
+
+class MacroRecorder(object):
+	'''
+	宏录制
+
+		recorder = MacroRecorder('macro.bin')
+		recorder.record(1, key_data) # 按调用时间计算间隔
+		recorder.close()
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, path: str):
+		self.__file = open(path, 'wb')
+		self.__file.write(MACRO_MAGIC + bytes([MACRO_VERSION]))
+
+		self.__last   = None
+		self.__header = bytearray(RECORD_SIZE)
+
+	def __write_record(self, delta: int, report_id: int, data: bytes | bytearray):
+		while delta > MAX_DELTA:
+			pack_into('<HBB', self.__header, 0, MAX_DELTA, 0, 0)
+			self.__file.write(self.__header)
+			delta -= MAX_DELTA
+
+		pack_into('<HBB', self.__header, 0, delta, report_id, len(data))
+
+		self.__file.write(self.__header)
+		self.__file.write(data)
+
+	def record(self, report_id: int, data: bytes | bytearray, delta: int = None):
+		'''
+		写入一条记录，report_id 为 report map 中定义的 Report ID
+
+		delta 为距上一条记录的毫秒数，为空时使用两次调用之间的实际间隔
+		'''
+		now = ticks_ms()
+
+		if delta is None:
+			delta = 0 if self.__last is None else ticks_diff(now, self.__last)
+
+		self.__last = now
+		self.__write_record(delta, report_id, data)
+
+	def close(self):
+		self.__file.close()
+
+
+class MacroPlayer(object):
+	'''
+	宏回放
+
+	按记录中的间隔调用 device.send_report(report_id, data)，
+	使用绝对时间计算下一条记录的发送时刻，长时间回放不会累积误差；
+	控制器缓冲区已满（ENOMEM）时稍后重新发送同一条记录，
+	主机挂起期间暂停回放，恢复后从暂停处继续，记录之间的间隔保持不变
+
+	回放结束时调用 done_cb(error)，正常结束或调用 stop() 时 error 为 None，
+	文件最后一条记录不完整、或记录长度与设备的 report 不一致时为 ValueError，
+	未设置 done_cb 时直接抛出该异常
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, device, path: str, *, chunk_size: int = 512, timer_id: int = DEFAULT_TIMER_ID, done_cb: function = None):
+		'''
+		参数：
+		- device：HIDDevice 及其子类的实例，如 BLEKeyboard104、BLEVolumeKey
+		- path：宏文件路径
+		- chunk_size：每次从文件读取的字节数，需大于单条记录的长度
+		- timer_id：用于定时发送的定时器 ID，见 devices.hid.timer
+		- done_cb：回放结束时调用 done_cb(error)
+		'''
+		# 每个输入 report 预分配发送缓冲区，回放时逐字节复制，不产生内存分配
+		self.__reports = {report_id: bytearray(device.report_size(report_id)) for report_id in device.report_ids}
+
+		if chunk_size < RECORD_SIZE + max(len(report) for report in self.__reports.values()):
+			raise ValueError(f'chunk_size {chunk_size} is too small for the reports of this device')
+
+		self.__device  = device
+		self.__path    = path
+		self.__done_cb = done_cb
+		self.__file    = None
+
+		self.__buffer = bytearray(chunk_size)
+		self.__view   = memoryview(self.__buffer)
+		self.__start  = 0
+		self.__end    = 0
+
+		self.__target  = 0
+		self.__paused  = None # 主机挂起时的时刻
+		self.__playing = False
+
+		self.__step_call = DeferredCall(self.__step, timer_id)
+
+	def __fill(self, needed: int) -> bool:
+		'''确保缓冲区中至少有 needed 字节未处理的数据'''
+		remain = self.__end - self.__start
+
+		if remain >= needed:
+			return True
+
+		if remain:
+			self.__buffer[:remain] = self.__view[self.__start:self.__end]
+
+		self.__start = 0
+		self.__end   = remain + (self.__file.readinto(self.__view[remain:]) or 0)
+
+		return self.__end >= needed
+
+	def __step(self):
+		if not self.__playing:
+			return
+
+		if self.__device.suspended:
+			if self.__paused is None:
+				self.__paused = ticks_ms()
+
+			self.__step_call.schedule(SUSPEND_RETRY_MS)
+			return
+
+		if self.__paused is not None:
+			# 挂起的时间不计入记录间隔
+			self.__target = ticks_add(self.__target, ticks_diff(ticks_ms(), self.__paused))
+			self.__paused = None
+
+		while True:
+			if not self.__fill(RECORD_SIZE):
+				# 文件在两条记录之间结束才是正常结束
+				self.__finish(None if self.__start == self.__end else ValueError(f'{self.__path} ends with a truncated record'))
+				return
+
+			delta, report_id, length = unpack_from('<HBB', self.__buffer, self.__start)
+			target = ticks_add(self.__target, delta)
+			wait   = ticks_diff(target, ticks_ms())
+
+			if wait > 0:
+				self.__step_call.schedule(wait)
+				return
+
+			if not self.__fill(RECORD_SIZE + length):
+				self.__finish(ValueError(f'{self.__path} ends with a truncated record'))
+				return
+
+			if report_id:
+				report = self.__reports.get(report_id)
+
+				if report is None or len(report) != length:
+					self.__finish(ValueError(f'{self.__path}: record for report {report_id} ({length} bytes) does not match the device'))
+					return
+
+				buffer = self.__buffer
+				offset = self.__start + RECORD_SIZE
+
+				for index in range(length):
+					report[index] = buffer[offset + index]
+
+				try:
+					self.__device.send_report(report_id, report)
+				except OSError as e:
+					if e.errno != ENOMEM:
+						raise
+
+					self.__step_call.schedule(RETRY_MS)
+					return
+
+			self.__target = target
+			self.__start += RECORD_SIZE + length
+
+	def play(self):
+		if self.__playing:
+			return
+
+		self.__file = open(self.__path, 'rb')
+		self.__start = self.__end = 0
+
+		if not self.__fill(HEADER_SIZE) or self.__buffer[:2] != MACRO_MAGIC or self.__buffer[2] != MACRO_VERSION:
+			self.__file.close()
+			raise ValueError(f'{self.__path} is not a macro file')
+
+		self.__start   = HEADER_SIZE
+		self.__target  = ticks_ms()
+		self.__paused  = None
+		self.__playing = True
+
+		self.__step_call.schedule(1)
+
+	def __finish(self, error: ValueError):
+		if not self.__playing:
+			return
+
+		self.__playing = False
+
+		self.__step_call.cancel()
+
+		self.__file.close()
+
+		if self.__done_cb is not None:
+			self.__done_cb(error)
+		elif error is not None:
+			raise error
+
+	def stop(self):
+		self.__finish(None)
+
+	@property
+	def playing(self) -> bool:
+		return self.__playing
@@ -0,0 +1,172 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+import machine
+from micropython import const
+from errno import ENOMEM
+from profiles.hid import HIDDevice, USAGE_PAGE_BUTTON
+from devices.hid.timer import DeferredCall, DEFAULT_TIMER_ID
+from .reportmap import REPORT_MAP_DATA
+
+
+# 单个 report 中每个方向的最大位移
+MAX_DELTA = const(127)
+
+
+class MotionAccumulator(object):
+	'''
+	鼠标位移累加器
+
+	传感器可以任意频率（如 1kHz）调用 move() 累加位移，
+	每个连接间隔只发送一个 report，超出 -127~127 的部分保留到下一个 report，
+	位移不会丢失，也不会占满控制器的发送队列
+
+	鼠标 report 格式为 4 字节：按键, X, Y, 滚轮
+
+		accumulator = MotionAccumulator(device, report_id=1)
+		accumulator.move(3, -2)
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, device, report_id: int, timer_id: int = DEFAULT_TIMER_ID):
+		'''
+		参数：
+		- device：HIDDevice 及其子类的实例
+		- report_id：鼠标输入 report 的 Report ID
+		- timer_id：用于定时发送的定时器 ID，见 devices.hid.timer
+		'''
+		self.__device    = device
+		self.__report_id = report_id
+		self.__buffer    = device.report_buffer(report_id)
+
+		self.__x = self.__y = self.__wheel = 0
+		self.__dirty    = False # 按键状态已改变但尚未发送
+		self.__unsent   = 0     # 已按下但尚未发送的按键
+		self.__deferred = 0     # 推迟到下一个 report 松开的按键
+		self.__running  = False
+
+		self.__flush_call = DeferredCall(self.__flush, timer_id)
+
+	def __start(self):
+		if not self.__running:
+			self.__running = True
+			self.__flush_call.schedule(1)
+
+	def __flush(self):
+		device = self.__device
+
+		# move() 可能在中断中修改位移和 __running，以下读-改-写均需关闭中断
+		if not device.conn_handles:
+			# 未连接时丢弃累加的位移
+			state = machine.disable_irq()
+			self.__x = self.__y = self.__wheel = 0
+			self.__running = False
+			machine.enable_irq(state)
+
+			self.__buffer[0] &= ~self.__deferred
+			self.__dirty    = False
+			self.__unsent   = self.__deferred = 0
+			return
+
+		state = machine.disable_irq()
+		idle  = not (self.__x or self.__y or self.__wheel or self.__dirty)
+
+		if idle:
+			# 一个间隔内没有新的位移时才停止，下一次移动立即发送
+			self.__running = False
+
+		machine.enable_irq(state)
+
+		if idle:
+			return
+
+		x     = max(-MAX_DELTA, min(MAX_DELTA, self.__x))
+		y     = max(-MAX_DELTA, min(MAX_DELTA, self.__y))
+		wheel = max(-MAX_DELTA, min(MAX_DELTA, self.__wheel))
+
+		buffer = self.__buffer
+		buffer[1] = x & 0xFF
+		buffer[2] = y & 0xFF
+		buffer[3] = wheel & 0xFF
+
+		try:
+			device.send_report(self.__report_id)
+		except OSError as e:
+			if e.errno != ENOMEM:
+				raise
+		else:
+			state = machine.disable_irq()
+			self.__x     -= x
+			self.__y     -= y
+			self.__wheel -= wheel
+			machine.enable_irq(state)
+
+			self.__unsent = 0
+
+			# 按下后在同一间隔内松开的按键，在下一个 report 中松开，保证主机收到点击
+			self.__dirty = bool(self.__deferred)
+			buffer[0] &= ~self.__deferred
+			self.__deferred = 0
+
+		# 发送后至少等待一个连接间隔，期间的位移合并到下一个 report
+		self.__flush_call.schedule(device.connection_interval)
+
+	def move(self, x: int = 0, y: int = 0, wheel: int = 0):
+		'''累加相对位移，可在中断中调用，不产生内存分配'''
+		self.__x     += x
+		self.__y     += y
+		self.__wheel += wheel
+
+		self.__start()
+
+	def press(self, buttons: int):
+		self.__buffer[0] |= buttons
+		self.__unsent |= buttons
+		self.__dirty = True
+		self.__start()
+
+	def release(self, buttons: int = 0x1F):
+		deferred = buttons & self.__unsent
+
+		self.__deferred  |= deferred
+		self.__buffer[0] &= ~(buttons & ~deferred)
+		self.__dirty = True
+		self.__start()
+
+	@property
+	def pending(self) -> tuple:
+		'''尚未发送的位移 (x, y, wheel)'''
+		return self.__x, self.__y, self.__wheel
+
+
+class BLEMouse(HIDDevice):
+	'''
+	鼠标，位移经 MotionAccumulator 合并后每个连接间隔发送一次
+	'''
+	LEFT   = 0x01
+	RIGHT  = 0x02
+	MIDDLE = 0x04
+
+	def __init__(self, device_name: str = 'MP_MOUSE'):
+		super().__init__(device_name, REPORT_MAP_DATA,
+			appearance=962, # (0x00f, 0x02)
+			device_information={'model_number': 'MP_MOUSE'},
+			input_sizes={USAGE_PAGE_BUTTON: 4},
+		)
+
+		self.__accumulator = MotionAccumulator(self, self.report_ids[0])
+
+	def move(self, x: int = 0, y: int = 0, wheel: int = 0):
+		self.__accumulator.move(x, y, wheel)
+
+	def press(self, buttons: int):
+		self.__accumulator.press(buttons)
+
+	def release(self, buttons: int = 0x1F):
+		self.__accumulator.release(buttons)
+
+	def click(self, buttons: int = 0x01):
+		self.__accumulator.press(buttons)
+		self.__accumulator.release(buttons)
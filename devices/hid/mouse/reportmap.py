@@ -0,0 +1,37 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+'''
+Report ID 1：鼠标，4 字节输入（按键, X, Y, 滚轮）
+'''
+REPORT_MAP_DATA = [
+	0x05, 0x01,	# Usage Page (Generic Desktop Ctrls)
+	0x09, 0x02,	# Usage (Mouse)
+	0xA1, 0x01,	# Collection (Application)
+	0x85, 0x01,	#   Report ID (1)
+	0x09, 0x01,	#   Usage (Pointer)
+	0xA1, 0x00,	#   Collection (Physical)
+	0x05, 0x09,	#     Usage Page (Button)
+	0x19, 0x01,	#     Usage Minimum (0x01)
+	0x29, 0x05,	#     Usage Maximum (0x05)
+	0x15, 0x00,	#     Logical Minimum (0)
+	0x25, 0x01,	#     Logical Maximum (1)
+	0x95, 0x05,	#     Report Count (5)
+	0x75, 0x01,	#     Report Size (1)
+	0x81, 0x02,	#     Input (Data,Var,Abs)
+	0x95, 0x01,	#     Report Count (1)
+	0x75, 0x03,	#     Report Size (3)
+	0x81, 0x03,	#     Input (Const,Var,Abs)
+	0x05, 0x01,	#     Usage Page (Generic Desktop Ctrls)
+	0x09, 0x30,	#     Usage (X)
+	0x09, 0x31,	#     Usage (Y)
+	0x09, 0x38,	#     Usage (Wheel)
+	0x15, 0x81,	#     Logical Minimum (-127)
+	0x25, 0x7F,	#     Logical Maximum (127)
+	0x75, 0x08,	#     Report Size (8)
+	0x95, 0x03,	#     Report Count (3)
+	0x81, 0x06,	#     Input (Data,Var,Rel)
+	0xC0,		#   End Collection
+	0xC0,		# End Collection
+]
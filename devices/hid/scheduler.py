@@ -0,0 +1,154 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+from micropython import const
+from errno import ENOMEM
+from devices.hid.timer import DeferredCall, DEFAULT_TIMER_ID
+
+
+# 未连接主机或主机挂起时重新检查的间隔（毫秒）
+IDLE_RETRY_MS = const(100)
+
+
+class KeystrokeScheduler(object):
+	'''
+	按键事件队列
+
+	按下/松开事件按顺序放入环形队列，每个连接间隔发送一次 report，
+	同一间隔内互不冲突的状态变化合并为一个 report，
+	同一按键在一个间隔内的按下和松开分别发送，保证主机能收到每一次按键；
+	控制器缓冲区已满（ENOMEM）时保留当前状态，在下一个间隔重新发送
+
+		scheduler = KeystrokeScheduler(keyboard)
+		scheduler.tap(0x0B) # h
+		scheduler.tap(0x0C) # i
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, keyboard, report_id: int = 0, size: int = 128, timer_id: int = DEFAULT_TIMER_ID):
+		'''
+		参数：
+		- keyboard：HIDKeyboard 及其子类的实例
+		- report_id：使用的输入 report 序号
+		- size：队列可容纳的事件数量
+		- timer_id：用于定时发送的定时器 ID，见 devices.hid.timer
+		'''
+		self.__keyboard  = keyboard
+		self.__report_id = report_id
+		self.__size      = size
+
+		# 每个事件 2 字节：键值, 按下(1)/松开(0)
+		self.__events = bytearray(size * 2)
+		self.__head   = 0 # 写入位置
+		self.__tail   = 0 # 读取位置
+		self.__count  = 0
+
+		# 当前批次中已修改过的键值，每个 bit 对应一个键值
+		self.__touched = bytearray(32)
+		self.__pending = False # 缓冲区中有尚未成功发送的状态
+		self.__running = False
+
+		self.__flush_call = DeferredCall(self.__flush, timer_id)
+
+	def __push(self, keycode: int, pressed: bool) -> bool:
+		if self.__count == self.__size:
+			return False
+
+		self.__events[self.__head] = keycode
+		self.__events[self.__head + 1] = 1 if pressed else 0
+		self.__head = (self.__head + 2) % len(self.__events)
+		self.__count += 1
+
+		if not self.__running:
+			self.__running = True
+			self.__flush_call.schedule(1)
+
+		return True
+
+	def __flush(self):
+		keyboard = self.__keyboard
+
+		# 主机挂起期间保留队列，恢复后继续发送
+		if not keyboard.conn_handles or keyboard.suspended:
+			self.__flush_call.schedule(IDLE_RETRY_MS)
+			return
+
+		events  = self.__events
+		touched = self.__touched
+
+		# 依次应用事件，直到遇到本批次中已修改过的键值
+		while self.__count:
+			keycode = events[self.__tail]
+			mask    = 1 << (keycode & 0x07)
+
+			if touched[keycode >> 3] & mask:
+				break
+
+			touched[keycode >> 3] |= mask
+
+			if keyboard.set_key(keycode, events[self.__tail + 1], self.__report_id):
+				self.__pending = True
+
+			self.__tail = (self.__tail + 2) % len(events)
+			self.__count -= 1
+
+		if self.__pending:
+			try:
+				keyboard.send(self.__report_id)
+			except OSError as e:
+				if e.errno != ENOMEM:
+					raise
+
+				# 保留已应用的状态和冲突记录，下一个间隔重新发送
+				self.__flush_call.schedule(keyboard.connection_interval)
+				return
+
+			self.__pending = False
+
+		for index in range(len(touched)):
+			touched[index] = 0
+
+		if self.__count:
+			self.__flush_call.schedule(keyboard.connection_interval)
+		else:
+			self.__running = False
+
+	def press(self, keycode: int) -> bool:
+		'''按下按键，队列已满时返回 False'''
+		return self.__push(keycode, True)
+
+	def release(self, keycode: int) -> bool:
+		return self.__push(keycode, False)
+
+	def tap(self, keycode: int, modifier: int = 0) -> bool:
+		'''
+		按下并松开按键，modifier 为修饰键键值（0xE0~0xE7），如 0xE1 表示 Left Shift
+
+		队列剩余空间不足时不放入任何事件并返回 False
+		'''
+		needed = 4 if modifier else 2
+
+		if self.__size - self.__count < needed:
+			return False
+
+		if modifier:
+			self.__push(modifier, True)
+
+		self.__push(keycode, True)
+		self.__push(keycode, False)
+
+		if modifier:
+			self.__push(modifier, False)
+
+		return True
+
+	@property
+	def pending(self) -> int:
+		'''队列中尚未发送的事件数量'''
+		return self.__count
+
+	@property
+	def busy(self) -> bool:
+		return self.__running
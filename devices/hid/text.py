@@ -0,0 +1,116 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+字符串输入，根据键盘布局将字符转换为 (修饰键, 键值) 并放入按键事件队列：
+
+	from devices.hid.scheduler import KeystrokeScheduler
+	from devices.hid.text import type_text, LAYOUT_DE
+
+	scheduler = KeystrokeScheduler(keyboard)
+	type_text(scheduler, 'Hello, World!\\n')
+	type_text(scheduler, 'Grüße', layout=LAYOUT_DE)
+"""
+from micropython import const
+
+
+MOD_NONE  = const(0x00)
+MOD_SHIFT = const(0xE1) # Left Shift
+MOD_ALTGR = const(0xE6) # Right Alt
+
+# 布局字符串按键值 0x04 ~ 0x38 的顺序排列，\x00 表示该按键不输出字符
+USAGE_FIRST = const(0x04)
+USAGE_NON_US_BACKSLASH = const(0x64)
+
+
+class KeyboardLayout(object):
+	'''
+	键盘布局
+
+	创建时将布局字符串预先转换为查找表：
+	- ASCII 字符使用 256 字节的表，每个字符占 2 字节：修饰键, 键值
+	- 其它 Unicode 字符使用字典：字符编码 -> (修饰键 << 8) | 键值
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, normal: str, shifted: str, altgr: dict = None, non_us: str = ''):
+		'''
+		参数：
+		- normal：不按修饰键时键值 0x04 ~ 0x38 输出的字符
+		- shifted：按下 Shift 时输出的字符
+		- altgr：按下 AltGr 时输出的字符，{字符: 键值}
+		- non_us：ISO 键盘左 Shift 右侧按键（0x64）在不按/按下 Shift 时输出的字符
+		'''
+		self.__ascii   = bytearray(256)
+		self.__unicode = {}
+
+		# 后写入的映射优先，同一字符优先使用修饰键更少的按键
+		for char, keycode in (altgr or {}).items():
+			self.__add(char, MOD_ALTGR, keycode)
+
+		for modifier, chars, extra in ((MOD_SHIFT, shifted, non_us[1:]), (MOD_NONE, normal, non_us[:1])):
+			for offset, char in enumerate(chars):
+				self.__add(char, modifier, USAGE_FIRST + offset)
+
+			for char in extra:
+				self.__add(char, modifier, USAGE_NON_US_BACKSLASH)
+
+	def __add(self, char: str, modifier: int, keycode: int):
+		code = ord(char)
+
+		if code == 0:
+			return
+
+		if code < 128:
+			self.__ascii[code * 2] = modifier
+			self.__ascii[code * 2 + 1] = keycode
+		else:
+			self.__unicode[code] = (modifier << 8) | keycode
+
+	def lookup(self, char: str) -> int:
+		'''返回 (修饰键 << 8) | 键值，布局中不存在的字符返回 0'''
+		code = ord(char)
+
+		if code < 128:
+			return (self.__ascii[code * 2] << 8) | self.__ascii[code * 2 + 1]
+
+		return self.__unicode.get(code, 0)
+
+
+LAYOUT_US = KeyboardLayout(
+	'abcdefghijklmnopqrstuvwxyz1234567890\n\x1b\x08\t -=[]\\\x00;\'`,./',
+	'ABCDEFGHIJKLMNOPQRSTUVWXYZ!@#$%^&*()\x00\x00\x00\x00\x00_+{}|\x00:"~<>?',
+)
+
+# 德语布局中的 ´ 和 ^ 为死键，不直接输出字符
+LAYOUT_DE = KeyboardLayout(
+	'abcdefghijklmnopqrstuvwxzy1234567890\n\x1b\x08\t ß\x00ü+\x00#öä\x00,.-',
+	'ABCDEFGHIJKLMNOPQRSTUVWXZY!"§$%&/()=\x00\x00\x00\x00\x00?\x00Ü*\x00\'ÖÄ°;:_',
+	altgr={
+		'@': 0x14, '€': 0x08, 'µ': 0x10,
+		'²': 0x1F, '³': 0x20, '{': 0x24, '[': 0x25, ']': 0x26, '}': 0x27,
+		'\\': 0x2D, '~': 0x30, '|': 0x64,
+	},
+	non_us='<>',
+)
+
+
+def type_text(scheduler, text: str, layout: KeyboardLayout = LAYOUT_US, start: int = 0) -> int:
+	'''
+	将 text[start:] 中的字符依次放入按键事件队列，跳过布局中不存在的字符
+
+	返回下一个待输入字符的位置，队列已满时小于 len(text)，
+	可在队列空闲后从该位置继续调用
+	'''
+	index = start
+
+	while index < len(text):
+		value = layout.lookup(text[index])
+
+		if value and not scheduler.tap(value & 0xFF, value >> 8):
+			break
+
+		index += 1
+
+	return index
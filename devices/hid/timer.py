@@ -0,0 +1,144 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+延时回调，按键事件队列、宏回放、鼠标位移累加器和电量监测共用一个定时器：
+
+	from devices.hid.timer import DeferredCall
+
+	call = DeferredCall(callback)
+	call.schedule(30) # 30 毫秒后在中断外调用 callback()
+
+开发板不支持 machine.Timer 时，需要在主循环中调用 run_pending() 执行到期的回调
+"""
+import machine
+import micropython
+from micropython import const
+from time import ticks_ms, ticks_add, ticks_diff
+
+
+# 默认使用的定时器 ID，ESP32-C3 只有 0 和 1 两个硬件定时器
+DEFAULT_TIMER_ID = const(0)
+
+__queues = {} # timer_id: TimerQueue
+
+
+class TimerQueue(object):
+	'''
+	使用一个定时器按到期时间执行多个回调，每个定时器 ID 只有一个实例，通过 get_queue() 获取
+
+	定时器总是按最早的到期时间设置，到期后通过 micropython.schedule() 在中断外执行回调，
+	避免在中断中调用蓝牙协议栈；设置到期时间不产生内存分配，可在中断中调用
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, timer_id: int):
+		self.__timer = machine.Timer(timer_id) if hasattr(machine, 'Timer') else None
+
+		# 按注册顺序保存，下标即 register() 返回的序号
+		self.__callbacks = []
+		self.__deadlines = []
+		self.__pending   = bytearray()
+		self.__running   = False # 正在执行回调，结束后统一设置定时器
+
+		# 预先创建绑定方法，设置定时器时不产生内存分配
+		self.__run_cb   = self.run_pending
+		self.__timer_cb = self.__on_timer
+
+	def __arm(self):
+		if self.__timer is None or self.__running:
+			return
+
+		now  = ticks_ms()
+		wait = None
+
+		for slot in range(len(self.__pending)):
+			if self.__pending[slot]:
+				remain = ticks_diff(self.__deadlines[slot], now)
+
+				if wait is None or remain < wait:
+					wait = remain
+
+		if wait is None:
+			self.__timer.deinit()
+		else:
+			self.__timer.init(mode=machine.Timer.ONE_SHOT, period=max(wait, 1), callback=self.__timer_cb)
+
+	def __on_timer(self, _timer):
+		micropython.schedule(self.__run_cb, None)
+
+	def register(self, callback: function) -> int:
+		'''注册回调，返回用于 schedule() 和 cancel() 的序号'''
+		self.__callbacks.append(callback)
+		self.__deadlines.append(0)
+		self.__pending.append(0)
+
+		return len(self.__callbacks) - 1
+
+	def schedule(self, slot: int, delay_ms: int):
+		'''delay_ms 毫秒后调用回调，尚未执行时以最后一次设置为准'''
+		self.__deadlines[slot] = ticks_add(ticks_ms(), delay_ms)
+		self.__pending[slot]   = 1
+
+		self.__arm()
+
+	def cancel(self, slot: int):
+		self.__pending[slot] = 0
+		self.__arm()
+
+	def is_pending(self, slot: int) -> bool:
+		return bool(self.__pending[slot])
+
+	def run_pending(self, _arg=None):
+		'''执行已到期的回调，然后按下一个到期时间设置定时器'''
+		self.__running = True
+
+		try:
+			for slot in range(len(self.__pending)):
+				if self.__pending[slot] and ticks_diff(self.__deadlines[slot], ticks_ms()) <= 0:
+					self.__pending[slot] = 0
+					self.__callbacks[slot]()
+		finally:
+			# 回调抛出异常时也要重新设置定时器，否则共用该定时器的其它回调将不再执行
+			self.__running = False
+			self.__arm()
+
+
+def get_queue(timer_id: int = DEFAULT_TIMER_ID) -> TimerQueue:
+	'''获取定时器 ID 对应的 TimerQueue，使用同一 ID 的模块共用一个定时器'''
+	queue = __queues.get(timer_id)
+
+	if queue is None:
+		queue = __queues[timer_id] = TimerQueue(timer_id)
+
+	return queue
+
+def run_pending():
+	'''执行全部定时器中已到期的回调，用于不支持 machine.Timer 的开发板'''
+	for queue in __queues.values():
+		queue.run_pending()
+
+
+class DeferredCall(object):
+	'''
+	延时调用 callback()，同一实例同时只有一个到期时间
+
+	使用同一 timer_id 的实例共用一个定时器，不会互相占用
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self, callback: function, timer_id: int = DEFAULT_TIMER_ID):
+		self.__queue = get_queue(timer_id)
+		self.__slot  = self.__queue.register(callback)
+
+	def schedule(self, delay_ms: int):
+		self.__queue.schedule(self.__slot, delay_ms)
+
+	def cancel(self):
+		self.__queue.cancel(self.__slot)
+
+	@property
+	def pending(self) -> bool:
+		return self.__queue.is_pending(self.__slot)
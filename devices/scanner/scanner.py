@@ -6,6 +6,7 @@ import bluetooth
 from bluetooth import UUID
 from machine import Timer
 from ble import *
+from ble.flat_consts import *
 
 
 class Device(object):
@@ -170,18 +171,15 @@ class Scanner(object):
 		self.__discovering_characteristic = False
 		self.__discovering_descriptor     = False
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			mtu=256,
+		)
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.SCAN_RESULT:
+		if event == IRQ_SCAN_RESULT:
 			_, addr, adv_type, _, adv_data = data
 
 			if adv_type == ADVType.SCAN_RSP:
@@ -193,7 +191,7 @@ class Scanner(object):
 				if self.__scan_timeout == 0:
 					self.__ble.gap_scan(None)
 
-		elif event == IRQ.SCAN_DONE:
+		elif event == IRQ_SCAN_DONE:
 			if self.__scan_done_cb:
 				self.__scan_done_cb(self.__factory.devices())
 
@@ -205,7 +203,7 @@ class Scanner(object):
 				callback=self.__discover_devices_timer_cb
 			)
 
-		elif event == IRQ.PERIPHERAL_CONNECT:
+		elif event == IRQ_PERIPHERAL_CONNECT:
 			conn_handle, _, addr = data
 			device = self.__factory.find(addr=addr)
 
@@ -222,7 +220,7 @@ class Scanner(object):
 				printf('Discovering services')
 				self.__ble.gattc_discover_services(conn_handle)
 
-		elif event == IRQ.PERIPHERAL_DISCONNECT:
+		elif event == IRQ_PERIPHERAL_DISCONNECT:
 			_, _, addr = data
 			device = self.__factory.find(addr=addr)
 
@@ -230,13 +228,13 @@ class Scanner(object):
 				printf(f'[{device.name}] Disconnected')
 				# self.__factory.remove(data)
 
-		elif event == IRQ.GATTC_SERVICE_RESULT:
+		elif event == IRQ_GATTC_SERVICE_RESULT:
 			_, start_handle, end_handle, uuid = data
 
 			self.__current_device.profile['services'].update(
 				{str(uuid): {'start_handle': start_handle, 'end_handle': end_handle, 'characteristics': {}}})
 
-		elif event == IRQ.GATTC_SERVICE_DONE:
+		elif event == IRQ_GATTC_SERVICE_DONE:
 			if self.__service_done_cb:
 				self.__service_done_cb(self.__current_device)
 
@@ -245,18 +243,18 @@ class Scanner(object):
 
 			printf('Discovering characteristics')
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_RESULT:
+		elif event == IRQ_GATTC_CHARACTERISTIC_RESULT:
 			_, end_handle, value_handle, properties, uuid = data
 
 			self.__current_device.profile['services'][self.__current_service]['characteristics'].update(
 				{str(uuid): {'end_handle': end_handle, 'value_handle': value_handle, 'properties': properties, 'descriptors': {}}})
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_DONE:
+		elif event == IRQ_GATTC_CHARACTERISTIC_DONE:
 			self.__discovering_characteristic = True
 
 			printf('Discovering descriptors')
 
-		elif event == IRQ.GATTC_DESCRIPTOR_RESULT:
+		elif event == IRQ_GATTC_DESCRIPTOR_RESULT:
 			_, desc_handle, uuid = data
 
 			# if UUID(0x2900) <= uuid <= UUID(0x2911):
@@ -265,7 +263,7 @@ class Scanner(object):
 				self.__current_device.profile['services'][self.__current_service]['characteristics'][self.__current_characteristic]['descriptors'].update(
 					{str(uuid): {'desc_handle': desc_handle}})
 
-		elif event == IRQ.GATTC_DESCRIPTOR_DONE:
+		elif event == IRQ_GATTC_DESCRIPTOR_DONE:
 			self.__discovering_descriptor = True
 
 	def __get_devices(self):
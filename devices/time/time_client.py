@@ -4,7 +4,8 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 import bluetooth
 from struct import unpack
-from ble import BLETools, ADVType, IRQ, printf
+from ble import BLETools, ADVType, printf, make_uuid
+from ble.flat_consts import *
 from profiles.time import TimeValues as Values
 
 
@@ -49,30 +50,27 @@ class TimeClient(object):
 		self.__request_current_time_cb   = request_current_time_cb
 		self.__request_localtime_info_cb = request_localtime_info_cb
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			mtu=256,
+		)
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.SCAN_RESULT:
+		if event == IRQ_SCAN_RESULT:
 			if self.__check(data):
 				self.__target = Device(data)
 				self.__ble.gap_scan(None)
 
-		elif event == IRQ.SCAN_DONE:
+		elif event == IRQ_SCAN_DONE:
 			printf(f'Scan Completed, Time Server{"" if self.__target else " not"} found')
 
 			if self.__target:
 				printf(f'Connecting to [{self.__target.name}]')
 				self.__ble.gap_connect(self.__target.addr_type, self.__target.addr)
 
-		elif event == IRQ.PERIPHERAL_CONNECT:
+		elif event == IRQ_PERIPHERAL_CONNECT:
 			conn_handle, _, _ = data
 
 			if self.__target:
@@ -81,34 +79,34 @@ class TimeClient(object):
 				self.__target.conn_handle = conn_handle
 				self.__ble.gattc_discover_services(conn_handle)
 
-		elif event == IRQ.PERIPHERAL_DISCONNECT:
+		elif event == IRQ_PERIPHERAL_DISCONNECT:
 			if self.__target:
 				printf(f'[{self.__target.name}] Disconnected')
 				self.__target.conn_handle = None
 
-		elif event == IRQ.GATTC_SERVICE_RESULT:
+		elif event == IRQ_GATTC_SERVICE_RESULT:
 			_, start_handle, end_handle, uuid = data
 
-			if uuid == bluetooth.UUID(Values.UUIDS.CURRENT_TIME_SERVICE):
+			if uuid == make_uuid(Values.UUIDS.CURRENT_TIME_SERVICE):
 				self.__target.start_handle = start_handle
 				self.__target.end_handle   = end_handle
 
-		elif event == IRQ.GATTC_SERVICE_DONE:
+		elif event == IRQ_GATTC_SERVICE_DONE:
 			conn_handle, _ = data
 
 			if self.__target.start_handle and self.__target.end_handle:
 				self.__ble.gattc_discover_characteristics(conn_handle,
 					self.__target.start_handle, self.__target.end_handle)
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_RESULT:
+		elif event == IRQ_GATTC_CHARACTERISTIC_RESULT:
 			_, _, value_handle, _, uuid = data
 
-			if   uuid == bluetooth.UUID(Values.UUIDS.CURRENT_TIME):
+			if   uuid == make_uuid(Values.UUIDS.CURRENT_TIME):
 				self.__target.handle_current_time = value_handle
-			elif uuid == bluetooth.UUID(Values.UUIDS.LOCAL_TIME_INFORMATION):
+			elif uuid == make_uuid(Values.UUIDS.LOCAL_TIME_INFORMATION):
 				self.__target.handle_localtime_information = value_handle
 
-		elif event == IRQ.GATTC_CHARACTERISTIC_DONE:
+		elif event == IRQ_GATTC_CHARACTERISTIC_DONE:
 			if self.__target.handle_current_time and\
 			   self.__target.handle_localtime_information:
 				self.request_localtime_info()
@@ -117,7 +115,7 @@ class TimeClient(object):
 				if self.__found_server_cb:
 					self.__found_server_cb()
 
-		elif event == IRQ.GATTC_READ_RESULT:
+		elif event == IRQ_GATTC_READ_RESULT:
 			_, value_handle, char_data = data
 
 			if value_handle == self.__target.handle_current_time:
@@ -130,7 +128,7 @@ class TimeClient(object):
 				self.__time_zone  = self.__localtime_info[0] / 4
 				self.__dst_offset = self.__localtime_info[1]
 
-		elif event == IRQ.GATTC_READ_DONE:
+		elif event == IRQ_GATTC_READ_DONE:
 			if self.__current_time:
 				if self.__request_current_time_cb:
 					self.__request_current_time_cb(self.__current_datetime, self.__fractions256, self.__adjust_reason)
@@ -141,11 +139,11 @@ class TimeClient(object):
 					self.__request_localtime_info_cb(self.__time_zone, self.__dst_offset)
 					self.__localtime_info = None
 
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			pass
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
 		else:
 			printf(f'event: {event}, data: {data}')
@@ -154,7 +152,7 @@ class TimeClient(object):
 		_, _, adv_type, rssi, adv_data = data
 
 		return (BLETools.decode_name(adv_data) == self.__target_name or\
-			   bluetooth.UUID(Values.UUIDS.CURRENT_TIME_SERVICE) in BLETools.decode_services(adv_data)) and\
+			   make_uuid(Values.UUIDS.CURRENT_TIME_SERVICE) in BLETools.decode_services(adv_data)) and\
 			   adv_type in (ADVType.IND, ADVType.DIRECT_IND, ADVType.SCAN_RSP) and rssi >= -80
 
 
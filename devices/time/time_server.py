@@ -4,7 +4,9 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 import bluetooth
 from ble import *
-from profiles.time import TimeProfile, TimeValues
+from ble.flat_consts import *
+from profiles.time import TimeValues
+from profiles.tables import time as time_table
 
 
 class TimeServer(object):
@@ -16,21 +18,18 @@ class TimeServer(object):
 		self.__ble          = bluetooth.BLE()
 		self.__conn_handles = set()
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(addr_mode=AddressMode.RPA, mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			addr_mode=AddressMode.RPA, mtu=256,
+		)
 
-		time_profile = TimeProfile()
+		time_profile = CompiledProfile(time_table)
 
 		self.__time_values = TimeValues()
 
-		self.__register_services(time_profile.get_services())
+		self.__register_services(time_profile.register(self.__ble))
 		self.__setup_time_values()
 
 		adv_payload = BLETools.generate_advertising_payload(
@@ -49,13 +48,16 @@ class TimeServer(object):
 
 		self.__advertise(adv_payload, resp_payload)
 
-	def __register_services(self, services: list):
-		(
-			(
-				self.__handle_current_time,
-				self.__handle_local_time_information,
-			),
-		) = self.__ble.gatts_register_services(services)
+	def __register_services(self, handles: HandleMap):
+		self.__handles = handles
+
+		self.__handle_current_time           = handles['CurrentTime']
+		self.__handle_local_time_information = handles['LocalTimeInformation']
+
+		handles.on_read(self.__handle_current_time, self.__on_read_current_time)
+
+		# 本地时间信息只在时区或夏令时变化后写入
+		self.__time_values.current_time_service.bind(local_time_information=self.__handle_local_time_information)
 
 		printf('Services Registered')
 
@@ -70,7 +72,7 @@ class TimeServer(object):
 		printf('Advertising Payload...')
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.CENTRAL_CONNECT:
+		if event == IRQ_CENTRAL_CONNECT:
 			conn_handle, _, addr, = data
 
 			self.__conn_handles.add(conn_handle)
@@ -78,7 +80,7 @@ class TimeServer(object):
 
 			printf(f'[{BLETools.decode_mac(addr)}] Connected [Handle: {conn_handle}]')
 
-		elif event == IRQ.CENTRAL_DISCONNECT:
+		elif event == IRQ_CENTRAL_DISCONNECT:
 			conn_handle, _, addr, = data
 
 			if conn_handle in self.__conn_handles:
@@ -88,32 +90,27 @@ class TimeServer(object):
 
 			self.__advertise()
 
-		elif event == IRQ.GATTS_READ_REQUEST:
-			_, attr_handle = data
+		elif event == IRQ_GATTS_READ_REQUEST:
+			return self.__handles.dispatch_read(*data)
 
-			if attr_handle == self.__handle_current_time:
-				self.__time_values.current_time_service.fractions256 = 0
-				self.__ble.gatts_write(attr_handle,
-					self.__time_values.current_time_service.current_time)
-			elif attr_handle == self.__handle_local_time_information:
-				self.__ble.gatts_write(attr_handle,
-					self.__time_values.current_time_service.local_time_information)
-
-			return GATTSErrorCode.NO_ERROR
-
-		elif event == IRQ.GATTC_INDICATE:
+		elif event == IRQ_GATTC_INDICATE:
 			conn_handle, value_handle, data = data
 			printf(f'GATTC Indicate [Handle: {conn_handle}, Value_Handle: {value_handle}, Data: {bytes(data)}]')
 
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			pass
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
 		else:
 			printf(f'Uncaught IRQ Event: {event}, Data: {data}')
 
+	def __on_read_current_time(self, conn_handle, attr_handle):
+		self.__time_values.current_time_service.fractions256 = 0
+		self.__ble.gatts_write(attr_handle,
+			self.__time_values.current_time_service.current_time)
+
 	def __setup_time_values(self):
 		self.__time_values.current_time_service.adjust_reason = self.__time_values.Consts.AdjustReason.MANUAL
 		self.__time_values.current_time_service.fractions256  = 0
@@ -122,8 +119,7 @@ class TimeServer(object):
 
 		self.__ble.gatts_write(self.__handle_current_time,
 			self.__time_values.current_time_service.current_time)
-		self.__ble.gatts_write(self.__handle_local_time_information,
-			self.__time_values.current_time_service.local_time_information)
+		self.__time_values.current_time_service.flush(self.__ble.gatts_write)
 
 
 	# region Properties
@@ -150,6 +146,7 @@ class TimeServer(object):
 	@time_zone.setter
 	def time_zone(self, value: int):
 		self.__time_values.current_time_service.time_zone = value
+		self.__time_values.current_time_service.flush(self.__ble.gatts_write)
 
 	@property
 	def dst_offset(self) -> int:
@@ -158,4 +155,5 @@ class TimeServer(object):
 	@dst_offset.setter
 	def dst_offset(self, value: int):
 		self.__time_values.current_time_service.dst_offset = value
+		self.__time_values.current_time_service.flush(self.__ble.gatts_write)
 	# endregion
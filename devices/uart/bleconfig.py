@@ -4,6 +4,7 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 import bluetooth
 from ble import *
+from ble.flat_consts import *
 from profiles.uart import UARTProfile
 
 
@@ -26,15 +27,12 @@ class BLEConfig(object):
 		self.__ssid     = ''
 		self.__password = ''
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(addr_mode=AddressMode.RPA, mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			addr_mode=AddressMode.RPA, mtu=256,
+		)
 
 		uart_profile = UARTProfile()
 
@@ -77,14 +75,14 @@ class BLEConfig(object):
 		printf('Advertising Payload...')
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.CENTRAL_CONNECT:
+		if event == IRQ_CENTRAL_CONNECT:
 			conn_handle, _, addr, = data # _: addr_type
 
 			self.__conn_handles.add(conn_handle)
 			self.__ble.gap_advertise(None)
 
 			printf(f'[{BLETools.decode_mac(addr)}] Connected [Handle: {conn_handle}]')
-		elif event == IRQ.CENTRAL_DISCONNECT:
+		elif event == IRQ_CENTRAL_DISCONNECT:
 			conn_handle, _, addr, = data # _: addr_type
 
 			if conn_handle in self.__conn_handles:
@@ -94,7 +92,7 @@ class BLEConfig(object):
 
 			if not self.success():
 				self.__advertise()
-		elif event == IRQ.GATTS_WRITE:
+		elif event == IRQ_GATTS_WRITE:
 			conn_handle, attr_handle = data
 
 			# printf(f'GATTS Write [Handle: {conn_handle}, Attr_Handle: {attr_handle}]')
@@ -109,17 +107,17 @@ class BLEConfig(object):
 
 				if self.__rx_received_cb:
 					self.__rx_received_cb(data)
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			conn_handle, interval, latency, supervision_timeout, status = data
 
 			printf(f'Connection Update [Handle: {conn_handle}, Interval: {interval}, Latency: {latency}, Supervision_Timeout: {supervision_timeout}, Status: {status}]')
-		elif event == IRQ.GATTC_INDICATE:
+		elif event == IRQ_GATTC_INDICATE:
 			conn_handle, value_handle, data = data
 
 			printf(f'GATTC Indicate [Handle: {conn_handle}, Value_Handle: {value_handle}, Data: {bytes(data)}]')
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
 		else:
 			printf(f'Uncaught IRQ Event: {event}, Data: {data}')
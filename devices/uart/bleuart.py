@@ -4,6 +4,7 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 import bluetooth
 from ble import *
+from ble.flat_consts import *
 from profiles.uart import UARTProfile
 
 
@@ -20,15 +21,12 @@ class BLEUART(object):
 
 		appearance = 384 # (0x006, 0x00)
 
-		self.__ble.config(gap_name=device_name)
 		self.__ble.irq(self.__irq_callback)
 
-		self.__ble.active(False)
-		printf('Activating BLE...')
-		self.__ble.active(True)
-		printf(f'BLE Activated [{BLETools.decode_mac(self.__ble.config('mac')[1])}]')
-
-		self.__ble.config(addr_mode=AddressMode.RPA, mtu=256)
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			addr_mode=AddressMode.RPA, mtu=256,
+		)
 
 		uart_profile = UARTProfile()
 
@@ -74,7 +72,7 @@ class BLEUART(object):
 		printf('Advertising Payload...')
 
 	def __irq_callback(self, event, data):
-		if event == IRQ.CENTRAL_CONNECT:
+		if event == IRQ_CENTRAL_CONNECT:
 			conn_handle, _, addr, = data
 
 			self.__conn_handles.add(conn_handle)
@@ -82,7 +80,7 @@ class BLEUART(object):
 
 			printf(f'[{BLETools.decode_mac(addr)}] Connected [Handle: {conn_handle}]')
 
-		elif event == IRQ.CENTRAL_DISCONNECT:
+		elif event == IRQ_CENTRAL_DISCONNECT:
 			conn_handle, _, addr, = data
 
 			if conn_handle in self.__conn_handles:
@@ -92,7 +90,7 @@ class BLEUART(object):
 
 			self.__advertise()
 
-		elif event == IRQ.GATTS_WRITE:
+		elif event == IRQ_GATTS_WRITE:
 			conn_handle, attr_handle = data
 
 			if conn_handle in self.__conn_handles and attr_handle == self.__handle_uart_rx:
@@ -102,21 +100,21 @@ class BLEUART(object):
 				if self.__rx_received_cb:
 					self.__rx_received_cb(received_data)
 
-		elif event == IRQ.CONNECTION_UPDATE:
+		elif event == IRQ_CONNECTION_UPDATE:
 			conn_handle, interval, latency, supervision_timeout, status = data
 			printf(f'Connection Update [Handle: {conn_handle}, Interval: {interval}, Latency: {latency}, Supervision_Timeout: {supervision_timeout}, Status: {status}]')
 
-		elif event == IRQ.GATTC_INDICATE:
+		elif event == IRQ_GATTC_INDICATE:
 			conn_handle, value_handle, data = data
 			printf(f'GATTC Indicate [Handle: {conn_handle}, Value_Handle: {value_handle}, Data: {bytes(data)}]')
 
-		elif event == IRQ.SET_SECRET:
+		elif event == IRQ_SET_SECRET:
 			return False
 
-		elif event == IRQ.GET_SECRET:
+		elif event == IRQ_GET_SECRET:
 			return None
 
-		elif event == IRQ.MTU_EXCHANGED:
+		elif event == IRQ_MTU_EXCHANGED:
 			conn_handle, mtu = data
 			printf(f'MTU Exchanged [Handle: {conn_handle}, MTU: {mtu}]')
 
@@ -4,8 +4,8 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 from micropython import const
 from struct import pack
-from bluetooth import UUID
 from ble import *
+from ble.values import ValueStore
 
 
 # Profile
@@ -118,13 +118,16 @@ class AlertNotificationValues(object):
 			}
 
 
-	class AlertNotificationService(object):
+	class AlertNotificationService(ValueStore):
 		def __dir__(self):
 			return [attr for attr in dir(type(self)) if not attr.startswith('_')]
 
 		def __init__(self):
+			super().__init__()
+
 			self.__new_alert_category    = 0
 			self.__unread_alert_category = 0
+			self.__update_categories()
 
 			self.__alert_id     = None
 			self.__alert_number = 0 # from 0 to 255
@@ -136,6 +139,10 @@ class AlertNotificationValues(object):
 			self.__control_id      = None
 			self.__control_command = None
 
+		def __update_categories(self):
+			self._update('new_alert_category', pack('<H', self.__new_alert_category))
+			self._update('unread_alert_category', pack('<H', self.__unread_alert_category))
+
 		def get_category_status(self, category, for_new_alert: bool = True) -> int:
 			status = 0
 
@@ -154,6 +161,8 @@ class AlertNotificationValues(object):
 				else:
 					self.__unread_alert_category |= 1 << category
 
+				self.__update_categories()
+
 		def disable_category(self, category: int, for_new_alert: bool = True):
 			if category in AlertNotificationValues.Consts.AlertCategory.CATEGORIES:
 				if for_new_alert:
@@ -161,6 +170,8 @@ class AlertNotificationValues(object):
 				else:
 					self.__unread_alert_category &= ~(1 << category)
 
+				self.__update_categories()
+
 		def make_new_alert(self, category_id: int, number: int, text: str = '') -> bool:
 			if category_id not in AlertNotificationValues.Consts.AlertCategory.CATEGORIES:
 				return
@@ -193,21 +204,23 @@ class AlertNotificationValues(object):
 		# region Properties
 		@property
 		def new_alert_category(self) -> bytes:
-			return pack('<H', self.__new_alert_category)
+			return self._value('new_alert_category')
 
 		@new_alert_category.setter
 		def new_alert_category(self, value: int):
 			if value <= AlertNotificationValues.Consts.AlertCategory.ALL:
 				self.__new_alert_category = value
+				self.__update_categories()
 
 		@property
 		def unread_alert_category(self) -> bytes:
-			return pack('<H', self.__unread_alert_category)
+			return self._value('unread_alert_category')
 
 		@unread_alert_category.setter
 		def unread_alert_category(self, value: int):
 			if value <= AlertNotificationValues.Consts.AlertCategory.ALL:
 				self.__unread_alert_category = value
+				self.__update_categories()
 
 		@property
 		def new_alert(self) -> bytes:
@@ -227,28 +240,28 @@ class AlertNotificationValues(object):
 # region Service
 class  AlertNotificationService(Service):
 	def __init__(self):
-		super().__init__(UUID(AlertNotificationValues.UUIDS.ALERT_NOTIFICATION_SERVICE))
+		super().__init__(make_uuid(AlertNotificationValues.UUIDS.ALERT_NOTIFICATION_SERVICE))
 # endregion
 
 
 # region Characteristics
 class SupportedNewAlertCategory(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(AlertNotificationValues.UUIDS.SUPPORTED_NEW_ALERT_CATEGORY), Flag.READ)
+		super().__init__(make_uuid(AlertNotificationValues.UUIDS.SUPPORTED_NEW_ALERT_CATEGORY), Flag.READ)
 
 class NewAlert(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(AlertNotificationValues.UUIDS.NEW_ALERT), Flag.NOTIFY)
+		super().__init__(make_uuid(AlertNotificationValues.UUIDS.NEW_ALERT), Flag.NOTIFY)
 
 class SupportedUnreadAlertCategory(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(AlertNotificationValues.UUIDS.SUPPORTED_UNREAD_ALERT_CATEGORY), Flag.READ)
+		super().__init__(make_uuid(AlertNotificationValues.UUIDS.SUPPORTED_UNREAD_ALERT_CATEGORY), Flag.READ)
 
 class UnreadAlertStatus(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(AlertNotificationValues.UUIDS.UNREAD_ALERT_STATUS), Flag.NOTIFY)
+		super().__init__(make_uuid(AlertNotificationValues.UUIDS.UNREAD_ALERT_STATUS), Flag.NOTIFY)
 
 class AlertNotificationControlPoint(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(AlertNotificationValues.UUIDS.ALERT_NOTIFICATION_CONTROL_POINT), Flag.WRITE)
+		super().__init__(make_uuid(AlertNotificationValues.UUIDS.ALERT_NOTIFICATION_CONTROL_POINT), Flag.WRITE)
 # endregion
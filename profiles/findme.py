@@ -4,7 +4,6 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 from micropython import const
 from struct import pack
-from bluetooth import UUID
 from ble import *
 
 
@@ -88,12 +87,12 @@ class FindMeValues(object):
 # region Service
 class  ImmediateAlertService(Service):
 	def __init__(self):
-		super().__init__(UUID(FindMeValues.UUIDS.IMMEDIATE_ALERT_SERVICE))
+		super().__init__(make_uuid(FindMeValues.UUIDS.IMMEDIATE_ALERT_SERVICE))
 # endregion
 
 
 # region Characteristic
 class AlertLevel(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(FindMeValues.UUIDS.ALERT_LEVEL), Flag.WRITE_NO_RESPONSE)
+		super().__init__(make_uuid(FindMeValues.UUIDS.ALERT_LEVEL), Flag.WRITE_NO_RESPONSE)
 # endregion
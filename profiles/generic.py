@@ -4,8 +4,8 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 from micropython import const
 from struct import pack
-from bluetooth import UUID
 from ble import *
+from ble.values import ValueStore
 
 
 # Service UUIDs
@@ -47,17 +47,19 @@ class GenericValues(object):
 		self.generic_access = self.GenericAccess()
 
 
-	class GenericAccess(object):
+	class GenericAccess(ValueStore):
 		def __dir__(self):
 			return [attr for attr in dir(type(self)) if not attr.startswith('_')]
 
 		def __init__(self):
-			self.__device_name = 'MP_HID'
+			super().__init__()
+
+			self.device_name = 'MP_HID'
 
 			# (0x00f, 0x01)
 			# category: Human Interface Device
 			# subcategory: Keyboard
-			self.__appearance = 961 # or (0x00f, 0x01)
+			self.appearance = 961 # or (0x00f, 0x01)
 
 			# (min, max, latency, timeout)
 			# Minimum connection interval
@@ -65,48 +67,48 @@ class GenericValues(object):
 			# Slave Latency
 			# Connection Supervision timeout multiplier
 			# for min & max, 1 = 1.25ms
-			self.__ppcp = [40, 80, 10, 300] # Peripheral_Preferred_Connection_Parameters
+			self.ppcp = [40, 80, 10, 300] # Peripheral_Preferred_Connection_Parameters
 
 
 		# region Properties
 		@property
 		def device_name(self) -> bytes:
-			return pack(f'<{len(self.__device_name)}s', self.__device_name.encode())
+			return self._value('device_name')
 
 		@device_name.setter
 		def device_name(self, value: str):
-			self.__device_name = value if isinstance(value, str) else str(value)
+			self._update('device_name', (value if isinstance(value, str) else str(value)).encode())
 
 		@property
 		def appearance(self) -> bytes:
-			return pack('<H', self.__appearance)
+			return self._value('appearance')
 
 		@appearance.setter
 		def appearance(self, value: int | tuple):
 			if isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, int) for v in value):
-				self.__appearance = BLETools.make_appearance(*value)
+				self._update('appearance', pack('<H', BLETools.make_appearance(*value)))
 			elif isinstance(value, int):
-				self.__appearance = value
+				self._update('appearance', pack('<H', value))
 
 		@property
 		def ppcp(self) -> bytes:
-			return pack('<4H', *self.__ppcp)
+			return self._value('ppcp')
 
 		@ppcp.setter
 		def ppcp(self, value: tuple | list):
 			if isinstance(value, (tuple, list)) and len(value) == 4 and all(isinstance(v, int) for v in value):
-				self.__ppcp = value
+				self._update('ppcp', pack('<4H', *value))
 		# endregion
 
 
 # region Services
 class GenericAccess(Service):
 	def __init__(self):
-		super().__init__(UUID(UUID_GENERIC_ACCESS))
+		super().__init__(make_uuid(UUID_GENERIC_ACCESS))
 
 class GenericAttribute(Service):
 	def __init__(self):
-		super().__init__(UUID(UUID_GENERIC_ATTRIBUTE))
+		super().__init__(make_uuid(UUID_GENERIC_ATTRIBUTE))
 # endregion
 
 
@@ -115,22 +117,22 @@ class GenericAttribute(Service):
 # region GenericAccess's Characteristics
 class DeviceName(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_DEVICE_NAME), Flag.READ_WRITE)
+		super().__init__(make_uuid(UUID_DEVICE_NAME), Flag.READ_WRITE)
 
 class Appearance(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_APPEARANCE), Flag.READ)
+		super().__init__(make_uuid(UUID_APPEARANCE), Flag.READ)
 
 class PPCP(Characteristic): # PeripheralPreferredConnectionParameters
 	def __init__(self):
-		super().__init__(UUID(UUID_PPCP), Flag.READ)
+		super().__init__(make_uuid(UUID_PPCP), Flag.READ)
 # endregion
 
 
 # region GenericAttribute's Characteristics
 class ServiceChanged(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_SERVICE_CHANGED), Flag.INDICATE)
+		super().__init__(make_uuid(UUID_SERVICE_CHANGED), Flag.INDICATE)
 # endregion
 
 # endregion
@@ -2,10 +2,13 @@
 Copyright © 2024 Walkline Wang (https://walkline.wang)
 Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
+import bluetooth
 from micropython import const
-from struct import pack
-from bluetooth import UUID
+from struct import pack, unpack
 from ble import *
+from ble.values import ValueStore, collect_values, apply_values
+from ble.flat_consts import *
+from profiles.generic import GenericProfile, GenericValues
 
 
 # Service UUIDs
@@ -36,6 +39,26 @@ UUID_PROTOCOL_MODE = const(0x2A4E)
 # Descriptor UUIDs
 UUID_REPORT_REFERENCE = const(0x2908)
 
+# report 第一个数据项所在的用途页
+USAGE_PAGE_GENERIC_DESKTOP = const(0x01)
+USAGE_PAGE_KEYBOARD        = const(0x07)
+USAGE_PAGE_LED             = const(0x08)
+USAGE_PAGE_BUTTON          = const(0x09)
+USAGE_PAGE_CONSUMER        = const(0x0C)
+
+# Protocol Mode 特征值，每次连接时默认为 report 模式
+PROTOCOL_BOOT   = const(0)
+PROTOCOL_REPORT = const(1)
+
+# 主机写入 HID Control Point 的命令
+CONTROL_SUSPEND      = const(0)
+CONTROL_EXIT_SUSPEND = const(1)
+
+# Report Reference 描述符中的 report 类型
+REPORT_TYPE_INPUT   = const(1)
+REPORT_TYPE_OUTPUT  = const(2)
+REPORT_TYPE_FEATURE = const(3)
+
 
 class HIDProfile(Profile):
 	'''只包含 HID 所需的三个服务'''
@@ -102,6 +125,131 @@ class KeyboardProfile(HIDProfile):
 		return self.__report_count
 
 
+class ReportProfile(HIDProfile):
+	'''根据 parse_reports() 的结果为每个 report 生成 Report 特征和 ReportReference 描述符'''
+	def __init__(self, reports: tuple, *services):
+		super().__init__()
+
+		device = HumanInterfaceDevice()
+
+		for _ in reports:
+			device.add_characteristics(
+				Report().add_descriptors(
+					ReportReference(),
+				),
+			)
+
+		self.add_services(device, *services)
+
+
+# report 数据的最大字节数，与 HIDDevice 激活时的 mtu=256 对应（ATT 通知负载为 MTU - 3）
+MAX_REPORT_SIZE = const(253)
+
+def parse_reports(report_map, max_size: int = MAX_REPORT_SIZE) -> tuple:
+	'''
+	解析并校验 report map，按首次出现的顺序返回 ((report_id, report_type, size, usage_page), ...)
+
+	- size 为 report 数据的字节数（不含 report id），未定义 Report ID 时 report_id 为 0
+	- usage_page 为该 report 第一个数据项所在的用途页，如 0x07（键盘）、0x0C（消费类）
+
+	report map 格式错误时抛出 ValueError，如条目被截断、Collection 未闭合、
+	Report ID 为 0、部分数据项缺少 Report ID、report 长度为 0 或超过 max_size，
+	设备在注册服务前调用，避免配对后主机才发现 report map 与设备不匹配
+	'''
+	reports = {} # (report_id, report_type): [bits, usage_page]
+	order   = []
+	stack   = []
+
+	usage_page = report_id = report_size = report_count = 0
+	collections = index = 0
+	no_id = False # 是否存在未定义 Report ID 的数据项
+
+	while index < len(report_map):
+		prefix = report_map[index]
+
+		# 长条目：0xFE, 数据长度, 标签, 数据
+		if prefix == 0xFE:
+			if index + 2 >= len(report_map):
+				raise ValueError(f'truncated long item at offset {index}')
+
+			index += 3 + report_map[index + 1]
+			continue
+
+		length = (0, 1, 2, 4)[prefix & 0x03]
+
+		if index + length >= len(report_map):
+			raise ValueError(f'truncated item 0x{prefix:02X} at offset {index}')
+
+		value = 0
+
+		for offset in range(length):
+			value |= report_map[index + 1 + offset] << (8 * offset)
+
+		tag = prefix & 0xFC
+		index += 1 + length
+
+		if tag == 0x04:   # Usage Page
+			usage_page = value
+		elif tag == 0x84: # Report ID
+			if not 0 < value < 256:
+				raise ValueError(f'invalid report id {value} at offset {index - 1 - length}')
+
+			report_id = value
+		elif tag == 0x74: # Report Size
+			report_size = value
+		elif tag == 0x94: # Report Count
+			report_count = value
+		elif tag == 0xA4: # Push
+			stack.append((usage_page, report_id, report_size, report_count))
+		elif tag == 0xB4: # Pop
+			if not stack:
+				raise ValueError(f'pop without push at offset {index - 1 - length}')
+
+			usage_page, report_id, report_size, report_count = stack.pop()
+		elif tag == 0xA0: # Collection
+			collections += 1
+		elif tag == 0xC0: # End Collection
+			if collections == 0:
+				raise ValueError(f'end collection without collection at offset {index - 1 - length}')
+
+			collections -= 1
+		elif tag in (0x80, 0x90, 0xB0): # Input, Output, Feature
+			if collections == 0:
+				raise ValueError(f'main item outside collection at offset {index - 1 - length}')
+
+			no_id = no_id or report_id == 0
+
+			key = (report_id, (REPORT_TYPE_INPUT, REPORT_TYPE_OUTPUT, 0, REPORT_TYPE_FEATURE)[(tag - 0x80) >> 4])
+
+			if key not in reports:
+				reports[key] = [0, usage_page]
+				order.append(key)
+
+			reports[key][0] += report_size * report_count
+
+	if collections:
+		raise ValueError(f'{collections} collection(s) not closed')
+
+	if not order:
+		raise ValueError('no input, output or feature report defined')
+
+	if no_id and any(report_id for report_id, _ in order):
+		raise ValueError('report id must be defined for all reports when any report uses one')
+
+	result = []
+
+	for report_id, report_type in order:
+		bits, page = reports[report_id, report_type]
+		size = (bits + 7) // 8
+
+		if not 0 < size <= max_size:
+			raise ValueError(f'report {report_id} (type {report_type}) size {size} out of range 1~{max_size}')
+
+		result.append((report_id, report_type, size, page))
+
+	return tuple(result)
+
+
 class HIDValues(object):
 	'''生成 BLE 设备信息字节串'''
 	def __init__(self):
@@ -110,7 +258,7 @@ class HIDValues(object):
 		self.human_interface_device = self.HumanInterfaceDevice()
 
 
-	class DeviceInformation(object):
+	class DeviceInformation(ValueStore):
 		VENDOR_ID_SOURCE_BLUETOOTH = 1
 		VENDOR_ID_SOURCE_USB       = 2
 
@@ -118,12 +266,14 @@ class HIDValues(object):
 			return [attr for attr in dir(type(self)) if not attr.startswith('_')]
 
 		def __init__(self):
-			self.__manufacturer_name = 'Walkline Wang'
-			self.__model_number      = 'MP_KB'
-			self.__serial_number     = '4e897424-061d-4dd9-a798-454f79b37245'
-			self.__firmware_revision = 'v0.1'
-			self.__hardware_revision = 'v0.2'
-			self.__software_revision = 'v0.3'
+			super().__init__()
+
+			self.manufacturer_name = 'Walkline Wang'
+			self.model_number      = 'MP_KB'
+			self.serial_number     = '4e897424-061d-4dd9-a798-454f79b37245'
+			self.firmware_revision = 'v0.1'
+			self.hardware_revision = 'v0.2'
+			self.software_revision = 'v0.3'
 
 			# pnp_id related
 			# self.__vendor_id_source = self.VENDOR_ID_SOURCE_USB
@@ -133,55 +283,60 @@ class HIDValues(object):
 			self.__product_id       = 0x0001
 			self.__product_version  = 0x0001
 
+			self.__update_pnp_id()
+
+		def __update_pnp_id(self):
+			self._update('pnp_id', pack('<BHHH', self.__vendor_id_source, self.__vendor_id, self.__product_id, self.__product_version))
+
 
 		# region Properties
 		@property
 		def manufacturer_name(self) -> bytes:
-			return pack(f'<{len(self.__manufacturer_name)}s', self.__manufacturer_name.encode())
+			return self._value('manufacturer_name')
 
 		@manufacturer_name.setter
 		def manufacturer_name(self, value: str):
-			self.__manufacturer_name = value if isinstance(value, str) else str(value)
+			self._update('manufacturer_name', (value if isinstance(value, str) else str(value)).encode())
 
 		@property
 		def model_number(self) -> bytes:
-			return pack(f'<{len(self.__model_number)}s', self.__model_number.encode())
+			return self._value('model_number')
 
 		@model_number.setter
 		def model_number(self, value: str):
-			self.__model_number = value if isinstance(value, str) else str(value)
+			self._update('model_number', (value if isinstance(value, str) else str(value)).encode())
 
 		@property
 		def serial_number(self) -> bytes:
-			return pack(f'<{len(self.__serial_number)}s', self.__serial_number.encode())
+			return self._value('serial_number')
 
 		@serial_number.setter
 		def serial_number(self, value: str):
-			self.__serial_number = value if isinstance(value, str) else str(value)
+			self._update('serial_number', (value if isinstance(value, str) else str(value)).encode())
 
 		@property
 		def firmware_revision(self) -> bytes:
-			return pack(f'<{len(self.__firmware_revision)}s', self.__firmware_revision.encode())
+			return self._value('firmware_revision')
 
 		@firmware_revision.setter
 		def firmware_revision(self, value: str):
-			self.__firmware_revision = value if isinstance(value, str) else str(value)
+			self._update('firmware_revision', (value if isinstance(value, str) else str(value)).encode())
 
 		@property
 		def hardware_revision(self) -> bytes:
-			return pack(f'<{len(self.__hardware_revision)}s', self.__hardware_revision.encode())
+			return self._value('hardware_revision')
 
 		@hardware_revision.setter
 		def hardware_revision(self, value: str):
-			self.__hardware_revision = value if isinstance(value, str) else str(value)
+			self._update('hardware_revision', (value if isinstance(value, str) else str(value)).encode())
 
 		@property
 		def software_revision(self) -> bytes:
-			return pack(f'<{len(self.__software_revision)}s', self.__software_revision.encode())
+			return self._value('software_revision')
 
 		@software_revision.setter
 		def software_revision(self, value: str):
-			self.__software_revision = value if isinstance(value, str) else str(value)
+			self._update('software_revision', (value if isinstance(value, str) else str(value)).encode())
 
 		@property
 		def vendor_id_source(self) -> int:
@@ -191,6 +346,7 @@ class HIDValues(object):
 		def vendor_id_source(self, value: int):
 			if isinstance(value, int) and value in (self.VENDOR_ID_SOURCE_BLUETOOTH, self.VENDOR_ID_SOURCE_USB):
 				self.__vendor_id_source = value
+				self.__update_pnp_id()
 
 		@property
 		def vendor_id(self) -> int:
@@ -200,6 +356,7 @@ class HIDValues(object):
 		def vendor_id(self, value: int):
 			if isinstance(value, int):
 				self.__vendor_id = value
+				self.__update_pnp_id()
 
 		@property
 		def product_id(self) -> int:
@@ -209,6 +366,7 @@ class HIDValues(object):
 		def product_id(self, value: int):
 			if isinstance(value, int):
 				self.__product_id = value
+				self.__update_pnp_id()
 
 		@property
 		def product_version(self) -> int:
@@ -218,34 +376,37 @@ class HIDValues(object):
 		def product_version(self, value: int):
 			if isinstance(value, int):
 				self.__product_version = value
+				self.__update_pnp_id()
 
 		@property
 		def pnp_id(self) -> bytes:
-			return pack('<BHHH', self.vendor_id_source, self.vendor_id, self.product_id, self.product_version)
+			return self._value('pnp_id')
 		# endregion
 
 
-	class BatteryService(object):
+	class BatteryService(ValueStore):
 		def __dir__(self):
 			return [attr for attr in dir(type(self)) if not attr.startswith('_')]
 
 		def __init__(self):
-			self.__battery_level = 100
+			super().__init__()
+
+			self.battery_level = 100
 
 
 		# region Properties
 		@property
 		def battery_level(self) -> bytes:
-			return pack('<B', self.__battery_level)
+			return self._value('battery_level')
 
 		@battery_level.setter
 		def battery_level(self, value: int):
 			if isinstance(value, int) and 0 <= value <= 100:
-				self.__battery_level = value
+				self._update('battery_level', pack('<B', value))
 		# endregion
 
 
-	class HumanInterfaceDevice(object):
+	class HumanInterfaceDevice(ValueStore):
 		PROTOCOL_MODE_BOOT   = 0
 		PROTOCOL_MODE_REPORT = 1
 
@@ -253,25 +414,27 @@ class HIDValues(object):
 			return [attr for attr in dir(type(self)) if not attr.startswith('_')]
 
 		def __init__(self):
+			super().__init__()
+
 			# [0]: bcdHID - HID 规范版本（0x0111: v1.11)
 			# [1]: bCountryCode - 国家代码，默认不设置
 			# [2]: Flags - 禁用 RemoteWake 和 NormallyConnectable
-			self.__hid_information = [0x0111, 0x00, 0b00]
-
-			self.__report_count = 1
+			self._update('hid_information', pack('<HBB', 0x0111, 0x00, 0b00))
+			self._update('report_reference_led', pack('<BB', 1, 2))
 
-			self.__protocol_mode = self.PROTOCOL_MODE_REPORT
+			self.report_count  = 1
+			self.protocol_mode = self.PROTOCOL_MODE_REPORT
 
 
 		# region Properties
 		@property
 		def hid_information(self):
-			return pack('<HBB', *self.__hid_information)
+			return self._value('hid_information')
 
 		# @hid_information.setter
 		# def hid_information(self, value: tuple | list):
 		# 	if isinstance(value, (tuple, list)) and len(value) == 3 and all(isinstance(v, int) for v in value):
-		# 		self.__hid_information = value
+		# 		self._update('hid_information', pack('<HBB', *value))
 
 		@property
 		def report_count(self):
@@ -281,38 +444,39 @@ class HIDValues(object):
 		def report_count(self, value: int):
 			if isinstance(value, int):
 				self.__report_count = value
+				self._update('report_reference', tuple(pack('<BB', report_id, 1) for report_id in range(1, value + 1)))
 
 		@property
 		def report_reference(self):
-			return [pack('<BB', report_id, 1) for report_id in range(1, self.__report_count + 1)]
+			return self._value('report_reference')
 
 		@property
 		def report_reference_led(self):
-			return pack('<BB', 1, 2)
+			return self._value('report_reference_led')
 
 		@property
 		def protocol_mode(self):
-			return pack('<B', self.__protocol_mode)
+			return self._value('protocol_mode')
 
 		@protocol_mode.setter
 		def protocol_mode(self, value: int):
 			if isinstance(value, int) and value in (self.PROTOCOL_MODE_BOOT, self.PROTOCOL_MODE_REPORT):
-				self.__protocol_mode = value
+				self._update('protocol_mode', pack('<B', value))
 		# endregion
 
 
 # region Services
 class DeviceInformation(Service):
 	def __init__(self):
-		super().__init__(UUID(UUID_DEVICE_INFORMATION))
+		super().__init__(make_uuid(UUID_DEVICE_INFORMATION))
 
 class BatteryService(Service):
 	def __init__(self):
-		super().__init__(UUID(UUID_BATTERY_SERVICE))
+		super().__init__(make_uuid(UUID_BATTERY_SERVICE))
 
 class HumanInterfaceDevice(Service):
 	def __init__(self):
-		super().__init__(UUID(UUID_HUMAN_INTERFACE_DEVICE))
+		super().__init__(make_uuid(UUID_HUMAN_INTERFACE_DEVICE))
 # endregion
 
 
@@ -321,73 +485,73 @@ class HumanInterfaceDevice(Service):
 # region DeviceInformation's Characteristics
 class ManufacturerNameString(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_MANUFACTURER_NAME_STRING), Flag.READ)
+		super().__init__(make_uuid(UUID_MANUFACTURER_NAME_STRING), Flag.READ)
 
 class ModelNumberString(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_MODEL_NUMBER_STRING), Flag.READ)
+		super().__init__(make_uuid(UUID_MODEL_NUMBER_STRING), Flag.READ)
 
 class SerialNumberString(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_SERIAL_NUMBER_STRING), Flag.READ)
+		super().__init__(make_uuid(UUID_SERIAL_NUMBER_STRING), Flag.READ)
 
 class HardwareRevisionString(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_HARDWARE_REVISION_STRING), Flag.READ)
+		super().__init__(make_uuid(UUID_HARDWARE_REVISION_STRING), Flag.READ)
 
 class FirmwareRevisionString(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_FIRMWARE_REVISION_STRING), Flag.READ)
+		super().__init__(make_uuid(UUID_FIRMWARE_REVISION_STRING), Flag.READ)
 
 class SoftwareRevisionString(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_SOFTWARE_REVISION_STRING), Flag.READ)
+		super().__init__(make_uuid(UUID_SOFTWARE_REVISION_STRING), Flag.READ)
 
 class PNPID(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_PNP_ID), Flag.READ)
+		super().__init__(make_uuid(UUID_PNP_ID), Flag.READ)
 # endregion
 
 
 # region BatteryService's Characteristics
 class BatteryLevel(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_BATTERY_LEVEL), Flag.READ)
+		super().__init__(make_uuid(UUID_BATTERY_LEVEL), Flag.READ_NOTIFY)
 # endregion
 
 
 # region HumanInterfaceDevice's Characteristics
 class HIDInformation(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_HID_INFORMATION), Flag.READ)
+		super().__init__(make_uuid(UUID_HID_INFORMATION), Flag.READ)
 
 class BootKeyboardInputReport(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_BOOT_KEYBOARD_INPUT_REPORT), Flag.READ_NOTIFY)
+		super().__init__(make_uuid(UUID_BOOT_KEYBOARD_INPUT_REPORT), Flag.READ_NOTIFY)
 
 class BootKeyboardOutputReport(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_BOOT_KEYBOARD_OUTPUT_REPORT), Flag.READ_WRITE | Flag.WRITE_NO_RESPONSE)
+		super().__init__(make_uuid(UUID_BOOT_KEYBOARD_OUTPUT_REPORT), Flag.READ_WRITE | Flag.WRITE_NO_RESPONSE)
 
 class BootMouseInputReport(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_BOOT_MOUSE_INPUT_REPORT), Flag.READ_WRITE)
+		super().__init__(make_uuid(UUID_BOOT_MOUSE_INPUT_REPORT), Flag.READ_WRITE)
 
 class ReportMap(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_REPORT_MAP), Flag.READ)
+		super().__init__(make_uuid(UUID_REPORT_MAP), Flag.READ)
 
 class Report(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_REPORT), Flag.READ_WRITE | Flag.NOTIFY | Flag.WRITE_NO_RESPONSE)
+		super().__init__(make_uuid(UUID_REPORT), Flag.READ_WRITE | Flag.NOTIFY | Flag.WRITE_NO_RESPONSE)
 
 class HIDControlPoint(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_HID_CONTROL_POINT), Flag.WRITE_NO_RESPONSE)
+		super().__init__(make_uuid(UUID_HID_CONTROL_POINT), Flag.WRITE_NO_RESPONSE)
 
 class ProtocolMode(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_PROTOCOL_MODE), Flag.READ | Flag.WRITE_NO_RESPONSE)
+		super().__init__(make_uuid(UUID_PROTOCOL_MODE), Flag.READ | Flag.WRITE_NO_RESPONSE)
 # endregion
 
 # endregion
@@ -398,7 +562,703 @@ class ProtocolMode(Characteristic):
 # region Report Characteristic's Descriptors
 class ReportReference(Descriptor):
 	def __init__(self):
-		super().__init__(UUID(UUID_REPORT_REFERENCE), Flag.READ_WRITE | Flag.WRITE_NO_RESPONSE)
+		super().__init__(make_uuid(UUID_REPORT_REFERENCE), Flag.READ_WRITE | Flag.WRITE_NO_RESPONSE)
 # endregion
 
 # endregion
+
+
+# region Device
+def update_buffer(buffer: bytearray, value: bytes) -> bool:
+	'''将 value 复制到 buffer 中，长度不足时补 0，返回内容是否发生变化'''
+	changed = False
+
+	for index in range(len(buffer)):
+		byte = value[index] if index < len(value) else 0
+
+		if buffer[index] != byte:
+			buffer[index] = byte
+			changed = True
+
+	return changed
+
+
+# 收到连接参数更新事件前假定的连接间隔（毫秒）
+DEFAULT_INTERVAL_MS = const(30)
+
+class HIDDevice(object):
+	'''
+	通用 HID 设备
+
+	根据 report map 自动生成 Report 特征和 ReportReference 描述符，
+	键盘、音量键等设备只需提供 report map，并通过 send_report() 发送输入 report：
+
+		device = HIDDevice('MP_KB104', REPORT_MAP_DATA, output_cb=callback)
+		device.send_report(1, key_data)
+
+	输出 report（如键盘 LED 状态）的值发生变化时调用 output_cb(report_id, data)，
+	也可以通过 on_output() 为单个输出 report 设置回调，
+	data 为该 report 预分配的缓冲区，回调返回后内容可能被下一次写入修改，需要保留时应复制，
+	额外的服务（如 UART）可以通过 services 参数一并注册，
+	device_information 用于设置设备信息服务中的厂商、型号等特征值，
+	input_sizes 为 {用途页: 字节数}，用于在启动时检查输入 report 的长度是否与设备的数据格式一致
+
+	主机通过 HID Control Point 进入挂起状态后暂停电量通知，退出挂起时补发，
+	KeystrokeScheduler、MacroPlayer 等后台发送也会暂停，直接调用 send_report() 的按键仍会发送以唤醒主机；
+	设置 suspend_ppcp 时，挂起期间将首选连接参数（PPCP）改为该值以降低功耗，
+	挂起状态变化时调用 suspend_cb(suspended)
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self,
+			device_name: str,
+			report_map: bytes | list,
+			*,
+			appearance: int = 961, # (0x00f, 0x01)
+			device_information: dict = None,
+			input_sizes: dict = None,
+			output_cb: function = None,
+			suspend_cb: function = None,
+			suspend_ppcp: tuple = None,
+			services: tuple = (),
+		):
+		self.__ble          = bluetooth.BLE()
+		self.__report_map   = bytes(report_map)
+		self.__reports      = parse_reports(self.__report_map)
+		self.__sizes        = {report_id: size for report_id, report_type, size, _ in self.__reports if report_type == REPORT_TYPE_INPUT}
+		self.__buffers      = {report_id: bytearray(size) for report_id, size in self.__sizes.items()}
+		self.__output_cb    = output_cb
+		self.__output_cbs   = {} # report_id: callback
+
+		# 输出 report 最近一次的值，主机重复写入相同的值时不回调
+		self.__outputs = {report_id: bytearray(size) for report_id, report_type, size, _ in self.__reports if report_type == REPORT_TYPE_OUTPUT}
+		self.__suspend_cb   = suspend_cb
+		self.__suspend_ppcp = suspend_ppcp
+
+		# 设备按固定长度组织输入 report 时，启动时即检查 report map 是否一致
+		for report_id, report_type, size, usage_page in self.__reports:
+			if report_type == REPORT_TYPE_INPUT and input_sizes and usage_page in input_sizes and size != input_sizes[usage_page]:
+				raise ValueError(f'input report {report_id} (usage page 0x{usage_page:02X}) is {size} bytes, expected {input_sizes[usage_page]}')
+
+		self.__conn_handles = set()
+		self.__interval_ms  = DEFAULT_INTERVAL_MS
+		self.__protocol     = PROTOCOL_REPORT
+		self.__suspended    = False
+		self.__battery_deferred = False # 挂起期间电量发生变化，退出挂起时通知
+		self.__secrets      = BLETools.load_secrets()
+
+		self.__write  = self.__ble.gatts_write
+		self.__read   = self.__ble.gatts_read
+		self.__notify = self.__ble.gatts_notify
+
+		self.__ble.irq(self.__irq_callback)
+
+		BLETools.activate(self.__ble,
+			gap_name=device_name,
+			io=IOCapability.NO_INPUT_OUTPUT,
+			bond=True, le_secure=True, mitm=True,
+			addr_mode=AddressMode.RPA, mtu=256,
+		)
+
+		generic_profile = GenericProfile()
+		hid_profile     = ReportProfile(self.__reports, *services)
+
+		self.__generic_values = GenericValues()
+		self.__hid_values     = HIDValues()
+
+		self.__generic_values.generic_access.device_name = device_name
+		self.__generic_values.generic_access.appearance  = appearance
+
+		# 如 {'manufacturer_name': 'Walkline Wang', 'vendor_id': 0x02E5}
+		for name, value in (device_information or {}).items():
+			setattr(self.__hid_values.device_information, name, value)
+
+		self.__hid_values.battery_service.battery_level = 100
+
+		# 退出挂起时恢复的首选连接参数
+		self.__ppcp = unpack('<4H', self.__generic_values.generic_access.ppcp)
+
+		self.__register_services(generic_profile.register(self.__ble, hid_profile))
+
+		adv_payload = BLETools.generate_advertising_payload(
+			generic_profile.get_services_uuid(),
+			appearance=appearance,
+			name=device_name
+		)
+
+		resp_payload = BLETools.generate_advertising_payload(
+			hid_profile.get_services_uuid(),
+			for_resp=True
+		)
+
+		assert (len(adv_payload)  <= MAX_PAYLOAD_LENGTH) and\
+			   (len(resp_payload) <= MAX_PAYLOAD_LENGTH),\
+			   f'Advertising payload too long, more than {MAX_PAYLOAD_LENGTH} bytes'
+
+		self.__adv_payload  = adv_payload
+		self.__resp_payload = resp_payload
+
+		self.__advertise()
+
+	def __register_services(self, handles: HandleMap):
+		self.__handles = handles
+
+		self.__handle_battery_level = handles['BatteryLevel']
+		self.__handle_protocol_mode = handles['ProtocolMode']
+
+		handles.on_write(self.__handle_protocol_mode, self.__on_write_protocol_mode)
+		handles.on_write(handles['HIDControlPoint'], self.__on_write_control_point)
+
+		# report_id: handle，输入 report 用于发送，输出 report 用于接收
+		self.__input_handles  = {}
+		self.__output_reports = {} # handle: report_id
+
+		reports    = handles.get_all('Report')
+		references = handles.get_all('ReportReference')
+
+		self.__generic_values.generic_access.bind(
+			device_name=handles['DeviceName'],
+			appearance=handles['Appearance'],
+			ppcp=handles['PPCP'],
+		)
+
+		self.__hid_values.device_information.bind(
+			manufacturer_name=handles['ManufacturerNameString'],
+			model_number=handles['ModelNumberString'],
+			serial_number=handles['SerialNumberString'],
+			hardware_revision=handles['HardwareRevisionString'],
+			firmware_revision=handles['FirmwareRevisionString'],
+			software_revision=handles['SoftwareRevisionString'],
+			pnp_id=handles['PNPID'],
+		)
+
+		self.__hid_values.battery_service.bind(battery_level=self.__handle_battery_level)
+
+		self.__hid_values.human_interface_device.bind(
+			hid_information=handles['HIDInformation'],
+			protocol_mode=handles['ProtocolMode'],
+		)
+
+		# 收集全部待写入的特征值，按句柄顺序一次性写入
+		table = collect_values(
+			self.__generic_values.generic_access,
+			self.__hid_values.device_information,
+			self.__hid_values.battery_service,
+			self.__hid_values.human_interface_device,
+		)
+
+		table[handles['ReportMap']] = self.__report_map
+
+		for (report_id, report_type, _, _), report, reference in zip(self.__reports, reports, references):
+			table[reference] = pack('<BB', report_id, report_type)
+
+			if report_type == REPORT_TYPE_INPUT:
+				self.__input_handles[report_id] = report
+			elif report_type == REPORT_TYPE_OUTPUT:
+				self.__output_reports[report] = report_id
+				handles.on_write(report, self.__on_write_output_report)
+
+		apply_values(self.__write, table)
+
+		printf('Services Registered')
+
+		if False:
+			for report_id, report_type, size, usage_page in self.__reports:
+				printf(f'- report {report_id}: type {report_type}, {size} bytes, usage page 0x{usage_page:02X}')
+
+	def __advertise(self, interval_us: int = 100000):
+		self.__ble.gap_advertise(None)
+		self.__ble.gap_advertise(interval_us, adv_data=self.__adv_payload, resp_data=self.__resp_payload)
+
+		printf('Advertising Payload...')
+
+	def __irq_callback(self, event, data):
+		if event == IRQ_CENTRAL_CONNECT:
+			conn_handle, _, addr, = data # _: addr_type
+
+			self.__conn_handles.add(conn_handle)
+			self.__ble.gap_advertise(None)
+
+			printf(f'[{BLETools.decode_mac(addr)}] Connected [Handle: {conn_handle}]')
+		elif event == IRQ_CENTRAL_DISCONNECT:
+			conn_handle, _, addr, = data # _: addr_type
+
+			if conn_handle in self.__conn_handles:
+				self.__conn_handles.remove(conn_handle)
+
+			printf(f'[{BLETools.decode_mac(addr)}] Disconnected [Handle: {conn_handle}]')
+
+			# 下次连接时恢复为 report 模式
+			if self.__protocol != PROTOCOL_REPORT:
+				self.__protocol = PROTOCOL_REPORT
+				self.__write(self.__handle_protocol_mode, pack('<B', PROTOCOL_REPORT))
+
+			self.__set_suspended(False)
+
+			self.__advertise()
+		elif event == IRQ_GATTS_READ_REQUEST:
+			return self.__handles.dispatch_read(*data)
+		elif event == IRQ_GATTS_WRITE:
+			self.__handles.dispatch_write(*data)
+		elif event == IRQ_CONNECTION_UPDATE:
+			conn_handle, interval, latency, supervision_timeout, status = data
+
+			# interval 单位为 1.25ms
+			if status == 0:
+				self.__interval_ms = max(interval * 5 // 4, 8)
+
+			printf(f'Connection Update [Handle: {conn_handle}, Interval: {interval}, Latency: {latency}, Supervision_Timeout: {supervision_timeout}, Status: {status}]')
+		elif event == IRQ_ENCRYPTION_UPDATE:
+			conn_handle, encrypted, authenticated, bonded, key_size = data
+
+			printf(f'Encryption Update [Handle: {conn_handle}, Encrypted: {bool(encrypted)}, Authenticated: {bool(authenticated)}, Bonded: {bool(bonded)}, Key_Size: {key_size}]')
+		elif event == IRQ_PASSKEY_ACTION:
+			conn_handle, action, passkey = data
+
+			printf(f'Passkey Action [Handle: {conn_handle}, Action: {action}, Passkey: {passkey}]')
+
+			if action == PasskeyAction.NUMERIC_COMPARISON:
+				accept = int(input('Accept? (0/1): '))
+				self.__ble.gap_passkey(conn_handle, action, accept)
+			elif action == PasskeyAction.DISPLAY:
+				printf('Displaying 123456')
+				self.__ble.gap_passkey(conn_handle, action, 123456)
+			elif action == PasskeyAction.INPUT:
+				passkey = int(input('passkey? '))
+				self.__ble.gap_passkey(conn_handle, action, passkey)
+			else:
+				printf('Unknown Passkey Action')
+		elif event == IRQ_SET_SECRET:
+			result = True
+			sec_type, key, value = data
+			key   = sec_type, bytes(key)
+			value = bytes(value) if value else None
+
+			if value is None:
+				if key in self.__secrets:
+					del self.__secrets[key]
+				else:
+					result = False
+			else:
+				self.__secrets[key] = value
+
+			if result:
+				BLETools.save_secrets(self.__secrets)
+
+			return result
+		elif event == IRQ_GET_SECRET:
+			sec_type, index, key = data
+
+			if key is None:
+				i = 0
+				for (t, _key), value in self.__secrets.items():
+					if t == sec_type:
+						if i == index:
+							return value
+						i += 1
+				return None
+			else:
+				key = sec_type, bytes(key)
+				return self.__secrets.get(key, None)
+		elif event == IRQ_MTU_EXCHANGED:
+			conn_handle, mtu = data
+
+			printf(f'MTU Exchanged [Handle: {conn_handle}, MTU: {mtu}]')
+		elif event in (IRQ_GATTC_INDICATE, IRQ_GATTS_INDICATE_DONE):
+			pass
+		else:
+			printf(f'Uncaught IRQ Event: {event}, Data: {data}')
+
+	def __on_write_protocol_mode(self, conn_handle, attr_handle):
+		value = self.__read(attr_handle)
+
+		if value and value[0] in (PROTOCOL_BOOT, PROTOCOL_REPORT):
+			self.__protocol = value[0]
+
+			printf(f'Protocol Mode: {"boot" if self.__protocol == PROTOCOL_BOOT else "report"}')
+
+	def __on_write_control_point(self, conn_handle, attr_handle):
+		value = self.__read(attr_handle)
+
+		if value and value[0] in (CONTROL_SUSPEND, CONTROL_EXIT_SUSPEND):
+			self.__set_suspended(value[0] == CONTROL_SUSPEND)
+
+	def __set_suspended(self, suspended: bool):
+		if suspended == self.__suspended:
+			return
+
+		self.__suspended = suspended
+
+		printf(f'HID Control Point: {"suspend" if suspended else "exit suspend"}')
+
+		if self.__suspend_ppcp is not None:
+			self.__generic_values.generic_access.ppcp = self.__suspend_ppcp if suspended else self.__ppcp
+			self.__generic_values.generic_access.flush(self.__write)
+
+		if not suspended and self.__battery_deferred:
+			self.__battery_deferred = False
+			self.__write(self.__handle_battery_level, self.__hid_values.battery_service.battery_level, True)
+
+		if self.__suspend_cb is not None:
+			self.__suspend_cb(suspended)
+
+	def __on_write_output_report(self, conn_handle, attr_handle):
+		report_id = self.__output_reports[attr_handle]
+		buffer    = self.__outputs[report_id]
+
+		if not update_buffer(buffer, self.__read(attr_handle)):
+			return
+
+		callback = self.__output_cbs.get(report_id, self.__output_cb)
+
+		if callback is not None:
+			callback(report_id, buffer)
+
+	def on_output(self, report_id: int, callback: function):
+		'''设置输出 report 的回调 callback(report_id, data)，优先于 output_cb'''
+		if report_id not in self.__outputs:
+			raise ValueError(f'output report {report_id} not defined in report map')
+
+		self.__output_cbs[report_id] = callback
+
+	def send_report(self, report_id: int, data: bytes | bytearray = None):
+		'''
+		发送输入 report，report_id 为 report map 中定义的 Report ID
+
+		data 为空时发送 report_buffer(report_id) 中的数据，
+		数据直接随通知发送，不再单独写入特征值，按键事件不产生内存分配
+		'''
+		handle = self.__input_handles[report_id]
+
+		if data is None:
+			data = self.__buffers[report_id]
+
+		for conn_handle in self.__conn_handles:
+			self.__notify(conn_handle, handle, data)
+
+	def notify(self, handle: int, data: bytes | bytearray):
+		'''向全部连接发送指定特征的通知，用于 report map 之外的特征，如启动协议 report'''
+		for conn_handle in self.__conn_handles:
+			self.__notify(conn_handle, handle, data)
+
+	def __write_battery_level(self, handle: int, value: bytes):
+		# 只通知已订阅电量通知的客户端，挂起期间只写入，退出挂起时再通知
+		self.__write(handle, value, not self.__suspended)
+		self.__battery_deferred = self.__suspended
+
+	def update_battery_level(self, value: int = None) -> int:
+		'''
+		设置电量百分比（0~100），电量未变化时不写入也不通知，返回当前电量
+
+		value 为空时只返回当前电量，定时采样和滤波见 devices.hid.battery.BatteryMonitor
+		'''
+		battery = self.__hid_values.battery_service
+
+		if value is not None:
+			battery.battery_level = max(0, min(100, value))
+			battery.flush(self.__write_battery_level)
+
+		return battery.battery_level[0]
+
+
+	# region Properties
+	@property
+	def ble(self):
+		return self.__ble
+
+	@property
+	def handles(self) -> HandleMap:
+		return self.__handles
+
+	@property
+	def conn_handles(self) -> set:
+		return self.__conn_handles
+
+	@property
+	def protocol_mode(self) -> int:
+		'''主机设置的协议模式，PROTOCOL_BOOT 或 PROTOCOL_REPORT'''
+		return self.__protocol
+
+	@property
+	def suspended(self) -> bool:
+		'''主机是否通过 HID Control Point 进入了挂起状态'''
+		return self.__suspended
+
+	@property
+	def connection_interval(self) -> int:
+		'''最近一次连接参数更新得到的连接间隔（毫秒）'''
+		return self.__interval_ms
+
+	@property
+	def reports(self) -> tuple:
+		'''((report_id, report_type, size, usage_page), ...)'''
+		return self.__reports
+
+	@property
+	def report_ids(self) -> tuple:
+		'''按 report map 中的顺序排列的输入 report id'''
+		return tuple(report_id for report_id, report_type, _, _ in self.__reports if report_type == REPORT_TYPE_INPUT)
+
+	@property
+	def report_count(self) -> int:
+		return len(self.report_ids)
+
+	def report_size(self, report_id: int) -> int:
+		'''输入 report 的数据字节数'''
+		return self.__sizes[report_id]
+
+	def report_buffer(self, report_id: int) -> bytearray:
+		'''输入 report 的预分配缓冲区，修改后调用 send_report(report_id) 发送'''
+		return self.__buffers[report_id]
+
+	def output_report(self, report_id: int) -> bytearray:
+		'''输出 report 最近一次被写入的值'''
+		return self.__outputs[report_id]
+	# endregion
+
+
+# 全键无冲键盘位图中第一个 bit 对应的键值（Usage Minimum），即 a
+NKRO_USAGE_MIN = const(0x04)
+
+class HIDKeyboard(HIDDevice):
+	'''
+	键盘设备，输入 report 为 8 字节：修饰键, 保留, 6 个键值
+
+	nkro 为 True 时为全键无冲键盘，输入 report 为：修饰键, 保留, 按键位图，
+	位图中每个 bit 对应一个键值（从 NKRO_USAGE_MIN 开始），
+	同时按下任意数量的按键也只需要发送一次通知
+
+	主机（如 BIOS）将 Protocol Mode 设置为启动协议后，按键改为通过
+	BootKeyboardInputReport 以固定的 8 字节格式发送，多个键盘 report 的按键合并为一个 report，
+	写入 BootKeyboardOutputReport 的 LED 状态同样回调 led_status_cb
+
+	通过 press()/release() 直接修改预分配的 report 缓冲区并发送，
+	press_keys()/release_keys() 修改多个按键后只发送一次：
+
+		keyboard.press(0xE1) # Left Shift
+		keyboard.press(0x04) # a
+		keyboard.press_keys(bytes((0x04, 0x05, 0x06))) # a, b, c
+		keyboard.release_all()
+
+	LED 用途页的输出 report 解析为 led_status_cb(num_lock, caps_lock, scroll_lock)，
+	LED 状态未变化时不回调，其它输出 report 交给 output_cb 或 on_output() 设置的回调
+	'''
+	def __init__(self,
+			device_name: str,
+			report_map: bytes | list,
+			*,
+			nkro: bool = False,
+			led_status_cb: function = None,
+			**kwargs
+		):
+		self.__nkro          = nkro
+		self.__led_status_cb = led_status_cb
+		self.__led_status    = 0
+
+		input_sizes = kwargs.pop('input_sizes', None) or {}
+
+		if not nkro:
+			input_sizes[USAGE_PAGE_KEYBOARD] = 8
+
+		super().__init__(device_name, report_map,
+			input_sizes=input_sizes,
+			**kwargs
+		)
+
+		for report_id, report_type, _, usage_page in self.reports:
+			if report_type == REPORT_TYPE_OUTPUT and usage_page == USAGE_PAGE_LED:
+				self.on_output(report_id, self.__on_led_report)
+
+		# MicroPython 不会改写双下划线属性名，子类的私有属性不能与 HIDDevice 的同名
+		# report_id 参数均为键盘输入 report 的序号，其它用途页的 report（如复合设备中的鼠标）不计入
+		self.__report_ids = tuple(report_id for report_id, report_type, _, usage_page in self.reports
+			if report_type == REPORT_TYPE_INPUT and usage_page == USAGE_PAGE_KEYBOARD)
+		self.__key_buffers = tuple(self.report_buffer(report_id) for report_id in self.__report_ids)
+
+		# 启动协议使用固定的 8 字节格式，与 report map 无关
+		self.__boot_buffer = bytearray(8)
+		self.__boot_output = bytearray(1)
+		self.__handle_boot_input = self.handles['BootKeyboardInputReport']
+
+		self.handles.on_write(self.handles['BootKeyboardOutputReport'], self.__on_write_boot_output)
+
+	def __on_led_report(self, report_id: int, value: bytearray):
+		# 启动协议和 report 协议的 LED 状态相同时只回调一次
+		if value[0] == self.__led_status:
+			return
+
+		self.__led_status = value = value[0]
+
+		num_lock = (value >> 0) & 1
+		caps_lock = (value >> 1) & 1
+		scroll_lock = (value >> 2) & 1
+
+		if self.__led_status_cb is not None:
+			self.__led_status_cb(num_lock, caps_lock, scroll_lock)
+
+	def __on_write_boot_output(self, conn_handle, attr_handle):
+		if update_buffer(self.__boot_output, self.ble.gatts_read(attr_handle)):
+			self.__on_led_report(0, self.__boot_output)
+
+	def __send(self, report_id: int):
+		if self.protocol_mode == PROTOCOL_BOOT:
+			self.__send_boot()
+		else:
+			self.send_report(self.__report_ids[report_id])
+
+	def __add_boot_key(self, keycode: int, index: int) -> int:
+		'''将键值加入启动协议 report，返回下一个位置，超过 6 个按键时返回值大于 8'''
+		boot = self.__boot_buffer
+
+		# 多个 report 中按下同一个按键时只计一次
+		for offset in range(2, min(index, 8)):
+			if boot[offset] == keycode:
+				return index
+
+		if index < 8:
+			boot[index] = keycode
+
+		return index + 1
+
+	def __send_boot(self):
+		'''
+		合并全部键盘 report 的按键状态，通过启动协议键盘输入 report 以固定的 8 字节格式发送，
+		多个 report 共用一个启动协议 report，分别发送会互相覆盖主机端的按键状态
+		'''
+		boot     = self.__boot_buffer
+		modifier = 0
+		index    = 2
+
+		for buffer in self.__key_buffers:
+			modifier |= buffer[0]
+
+			if self.__nkro:
+				# 全键无冲位图转换为键值
+				for offset in range(2, len(buffer)):
+					bits = buffer[offset]
+
+					if not bits:
+						continue
+
+					for bit in range(8):
+						if bits & (1 << bit):
+							index = self.__add_boot_key(NKRO_USAGE_MIN + ((offset - 2) << 3) + bit, index)
+			else:
+				for offset in range(2, 8):
+					if buffer[offset]:
+						index = self.__add_boot_key(buffer[offset], index)
+
+		boot[0] = modifier
+		boot[1] = 0
+
+		if index > 8:
+			# 超过 6 个按键时按规范全部填充 ErrorRollOver，修饰键照常发送
+			for offset in range(2, 8):
+				boot[offset] = 0x01
+		else:
+			for offset in range(index, 8):
+				boot[offset] = 0
+
+		self.notify(self.__handle_boot_input, boot)
+
+	def __set_key(self, buffer: bytearray, keycode: int, pressed: bool) -> bool:
+		'''修改缓冲区中的按键状态，返回缓冲区是否发生变化'''
+		if 0xE0 <= keycode <= 0xE7:
+			index, mask = 0, 1 << (keycode - 0xE0)
+		elif self.__nkro:
+			offset = keycode - NKRO_USAGE_MIN
+			index, mask = 2 + (offset >> 3), 1 << (offset & 0x07)
+
+			if offset < 0 or index >= len(buffer):
+				return False
+		else:
+			free = 0
+
+			for index in range(7, 1, -1):
+				if buffer[index] == keycode:
+					if not pressed:
+						buffer[index] = 0
+
+					return not pressed
+
+				if buffer[index] == 0:
+					free = index
+
+			# 6 个键位已满时忽略新按键
+			if pressed and free:
+				buffer[free] = keycode
+				return True
+
+			return False
+
+		value = buffer[index] | mask if pressed else buffer[index] & ~mask
+
+		if value == buffer[index]:
+			return False
+
+		buffer[index] = value
+		return True
+
+	def press(self, keycode: int, report_id: int = 0):
+		'''按下按键，0xE0~0xE7 为修饰键，按键状态未变化时不发送'''
+		if self.__set_key(self.__key_buffers[report_id], keycode, True):
+			self.__send(report_id)
+
+	def release(self, keycode: int, report_id: int = 0):
+		if self.__set_key(self.__key_buffers[report_id], keycode, False):
+			self.__send(report_id)
+
+	def press_keys(self, keycodes: bytes | bytearray, report_id: int = 0):
+		'''同时按下多个按键，只发送一次'''
+		buffer  = self.__key_buffers[report_id]
+		changed = False
+
+		for keycode in keycodes:
+			changed = self.__set_key(buffer, keycode, True) or changed
+
+		if changed:
+			self.__send(report_id)
+
+	def release_keys(self, keycodes: bytes | bytearray, report_id: int = 0):
+		buffer  = self.__key_buffers[report_id]
+		changed = False
+
+		for keycode in keycodes:
+			changed = self.__set_key(buffer, keycode, False) or changed
+
+		if changed:
+			self.__send(report_id)
+
+	def release_all(self, report_id: int = 0):
+		buffer = self.__key_buffers[report_id]
+
+		for index in range(len(buffer)):
+			buffer[index] = 0
+
+		self.__send(report_id)
+
+	def set_key(self, keycode: int, pressed: bool, report_id: int = 0) -> bool:
+		'''只修改缓冲区中的按键状态而不发送，返回状态是否发生变化，配合 send() 使用'''
+		return self.__set_key(self.__key_buffers[report_id], keycode, pressed)
+
+	def send(self, report_id: int = 0):
+		'''发送缓冲区中当前的按键状态'''
+		self.__send(report_id)
+
+	def send_kb_key(self, key_data: bytes | bytearray, report_id: int = 0):
+		if self.protocol_mode == PROTOCOL_BOOT:
+			# 启动协议需要合并全部 report 的状态，因此先写入该 report 的缓冲区
+			buffer = self.__key_buffers[report_id]
+
+			for index in range(min(len(buffer), len(key_data))):
+				buffer[index] = key_data[index]
+
+			self.__send_boot()
+		else:
+			self.send_report(self.__report_ids[report_id], key_data)
+
+	@property
+	def nkro(self) -> bool:
+		return self.__nkro
+# endregion
@@ -0,0 +1,30 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+由 scripts/gen_profiles.py 根据 scripts/specs/generic.py 自动生成，请勿手动修改
+"""
+from ble.uuids import make_uuid
+
+
+# 服务定义，直接用于 gatts_register_services()
+SERVICES = (
+	(make_uuid(0x1800), ( # GenericAccess
+		(make_uuid(0x2A00), 0x000A), # DeviceName
+		(make_uuid(0x2A01), 0x0002), # Appearance
+		(make_uuid(0x2A04), 0x0002), # PPCP
+	)),
+	(make_uuid(0x1801), ( # GenericAttribute
+		(make_uuid(0x2A05), 0x0020), # ServiceChanged
+	)),
+)
+
+SERVICES_UUID = tuple(service[0] for service in SERVICES)
+
+# 特征和描述符名称，顺序与注册服务后得到的句柄一致
+ATTRIBUTES = (
+	'DeviceName',
+	'Appearance',
+	'PPCP',
+	'ServiceChanged',
+)
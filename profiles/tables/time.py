@@ -0,0 +1,24 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+由 scripts/gen_profiles.py 根据 scripts/specs/time.py 自动生成，请勿手动修改
+"""
+from ble.uuids import make_uuid
+
+
+# 服务定义，直接用于 gatts_register_services()
+SERVICES = (
+	(make_uuid(0x1805), ( # CurrentTimeService
+		(make_uuid(0x2A2B), 0x0012), # CurrentTime
+		(make_uuid(0x2A0F), 0x0002), # LocalTimeInformation
+	)),
+)
+
+SERVICES_UUID = tuple(service[0] for service in SERVICES)
+
+# 特征和描述符名称，顺序与注册服务后得到的句柄一致
+ATTRIBUTES = (
+	'CurrentTime',
+	'LocalTimeInformation',
+)
@@ -4,9 +4,9 @@ Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
 from micropython import const
 from struct import pack
-from bluetooth import UUID
 from time import localtime
 from ble import *
+from ble.values import ValueStore
 
 
 # Profile
@@ -86,11 +86,13 @@ class TimeValues(object):
 			}
 
 
-	class CurrentTimeService(object):
+	class CurrentTimeService(ValueStore):
 		def __dir__(self):
 			return [attr for attr in dir(type(self)) if not attr.startswith('_')]
 
 		def __init__(self):
+			super().__init__()
+
 			# current_time related
 			self.__adjust_reason = TimeValues.Consts.AdjustReason.MANUAL
 			self.__fractions256  = 0
@@ -99,6 +101,11 @@ class TimeValues(object):
 			self.__time_zone  = 8.0 # for UTC+8:00, -4.50 for UTC-4:30
 			self.__dst_offset = TimeValues.Consts.DSTOffset.STANDARD
 
+			self.__update_local_time_information()
+
+		def __update_local_time_information(self):
+			self._update('local_time_information', pack('<bB', int(self.__time_zone * 4), self.__dst_offset))
+
 
 		# region Properties
 		@property
@@ -133,6 +140,7 @@ class TimeValues(object):
 		def time_zone(self, value: float):
 			if isinstance(value, float) and -12.00 <= value <= 14.00 and value % 0.25 == 0.0:
 				self.__time_zone = value
+				self.__update_local_time_information()
 
 		@property
 		def dst_offset(self) -> int:
@@ -142,26 +150,27 @@ class TimeValues(object):
 		def dst_offset(self, value: int):
 			if isinstance(value, int) and value in TimeValues.Consts.DSTOffset.OFFSETS:
 				self.__dst_offset = value
+				self.__update_local_time_information()
 
 		@property
 		def local_time_information(self) -> bytes:
-			return pack('<bB', int(self.__time_zone * 4), self.__dst_offset)
+			return self._value('local_time_information')
 		# endregion
 
 
 # region Service
 class CurrentTimeService(Service):
 	def __init__(self):
-		super().__init__(UUID(TimeValues.UUIDS.CURRENT_TIME_SERVICE))
+		super().__init__(make_uuid(TimeValues.UUIDS.CURRENT_TIME_SERVICE))
 # endregion
 
 
 # region Characteristics
 class CurrentTime(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(TimeValues.UUIDS.CURRENT_TIME), Flag.READ_NOTIFY)
+		super().__init__(make_uuid(TimeValues.UUIDS.CURRENT_TIME), Flag.READ_NOTIFY)
 
 class LocalTimeInformation(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(TimeValues.UUIDS.LOCAL_TIME_INFORMATION), Flag.READ)
+		super().__init__(make_uuid(TimeValues.UUIDS.LOCAL_TIME_INFORMATION), Flag.READ)
 # endregion
@@ -2,7 +2,6 @@
 Copyright © 2024 Walkline Wang (https://walkline.wang)
 Gitee: https://gitee.com/walkline/micropython-new-ble-library
 """
-from bluetooth import UUID
 from ble import *
 
 
@@ -35,16 +34,16 @@ class UARTProfile(Profile):
 # region Services
 class UART(Service):
 	def __init__(self):
-		super().__init__(UUID(UUID_NORDIC_UART))
+		super().__init__(make_uuid(UUID_NORDIC_UART))
 # endregion
 
 
 # region Characteristics
 class RX(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_NORDIC_RX), Flag.WRITE)
+		super().__init__(make_uuid(UUID_NORDIC_RX), Flag.WRITE)
 
 class TX(Characteristic):
 	def __init__(self):
-		super().__init__(UUID(UUID_NORDIC_TX), Flag.NOTIFY)
+		super().__init__(make_uuid(UUID_NORDIC_TX), Flag.NOTIFY)
 # endregion
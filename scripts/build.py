@@ -0,0 +1,272 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+根据 abconfig 目录下的设备清单编译或冻结所需模块
+
+	$ python scripts/build.py [device ...] [--manifest] [--no-strip] [--mpy-cross PATH] [--out DIR]
+
+* 清单每行一个文件或目录（以 / 结尾），以 # 开头的行表示从清单中排除
+* 若存在 testing/test_<device>.py，则以其为入口分析导入关系，
+  清单中 profiles/、devices/ 和 testing/ 下未被引用的模块不参与构建
+* 默认调用 mpy-cross 将模块编译为 .mpy 并输出到 build/<device>/，
+  使用 --manifest 时改为生成用于冻结固件的 build/<device>/manifest.py
+* 构建完成后输出每个设备的字节码大小，并生成 build/<device>/bench.py，
+  上传后在开发板上运行即可得到各模块的导入耗时和内存占用
+"""
+import os
+import re
+import sys
+import shutil
+import argparse
+import subprocess
+
+
+ROOT       = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ABCONFIG   = os.path.join(ROOT, 'abconfig')
+STRIPPABLE = ('profiles/', 'devices/', 'testing/')
+
+IMPORT_PATTERN = re.compile(r'^\s*(?:from\s+(\.*[\w.]*)\s+import\s+([^#\n]+)|import\s+([^#\n]+))', re.M)
+
+BENCH_TEMPLATE = '''import gc
+from time import ticks_us, ticks_diff
+
+MODULES = {modules}
+
+for name in MODULES:
+	gc.collect()
+	free  = gc.mem_free()
+	start = ticks_us()
+	__import__(name)
+	elapsed = ticks_diff(ticks_us(), start)
+	gc.collect()
+	print('{{:<48}}{{:>8.2f}} ms{{:>8}} bytes'.format(name, elapsed / 1000, free - gc.mem_free()))
+'''
+
+
+# region Manifest related
+def read_manifest(device: str) -> list:
+	'''展开设备清单，返回相对 ROOT 的 .py 文件列表（使用 / 分隔）'''
+	included, excluded = [], []
+
+	with open(os.path.join(ABCONFIG, device), encoding='utf-8') as file:
+		for line in file:
+			line = line.strip()
+
+			if not line:
+				continue
+
+			if line.startswith('#'):
+				excluded.append(line.lstrip('#').strip().rstrip('/'))
+			else:
+				included.append(line)
+
+	files = []
+
+	for entry in included:
+		path = os.path.join(ROOT, entry)
+
+		if os.path.isdir(path):
+			for folder, _, names in os.walk(path):
+				for name in sorted(names):
+					if name.endswith('.py'):
+						files.append(os.path.relpath(os.path.join(folder, name), ROOT).replace(os.sep, '/'))
+		elif os.path.isfile(path) and entry.endswith('.py'):
+			files.append(entry)
+
+	def is_excluded(file):
+		return any(file == item or file.startswith(item + '/') for item in excluded)
+
+	return sorted({file for file in files if not is_excluded(file)})
+# endregion
+
+
+# region Import analysis related
+def module_name(file: str) -> str:
+	name = file[:-3].replace('/', '.')
+	return name[:-len('.__init__')] if name.endswith('.__init__') else name
+
+def resolve(name: str) -> list:
+	'''模块名 -> 对应文件及其上级包的 __init__.py'''
+	parts = name.split('.')
+	files = []
+
+	for index in range(1, len(parts)):
+		init = '/'.join(parts[:index]) + '/__init__.py'
+
+		if os.path.isfile(os.path.join(ROOT, init)):
+			files.append(init)
+
+	for candidate in ('/'.join(parts) + '.py', '/'.join(parts) + '/__init__.py'):
+		if os.path.isfile(os.path.join(ROOT, candidate)):
+			files.append(candidate)
+			break
+
+	return files
+
+def imports_of(file: str) -> list:
+	'''使用正则而非 ast 扫描，避免依赖特定版本的 CPython 语法'''
+	with open(os.path.join(ROOT, file), encoding='utf-8') as f:
+		source = f.read()
+
+	package = module_name(file) if file.endswith('__init__.py') else module_name(file).rpartition('.')[0]
+	names   = []
+
+	for match in IMPORT_PATTERN.finditer(source):
+		base, targets, plain = match.groups()
+
+		if plain:
+			names.extend(item.split(' as ')[0].strip() for item in plain.split(','))
+			continue
+
+		if base.startswith('.'):
+			level = len(base) - len(base.lstrip('.'))
+			parent = package.split('.')[:len(package.split('.')) - level + 1]
+			base = '.'.join(parent + ([base.lstrip('.')] if base.lstrip('.') else []))
+
+		names.append(base)
+
+		# from package import submodule
+		for item in targets.strip('() ').split(','):
+			item = item.split(' as ')[0].strip()
+
+			if item and item != '*':
+				names.append(f'{base}.{item}')
+
+	files = []
+
+	for name in names:
+		files.extend(resolve(name))
+
+	return files
+
+def reachable(entry: str) -> set:
+	seen, pending = set(), [entry]
+
+	while pending:
+		file = pending.pop()
+
+		if file in seen:
+			continue
+
+		seen.add(file)
+		pending.extend(imports_of(file))
+
+	return seen
+
+def strip(device: str, files: list) -> tuple:
+	'''返回 (保留的文件, 被剔除的文件)'''
+	entry = f'testing/test_{device}.py'
+
+	if not os.path.isfile(os.path.join(ROOT, entry)):
+		return files, []
+
+	used = reachable(entry)
+	kept, stripped = [], []
+
+	for file in files:
+		if file.startswith(STRIPPABLE) and file not in used:
+			stripped.append(file)
+		else:
+			kept.append(file)
+
+	return kept, stripped
+# endregion
+
+
+# region Output related
+def compile_mpy(files: list, output: str, mpy_cross: str) -> dict:
+	sizes = {}
+
+	for file in files:
+		target = os.path.join(output, file[:-3] + '.mpy')
+		os.makedirs(os.path.dirname(target), exist_ok=True)
+
+		subprocess.run([mpy_cross, '-o', target, '-s', file, os.path.join(ROOT, file)], check=True)
+		sizes[file] = os.path.getsize(target)
+
+	return sizes
+
+def write_manifest(files: list, output: str):
+	packages = {}
+
+	for file in files:
+		package, _, rest = file.partition('/')
+		packages.setdefault(package, []).append(rest)
+
+	# base_path 相对于 manifest.py 所在目录解析
+	base_path = os.path.relpath(ROOT, output).replace(os.sep, '/')
+	lines = [f'# generated by scripts/build.py, include it from the board manifest.py']
+
+	for package, names in packages.items():
+		names = ''.join(f'\n\t\t{name!r},' for name in names)
+		lines.append(f'package({package!r}, files=({names}\n\t),\n\tbase_path={base_path!r},\n)')
+
+	with open(os.path.join(output, 'manifest.py'), 'w', encoding='utf-8', newline='\n') as file:
+		file.write('\n\n'.join(lines) + '\n')
+
+def write_bench(files: list, output: str):
+	# 按依赖顺序导入：包和被依赖较多的 ble 模块在前
+	modules = sorted({module_name(file) for file in files if not file.startswith('testing/')},
+		key=lambda name: (not name.startswith('ble'), name.count('.'), name))
+
+	with open(os.path.join(output, 'bench.py'), 'w', encoding='utf-8', newline='\n') as file:
+		file.write(BENCH_TEMPLATE.format(modules=tuple(modules)))
+# endregion
+
+
+def build(device: str, args) -> tuple:
+	files = read_manifest(device)
+	stripped = []
+
+	if not args.no_strip:
+		files, stripped = strip(device, files)
+
+	output = os.path.join(args.out, device)
+
+	if os.path.isdir(output):
+		shutil.rmtree(output)
+
+	os.makedirs(output)
+
+	source_size = sum(os.path.getsize(os.path.join(ROOT, file)) for file in files)
+
+	if args.manifest:
+		write_manifest(files, output)
+		mpy_size = None
+	else:
+		mpy_size = sum(compile_mpy(files, output, args.mpy_cross).values())
+
+	write_bench(files, output)
+
+	return files, stripped, source_size, mpy_size
+
+def main():
+	parser = argparse.ArgumentParser(description='Build abconfig device manifests into .mpy files or a freeze manifest')
+	parser.add_argument('devices', nargs='*', help='device manifests in abconfig/, default: all')
+	parser.add_argument('--manifest', action='store_true', help='generate manifest.py for freezing instead of .mpy files')
+	parser.add_argument('--no-strip', action='store_true', help='keep modules that are not imported by the device')
+	parser.add_argument('--mpy-cross', default='mpy-cross', help='path to mpy-cross, default: mpy-cross')
+	parser.add_argument('--out', default=os.path.join(ROOT, 'build'), help='output directory, default: build/')
+	args = parser.parse_args()
+
+	devices = args.devices or sorted(os.listdir(ABCONFIG))
+
+	if not args.manifest and shutil.which(args.mpy_cross) is None:
+		sys.exit(f'{args.mpy_cross} not found, install it with "pip install mpy-cross" or use --manifest')
+
+	print(f'{"device":<12}{"files":>6}{"stripped":>10}{"source":>10}{"bytecode":>10}')
+
+	for device in devices:
+		files, stripped, source_size, mpy_size = build(device, args)
+
+		print(f'{device:<12}{len(files):>6}{len(stripped):>10}{source_size:>10}{mpy_size if mpy_size is not None else "-":>10}')
+
+		for file in stripped:
+			print(f'{"":<12}- {file}')
+
+	print(f'\nupload build/<device>/ and run bench.py on the board to measure import time')
+
+
+if __name__ == '__main__':
+	main()
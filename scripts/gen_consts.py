@@ -0,0 +1,108 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+根据 ble/consts.py 中的常量类生成扁平常量模块 ble/flat_consts.py
+
+	IRQ.GATTS_WRITE -> IRQ_GATTS_WRITE = const(3)
+
+常量类访问需要先查找全局类对象再查找类属性，扁平常量只需一次全局查找，
+在设备模块中以 _ 开头重新声明时还可以被编译器直接内联。
+
+在 PC 端运行（CPython 3.8+）：
+
+	$ python scripts/gen_consts.py [--check]
+"""
+import os
+import re
+import ast
+import sys
+import argparse
+
+
+ROOT   = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = os.path.join(ROOT, 'ble', 'consts.py')
+TARGET = os.path.join(ROOT, 'ble', 'flat_consts.py')
+
+HEADER = '''"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+由 scripts/gen_consts.py 根据 ble/consts.py 自动生成，请勿手动修改
+"""
+from micropython import const
+'''
+
+
+def prefix_of(class_name: str) -> str:
+	'''ADVType -> ADV_TYPE, IOCapability -> IO_CAPABILITY, IRQ -> IRQ'''
+	return re.sub(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', '_', class_name).upper()
+
+def is_const_call(node) -> bool:
+	return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'const'
+
+def generate(source: str) -> str:
+	lines  = source.splitlines()
+	tree   = ast.parse(source)
+	output = [HEADER]
+
+	for node in tree.body:
+		if not isinstance(node, ast.ClassDef):
+			continue
+
+		prefix  = prefix_of(node.name)
+		renames = {}
+		block   = [f'\n\n# {node.name}']
+
+		for item in node.body:
+			if not (isinstance(item, ast.Assign) and len(item.targets) == 1 and is_const_call(item.value)):
+				continue
+
+			name = item.targets[0].id
+			flat = f'{prefix}_{name}'
+			expr = ast.get_source_segment(source, item.value.args[0])
+
+			# 类内引用的常量（如 READ | WRITE）替换为对应的扁平名称
+			for old, new in renames.items():
+				expr = re.sub(rf'\b{old}\b', new, expr)
+
+			renames[name] = flat
+
+			line    = lines[item.end_lineno - 1]
+			comment = line[item.end_col_offset:].strip()
+
+			block.append(f'{flat} = const({expr}){" " + comment if comment else ""}')
+
+		output.append('\n'.join(block))
+
+	return ''.join(output) + '\n'
+
+def main():
+	parser = argparse.ArgumentParser(description='Generate ble/flat_consts.py from ble/consts.py')
+	parser.add_argument('--check', action='store_true', help='only check whether the generated file is up to date')
+	args = parser.parse_args()
+
+	with open(SOURCE, encoding='utf-8') as file:
+		content = generate(file.read())
+
+	if args.check:
+		try:
+			with open(TARGET, encoding='utf-8') as file:
+				current = file.read()
+		except OSError:
+			current = None
+
+		if current != content:
+			print(f'{os.path.relpath(TARGET, ROOT)} is out of date, run scripts/gen_consts.py')
+			sys.exit(1)
+
+		print(f'{os.path.relpath(TARGET, ROOT)} is up to date')
+	else:
+		with open(TARGET, 'w', encoding='utf-8', newline='\n') as file:
+			file.write(content)
+
+		print(f'{os.path.relpath(TARGET, ROOT)} generated')
+
+
+if __name__ == '__main__':
+	main()
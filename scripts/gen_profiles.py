@@ -0,0 +1,169 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+根据 scripts/specs/ 下的声明式配置文件定义生成服务表模块 profiles/tables/<name>.py
+
+设备启动时直接加载预先生成的 UUID/标志元组，无需逐个创建服务、特征和描述符对象：
+
+	from profiles.tables import findme
+	profile = CompiledProfile(findme)
+
+定义文件为一个字典字面量，flags 可以是 ble/consts.py 中 Flag 的成员名称、
+名称列表（按位或）或整数，uuid 可以是整数或 128 位 UUID 字符串：
+
+	{
+		'services': [
+			{
+				'name': 'ImmediateAlertService',
+				'uuid': 0x1802,
+				'characteristics': [
+					{'name': 'AlertLevel', 'uuid': 0x2A06, 'flags': 'WRITE_NO_RESPONSE',
+					 'descriptors': [{'name': '...', 'uuid': 0x2902, 'flags': 'READ'}]},
+				],
+			},
+		],
+	}
+
+在 PC 端运行（CPython 3.8+）：
+
+	$ python scripts/gen_profiles.py [name ...] [--check]
+"""
+import os
+import ast
+import sys
+import argparse
+
+
+ROOT   = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPECS  = os.path.join(ROOT, 'scripts', 'specs')
+TABLES = os.path.join(ROOT, 'profiles', 'tables')
+CONSTS = os.path.join(ROOT, 'ble', 'consts.py')
+
+HEADER = '''"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+
+由 scripts/gen_profiles.py 根据 scripts/specs/{name}.py 自动生成，请勿手动修改
+"""
+from ble.uuids import make_uuid
+'''
+
+
+def load_flags() -> dict:
+	'''从 ble/consts.py 的 Flag 类中读取标志值'''
+	with open(CONSTS, encoding='utf-8') as file:
+		tree = ast.parse(file.read())
+
+	flags = {}
+
+	for node in tree.body:
+		if isinstance(node, ast.ClassDef) and node.name == 'Flag':
+			for item in node.body:
+				if isinstance(item, ast.Assign) and isinstance(item.value, ast.Call):
+					expr = ast.Expression(item.value.args[0])
+					flags[item.targets[0].id] = eval(compile(expr, CONSTS, 'eval'), {}, dict(flags))
+
+	return flags
+
+def resolve_flags(value, flags: dict) -> int:
+	if isinstance(value, int):
+		return value
+
+	if isinstance(value, str):
+		value = [value]
+
+	result = 0
+
+	for name in value:
+		if name not in flags:
+			raise ValueError(f'unknown flag: {name}')
+
+		result |= flags[name]
+
+	return result
+
+def format_uuid(value) -> str:
+	if isinstance(value, int):
+		return f'make_uuid(0x{value:04X})'
+
+	return f'make_uuid({value!r})'
+
+def entry(item: dict, flags: dict, indent: str) -> str:
+	'''characteristic/descriptor -> (UUID, flags[, descriptors]), 源码'''
+	value = f'{format_uuid(item["uuid"])}, 0x{resolve_flags(item["flags"], flags):04X}'
+
+	if item.get('descriptors'):
+		descriptors = ''.join(f'\n{indent}\t{entry(descriptor, flags, indent + chr(9))}'
+			for descriptor in item['descriptors'])
+		value += f', ({descriptors}\n{indent})'
+
+	return f'({value}), # {item["name"]}'
+
+def generate(name: str, spec: dict, flags: dict) -> str:
+	services   = []
+	attributes = []
+
+	for service in spec['services']:
+		characteristics = []
+
+		for characteristic in service['characteristics']:
+			characteristics.append(f'\n\t\t{entry(characteristic, flags, chr(9) * 2)}')
+			attributes.append(characteristic['name'])
+
+			for descriptor in characteristic.get('descriptors', ()):
+				attributes.append(descriptor['name'])
+
+		services.append(f'\n\t({format_uuid(service["uuid"])}, ( # {service["name"]}{"".join(characteristics)}\n\t)),')
+
+	output = [HEADER.format(name=name)]
+	output.append(f'\n\n# 服务定义，直接用于 gatts_register_services()\nSERVICES = ({"".join(services)}\n)\n')
+	output.append('\nSERVICES_UUID = tuple(service[0] for service in SERVICES)\n')
+	output.append('\n# 特征和描述符名称，顺序与注册服务后得到的句柄一致')
+	output.append(f'\nATTRIBUTES = ({"".join(f"{chr(10)}{chr(9)}{item!r}," for item in attributes)}\n)\n')
+
+	return ''.join(output)
+
+def main():
+	parser = argparse.ArgumentParser(description='Compile declarative profile specs into profiles/tables/')
+	parser.add_argument('names', nargs='*', help='spec names in scripts/specs/, default: all')
+	parser.add_argument('--check', action='store_true', help='only check whether the generated tables are up to date')
+	args = parser.parse_args()
+
+	names = args.names or sorted(file[:-3] for file in os.listdir(SPECS) if file.endswith('.py'))
+	flags = load_flags()
+	stale = []
+
+	os.makedirs(TABLES, exist_ok=True)
+
+	for name in names:
+		with open(os.path.join(SPECS, f'{name}.py'), encoding='utf-8') as file:
+			content = generate(name, ast.literal_eval(file.read()), flags)
+
+		target = os.path.join(TABLES, f'{name}.py')
+
+		if args.check:
+			try:
+				with open(target, encoding='utf-8') as file:
+					current = file.read()
+			except OSError:
+				current = None
+
+			if current != content:
+				stale.append(os.path.relpath(target, ROOT))
+		else:
+			with open(target, 'w', encoding='utf-8', newline='\n') as file:
+				file.write(content)
+
+			print(f'{os.path.relpath(target, ROOT)} generated')
+
+	if args.check:
+		if stale:
+			print('\n'.join(f'{path} is out of date, run scripts/gen_profiles.py' for path in stale))
+			sys.exit(1)
+
+		print('profile tables are up to date')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,16 @@
+# Alert Notification Profile，与 profiles/alert.py 中的 AlertNotificationProfile 一致
+{
+	'services': [
+		{
+			'name': 'AlertNotificationService',
+			'uuid': 0x1811,
+			'characteristics': [
+				{'name': 'SupportedNewAlertCategory',     'uuid': 0x2A47, 'flags': 'READ'},
+				{'name': 'NewAlert',                      'uuid': 0x2A46, 'flags': 'NOTIFY'},
+				{'name': 'SupportedUnreadAlertCategory',  'uuid': 0x2A48, 'flags': 'READ'},
+				{'name': 'UnreadAlertStatus',             'uuid': 0x2A45, 'flags': 'NOTIFY'},
+				{'name': 'AlertNotificationControlPoint', 'uuid': 0x2A44, 'flags': 'WRITE'},
+			],
+		},
+	],
+}
@@ -0,0 +1,12 @@
+# Find Me Profile，与 profiles/findme.py 中的 FindMeProfile 一致
+{
+	'services': [
+		{
+			'name': 'ImmediateAlertService',
+			'uuid': 0x1802,
+			'characteristics': [
+				{'name': 'AlertLevel', 'uuid': 0x2A06, 'flags': 'WRITE_NO_RESPONSE'},
+			],
+		},
+	],
+}
@@ -0,0 +1,21 @@
+# Generic Profile，与 profiles/generic.py 中的 GenericProfile 一致
+{
+	'services': [
+		{
+			'name': 'GenericAccess',
+			'uuid': 0x1800,
+			'characteristics': [
+				{'name': 'DeviceName', 'uuid': 0x2A00, 'flags': 'READ_WRITE'},
+				{'name': 'Appearance', 'uuid': 0x2A01, 'flags': 'READ'},
+				{'name': 'PPCP',       'uuid': 0x2A04, 'flags': 'READ'},
+			],
+		},
+		{
+			'name': 'GenericAttribute',
+			'uuid': 0x1801,
+			'characteristics': [
+				{'name': 'ServiceChanged', 'uuid': 0x2A05, 'flags': 'INDICATE'},
+			],
+		},
+	],
+}
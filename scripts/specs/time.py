@@ -0,0 +1,13 @@
+# Time Profile，与 profiles/time.py 中的 TimeProfile 一致
+{
+	'services': [
+		{
+			'name': 'CurrentTimeService',
+			'uuid': 0x1805,
+			'characteristics': [
+				{'name': 'CurrentTime',          'uuid': 0x2A2B, 'flags': 'READ_NOTIFY'},
+				{'name': 'LocalTimeInformation', 'uuid': 0x2A0F, 'flags': 'READ'},
+			],
+		},
+	],
+}
@@ -0,0 +1,71 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+from time import ticks_us, ticks_diff
+from micropython import const
+from ble.consts import IRQ
+from ble.flat_consts import *
+
+
+ROUNDS = 10000
+
+# 模块内以 _ 开头的常量由编译器直接内联
+_IRQ_CENTRAL_CONNECT    = const(1)
+_IRQ_CENTRAL_DISCONNECT = const(2)
+_IRQ_GATTS_WRITE        = const(3)
+_IRQ_CONNECTION_UPDATE  = const(27)
+_IRQ_MTU_EXCHANGED      = const(21)
+
+# 模拟设备 IRQ 回调中最常见的几个分支，取最靠后的分支测量最坏情况
+def dispatch_class(event):
+	if event == IRQ.CENTRAL_CONNECT:
+		return 1
+	elif event == IRQ.CENTRAL_DISCONNECT:
+		return 2
+	elif event == IRQ.CONNECTION_UPDATE:
+		return 3
+	elif event == IRQ.MTU_EXCHANGED:
+		return 4
+	elif event == IRQ.GATTS_WRITE:
+		return 5
+
+def dispatch_flat(event):
+	if event == IRQ_CENTRAL_CONNECT:
+		return 1
+	elif event == IRQ_CENTRAL_DISCONNECT:
+		return 2
+	elif event == IRQ_CONNECTION_UPDATE:
+		return 3
+	elif event == IRQ_MTU_EXCHANGED:
+		return 4
+	elif event == IRQ_GATTS_WRITE:
+		return 5
+
+def dispatch_inline(event):
+	if event == _IRQ_CENTRAL_CONNECT:
+		return 1
+	elif event == _IRQ_CENTRAL_DISCONNECT:
+		return 2
+	elif event == _IRQ_CONNECTION_UPDATE:
+		return 3
+	elif event == _IRQ_MTU_EXCHANGED:
+		return 4
+	elif event == _IRQ_GATTS_WRITE:
+		return 5
+
+def measure(title: str, dispatch: function):
+	event = IRQ_GATTS_WRITE
+	start = ticks_us()
+
+	for _ in range(ROUNDS):
+		dispatch(event)
+
+	elapsed = ticks_diff(ticks_us(), start)
+	print(f'{title:<28}{elapsed / ROUNDS:>8.2f} us/dispatch')
+
+
+if __name__ == '__main__':
+	measure('class attribute (IRQ.X)', dispatch_class)
+	measure('flat const (IRQ_X)', dispatch_flat)
+	measure('inlined const (_IRQ_X)', dispatch_inline)
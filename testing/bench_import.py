@@ -0,0 +1,54 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+import gc
+import sys
+from time import ticks_us, ticks_diff
+
+
+def measure(module_name: str, attr: str = None) -> tuple:
+	'''导入指定模块（或访问其属性），返回 (耗时 us, 内存增量 bytes)'''
+	gc.collect()
+	free  = gc.mem_free()
+	start = ticks_us()
+
+	module = __import__(module_name, None, None, (attr,) if attr else ())
+
+	if attr:
+		getattr(module, attr)
+
+	elapsed = ticks_diff(ticks_us(), start)
+	gc.collect()
+
+	return elapsed, free - gc.mem_free()
+
+def report(title: str, result: tuple):
+	print(f'{title:<36}{result[0] / 1000:>8.2f} ms{result[1]:>8} bytes')
+
+
+# 按需加载的属性，每个子模块只需访问其中一个
+LAZY_ATTRS = (
+	('ValueStore', 'ble.values'),
+	('load_secrets', 'ble.secrets (json, binascii)'),
+)
+
+
+if __name__ == '__main__':
+	# 必须在软复位后第一个运行，否则模块已被缓存
+	if 'ble' in sys.modules:
+		print('ble already imported, soft reset (ctrl + d) and run again')
+	else:
+		baseline = measure('ble')
+		elapsed, memory = baseline
+
+		report('import ble (baseline)', baseline)
+
+		for attr, title in LAZY_ATTRS:
+			result   = measure('ble', attr)
+			elapsed += result[0]
+			memory  += result[1]
+
+			report(f'  + {title}', result)
+
+		report('import ble + all lazy parts', (elapsed, memory))
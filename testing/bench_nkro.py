@@ -0,0 +1,113 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+import profiles.hid
+from time import sleep_ms, ticks_us, ticks_diff
+from testing.utils.recorder import BLERecorder
+from testing.utils.utilities import Utilities
+
+
+MODE_MULTI_REPORTS = 0
+MODE_NKRO          = 1
+
+ROUNDS   = 50
+INTERVAL = 50 # 每轮之间的间隔（毫秒），避免控制器缓冲区被占满
+
+# 同时按下 18 个按键：a ~ r
+KEYCODES = bytes(range(0x04, 0x16))
+
+def create_keyboard(keyboard_class, **kwargs) -> tuple:
+	'''构造键盘并等待主机连接，返回 (键盘, BLERecorder)，通知数量按实际调用 gatts_notify 的次数统计'''
+	recorder = BLERecorder()
+	recorder.install(profiles.hid)
+
+	keyboard = keyboard_class(**kwargs)
+	recorder.uninstall()
+
+	print('Waiting for connection...')
+
+	while not keyboard.conn_handles:
+		sleep_ms(100)
+
+	# 等待主机完成配对和订阅，不统计连接期间的电量等通知
+	sleep_ms(3000)
+	recorder.reset()
+
+	return keyboard, recorder
+
+def report(title: str, elapsed: list, notifications: int, dropped: int):
+	elapsed = sorted(elapsed)
+
+	print(f'{title}:')
+	print(f'  chords:        {ROUNDS} x {len(KEYCODES)} keys')
+	print(f'  notifications: {notifications // ROUNDS} per chord (press + release), {notifications} sent')
+	print(f'  send time:     {sum(elapsed) // len(elapsed)} us avg, {elapsed[len(elapsed) // 2]} us median, {elapsed[-1]} us max')
+	print(f'  dropped:       {dropped}')
+
+def run_multi_reports_bench():
+	'''3 个 8 字节 report，每个 report 携带 6 个键值'''
+	from devices.hid.keyboard_1.keyboard import BLEKeyboard104
+	from devices.hid.keyboard_1.reportmap.keyboard2 import REPORT_MAP_DATA
+
+	keyboard, recorder = create_keyboard(BLEKeyboard104, report_map=REPORT_MAP_DATA)
+
+	count   = keyboard.report_count
+	chunks  = tuple(KEYCODES[index * 6:index * 6 + 6] for index in range(count))
+	elapsed = []
+	dropped = 0
+
+	for _ in range(ROUNDS):
+		start = ticks_us()
+
+		try:
+			for report_id in range(count):
+				keyboard.press_keys(chunks[report_id], report_id)
+
+			for report_id in range(count):
+				keyboard.release_all(report_id)
+		except OSError:
+			dropped += 1
+
+		elapsed.append(ticks_diff(ticks_us(), start))
+		sleep_ms(INTERVAL)
+
+	report('Multiple reports', elapsed, recorder.count('gatts_notify'), dropped)
+
+def run_nkro_bench():
+	'''1 个位图 report，每个 bit 对应一个键值'''
+	from devices.hid.keyboard_2.keyboard import BLEKeyboard104
+
+	keyboard, recorder = create_keyboard(BLEKeyboard104)
+
+	elapsed = []
+	dropped = 0
+
+	for _ in range(ROUNDS):
+		start = ticks_us()
+
+		try:
+			keyboard.press_keys(KEYCODES)
+			keyboard.release_all()
+		except OSError:
+			dropped += 1
+
+		elapsed.append(ticks_diff(ticks_us(), start))
+		sleep_ms(INTERVAL)
+
+	report('NKRO bitmap', elapsed, recorder.count('gatts_notify'), dropped)
+
+
+if __name__ == '__main__':
+	options = [
+		'Multiple reports: press 18 keys via 3 reports',
+		'NKRO bitmap: press 18 keys via 1 report',
+	]
+
+	mode = Utilities.choose_an_option('NKRO Benchmark Mode', options)
+
+	if mode is not None:
+		if mode == MODE_MULTI_REPORTS:
+			run_multi_reports_bench()
+		else:
+			run_nkro_bench()
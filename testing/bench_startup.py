@@ -0,0 +1,112 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+import bluetooth
+from time import ticks_ms, ticks_diff
+from testing.utils.utilities import Utilities
+
+
+MODE_UART     = 0
+MODE_KEYBOARD = 1
+MODE_REGISTER = 2
+
+def report(title: str, start: int, imported: int, advertised: int):
+	print(f'{title}:')
+	print(f'  import:       {ticks_diff(imported, start)} ms')
+	print(f'  construct:    {ticks_diff(advertised, imported)} ms')
+	print(f'  total:        {ticks_diff(advertised, start)} ms (import -> first advertisement)')
+
+def stop_advertising():
+	'''
+	热启动前停止广播：NimBLE 在广播期间无法重新注册服务（BLE_HS_EBUSY），
+	BLE 对象为单例，与设备内部使用的是同一个
+	'''
+	bluetooth.BLE().gap_advertise(None)
+
+def run_uart_bench():
+	start = ticks_ms()
+	from devices.uart.bleuart import BLEUART
+	imported = ticks_ms()
+
+	# 设备构造函数最后一步即开始广播
+	BLEUART()
+	advertised = ticks_ms()
+
+	report('Cold start', start, imported, advertised)
+
+	stop_advertising()
+
+	# 协议栈已激活，配置未变化，跳过重启和重复配置
+	start = ticks_ms()
+	BLEUART()
+	advertised = ticks_ms()
+
+	report('Warm start', start, start, advertised)
+
+def run_keyboard_bench():
+	start = ticks_ms()
+	from devices.hid.keyboard_1.keyboard import BLEKeyboard104
+	imported = ticks_ms()
+
+	BLEKeyboard104()
+	advertised = ticks_ms()
+
+	report('Cold start', start, imported, advertised)
+
+	stop_advertising()
+
+	start = ticks_ms()
+	BLEKeyboard104()
+	advertised = ticks_ms()
+
+	report('Warm start', start, start, advertised)
+
+def run_register_bench():
+	'''构造键盘设备，按 BLERecorder 记录的调用时间划分注册服务、写入特征值和开始广播的耗时'''
+	import profiles.hid
+	from devices.hid.keyboard_1.keyboard import BLEKeyboard104
+	from testing.utils.recorder import BLERecorder
+
+	# 先构造一次以激活协议栈，之后只测量设备自身的注册流程
+	BLEKeyboard104()
+	stop_advertising()
+
+	recorder = BLERecorder()
+	recorder.install(profiles.hid)
+
+	start = ticks_ms()
+	BLEKeyboard104()
+	advertised = ticks_ms()
+
+	recorder.uninstall()
+	stop_advertising()
+
+	registering = recorder.started('gatts_register_services')
+	registered  = recorder.finished('gatts_register_services')
+	initialized = recorder.finished('gatts_write')
+
+	print('Keyboard registration:')
+	print(f'  prepare:      {ticks_diff(registering, start)} ms')
+	print(f'  register:     {ticks_diff(registered, registering)} ms')
+	print(f'  initialize:   {ticks_diff(initialized, registered)} ms ({recorder.count("gatts_write")} values)')
+	print(f'  advertise:    {ticks_diff(advertised, initialized)} ms')
+	print(f'  total:        {ticks_diff(advertised, start)} ms (construct -> first advertisement)')
+
+
+if __name__ == '__main__':
+	options = [
+		'BLE UART: measure milliseconds from import to first advertisement',
+		'Keyboard: measure milliseconds from import to first advertisement',
+		'Keyboard: measure milliseconds from service registration to first advertisement',
+	]
+
+	mode = Utilities.choose_an_option('Startup Benchmark Mode', options)
+
+	if mode is not None:
+		if mode == MODE_UART:
+			run_uart_bench()
+		elif mode == MODE_KEYBOARD:
+			run_keyboard_bench()
+		else:
+			run_register_bench()
@@ -0,0 +1,106 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+from time import sleep_ms, ticks_ms, ticks_diff
+from errno import ENOMEM
+from devices.hid.scheduler import KeystrokeScheduler
+from devices.hid.text import type_text, LAYOUT_US
+from testing.utils.utilities import Utilities
+
+
+TEXT = 'The quick brown fox jumps over the lazy dog. 0123456789!\n' * 4
+
+# 模拟链路：每个连接间隔最多发送 CAPACITY 个 report，超出时与控制器一样抛出 ENOMEM
+CAPACITY = 1
+
+
+class SimulatedKeyboard(object):
+	'''模拟已连接的 6 键键盘，只实现 KeystrokeScheduler 使用的接口'''
+	def __init__(self, interval_ms: int):
+		self.__interval_ms = interval_ms
+		self.__buffer = bytearray(8)
+		self.__window = ticks_ms()
+		self.__sent   = 0
+
+		self.reports = 0
+		self.dropped = 0
+
+	def set_key(self, keycode: int, pressed: bool, report_id: int = 0) -> bool:
+		buffer = self.__buffer
+
+		if 0xE0 <= keycode <= 0xE7:
+			value = buffer[0] | (1 << (keycode - 0xE0)) if pressed else buffer[0] & ~(1 << (keycode - 0xE0))
+			changed = value != buffer[0]
+			buffer[0] = value
+			return changed
+
+		for index in range(2, 8):
+			if pressed and buffer[index] == 0:
+				buffer[index] = keycode
+				return True
+
+			if not pressed and buffer[index] == keycode:
+				buffer[index] = 0
+				return True
+
+		return False
+
+	def send(self, report_id: int = 0):
+		now = ticks_ms()
+
+		if ticks_diff(now, self.__window) >= self.__interval_ms:
+			self.__window = now
+			self.__sent   = 0
+
+		if self.__sent >= CAPACITY:
+			self.dropped += 1
+			raise OSError(ENOMEM)
+
+		self.__sent  += 1
+		self.reports += 1
+
+	@property
+	def conn_handles(self) -> tuple:
+		return (0,)
+
+	@property
+	def suspended(self) -> bool:
+		return False
+
+	@property
+	def connection_interval(self) -> int:
+		return self.__interval_ms
+
+
+def run_typing_bench(interval_ms: int):
+	keyboard  = SimulatedKeyboard(interval_ms)
+	scheduler = KeystrokeScheduler(keyboard)
+
+	index = 0
+	start = ticks_ms()
+
+	while index < len(TEXT) or scheduler.busy:
+		if index < len(TEXT):
+			index = type_text(scheduler, TEXT, LAYOUT_US, index)
+
+		sleep_ms(1)
+
+	elapsed = ticks_diff(ticks_ms(), start)
+
+	print(f'Connection interval {interval_ms} ms:')
+	print(f'  characters:   {len(TEXT)}')
+	print(f'  reports:      {keyboard.reports} ({keyboard.reports / len(TEXT):.2f} per character)')
+	print(f'  ENOMEM:       {keyboard.dropped}')
+	print(f'  elapsed:      {elapsed} ms')
+	print(f'  speed:        {len(TEXT) * 1000 / elapsed:.1f} characters/s')
+
+
+if __name__ == '__main__':
+	intervals = (8, 15, 30, 45)
+	options = [f'Type {len(TEXT)} characters over a simulated link, connection interval {interval} ms' for interval in intervals]
+
+	mode = Utilities.choose_an_option('Typing Benchmark Mode', options)
+
+	if mode is not None:
+		run_typing_bench(intervals[mode])
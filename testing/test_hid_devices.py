@@ -0,0 +1,129 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+from testing.utils.utilities import Utilities
+
+
+# 依次创建各 HID 设备，检查每个输入 report 的缓冲区并各发送一次，
+# 再调用设备的按键接口，确认修改的是对应 Report ID 的缓冲区；
+# 子类与 HIDDevice 的私有属性同名时（MicroPython 不会改写双下划线属性名）会在这里出错，
+# 无需连接主机
+
+def check_device(name: str, device, steps: tuple):
+	failed = 0
+
+	for report_id in device.report_ids:
+		buffer = device.report_buffer(report_id)
+
+		if len(buffer) != device.report_size(report_id):
+			print(f'  [FAIL] report {report_id}: buffer is {len(buffer)} bytes, expected {device.report_size(report_id)}')
+			failed += 1
+
+		device.send_report(report_id)
+
+	for title, action, report_id, expected in steps:
+		action()
+
+		value = bytes(device.report_buffer(report_id)[:len(expected)])
+
+		if value != expected:
+			print(f'  [FAIL] {title}: report {report_id} is {value}, expected {expected}')
+			failed += 1
+
+	print(f'{name}: {len(device.report_ids)} report(s), {len(steps)} step(s), {"ok" if not failed else f"{failed} failed"}')
+
+	# 停止广播，否则创建下一个设备时注册服务会失败
+	device.ble.gap_advertise(None)
+
+	return failed
+
+def check_keyboard_1():
+	from devices.hid.keyboard_1.keyboard import BLEKeyboard104
+
+	keyboard  = BLEKeyboard104()
+	report_id = keyboard.report_ids[0]
+
+	return check_device('keyboard_1', keyboard, (
+		('press a', lambda: keyboard.press(0x04), report_id, b'\x00\x00\x04'),
+		('press_keys b, c', lambda: keyboard.press_keys(b'\x05\x06'), report_id, b'\x00\x00\x04\x05\x06'),
+		('release_all', lambda: keyboard.release_all(), report_id, bytes(8)),
+	))
+
+def check_keyboard_2():
+	from devices.hid.keyboard_2.keyboard import BLEKeyboard104
+
+	keyboard  = BLEKeyboard104()
+	report_id = keyboard.report_ids[0]
+
+	return check_device('keyboard_2', keyboard, (
+		('press Left Shift', lambda: keyboard.press(0xE1), report_id, b'\x02'),
+		('press a, b', lambda: keyboard.press_keys(b'\x04\x05'), report_id, b'\x02\x00\x03'),
+		('release_all', lambda: keyboard.release_all(), report_id, bytes(3)),
+	))
+
+def check_keyboard_3():
+	from devices.hid.keyboard_3.keyboard import BLEKeyboard104
+
+	keyboard  = BLEKeyboard104()
+	report_id = keyboard.report_ids[0]
+
+	return check_device('keyboard_3', keyboard, (
+		('press a', lambda: keyboard.press(0x04), report_id, b'\x00\x00\x01'),
+		('send_tx_data', lambda: keyboard.send_tx_data(b'check'), report_id, b'\x00\x00\x01'),
+		('release a', lambda: keyboard.release(0x04), report_id, bytes(3)),
+	))
+
+def check_volume():
+	from devices.hid.volume.volume import BLEVolumeKey
+
+	volume = BLEVolumeKey()
+	report_1, report_2 = volume.report_ids
+
+	return check_device('volume', volume, (
+		('send_volume_up_1', volume.send_volume_up_1, report_1, bytes([volume.REPORT_1_VOL_UP])),
+		('send_volume_up_2', volume.send_volume_up_2, report_2, bytes([volume.REPORT_2_VOL_UP])),
+		('send_volume_release_1', volume.send_volume_release_1, report_1, b'\x00'),
+		('send_volume_release_2', volume.send_volume_release_2, report_2, b'\x00'),
+	))
+
+def check_composite():
+	from devices.hid.composite.composite import BLECompositeHID
+	from devices.hid.composite.reportmap import REPORT_ID_KEYBOARD, REPORT_ID_CONSUMER, REPORT_ID_MOUSE
+
+	device = BLECompositeHID()
+
+	return check_device('composite', device, (
+		('press a', lambda: device.press(0x04), REPORT_ID_KEYBOARD, b'\x00\x00\x04'),
+		('consumer_press', lambda: device.consumer_press(device.CONSUMER_VOLUME_UP), REPORT_ID_CONSUMER, b'\xE9\x00'),
+		('mouse_move 300, -200', lambda: device.mouse_move(300, -200), REPORT_ID_MOUSE, bytes(4)),
+		('mouse_press', lambda: device.mouse_press(device.MOUSE_LEFT), REPORT_ID_MOUSE, b'\x01'),
+		('release_all', lambda: device.release_all(), REPORT_ID_KEYBOARD, bytes(8)),
+		('consumer_release', lambda: device.consumer_release(), REPORT_ID_CONSUMER, b'\x00\x00'),
+		('mouse_release', lambda: device.mouse_release(), REPORT_ID_MOUSE, b'\x00'),
+	))
+
+def check_mouse():
+	from devices.hid.mouse.mouse import BLEMouse
+
+	mouse     = BLEMouse()
+	report_id = mouse.report_ids[0]
+
+	return check_device('mouse', mouse, (
+		('press left', lambda: mouse.press(mouse.LEFT), report_id, b'\x01'),
+	))
+
+
+CHECKS = (check_keyboard_1, check_keyboard_2, check_keyboard_3, check_volume, check_composite, check_mouse)
+
+
+if __name__ == '__main__':
+	options = [f'Check {check.__name__[6:]}' for check in CHECKS] + ['Check all HID devices']
+
+	mode = Utilities.choose_an_option('HID Device Check', options)
+
+	if mode is not None:
+		checks = CHECKS if mode == len(CHECKS) else (CHECKS[mode],)
+		failed = sum(check() for check in checks)
+
+		print(f'{len(checks)} device(s) checked, {failed} failure(s)')
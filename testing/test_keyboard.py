@@ -13,12 +13,16 @@ MODE_THREE_REPORTS   = 1
 MODE_PRESS_18_KEYS   = 2
 MODE_PRESS_95_KEYS   = 3
 MODE_CONSUMER_VOLUME = 4
+MODE_QUEUE_TYPING    = 5
+MODE_MACRO_PLAYBACK  = 6
+MODE_COMPOSITE       = 7
+MODE_MOUSE           = 8
+MODE_BATTERY         = 9
 
 
 class KeyboardTest1(object):
 	def __init__(self, mode: int = MODE_ONE_REPORT, button_pin: int = 9):
 		self.__last_key_code  = None
-		self.__last_key_index = None
 		self.__last_report_id = None
 
 		self.__report_count = 3 if mode in (MODE_THREE_REPORTS, MODE_PRESS_18_KEYS) else 1
@@ -28,7 +32,6 @@ class KeyboardTest1(object):
 
 		self.__keyboard = BLEKeyboard104(
 			report_map=REPORT_MAP_DATA if self.__report_count == 3 else None,
-			report_count=self.__report_count,
 			led_status_cb=self.__led_status_cb
 		)
 
@@ -39,28 +42,21 @@ class KeyboardTest1(object):
 			click_cb=self.__button_click_cb if mode in (MODE_PRESS_18_KEYS,) else None
 		)
 
-		self.__keyboard.update_battery_level()
+		self.__keyboard.update_battery_level(randint(1, 80))
 
 	def __button_down_cb(self, pin: int):
 		self.__last_key_code  = randint(4, 39)
-		self.__last_key_index = randint(2, 7)
 		self.__last_report_id = randint(0, self.__report_count - 1)
 
-		modifier  = 0b00000000 # RGUI, RAlt, RShift, RCtrl, LGUI, LAlt, LShift, LCtrl
-		key_data  = bytearray([modifier, 0x00]) + bytes(6)
-
-		print(f'[DN] report_id: {self.__last_report_id}, key_index: {self.__last_key_index}, key_code: {self.__last_key_code}')
+		print(f'[DN] report_id: {self.__last_report_id}, key_code: {self.__last_key_code}')
 
-		key_data[self.__last_key_index] = self.__last_key_code
-		self.__keyboard.send_kb_key(key_data, self.__last_report_id)
+		# 直接修改键盘预分配的 report 缓冲区，按键过程不产生内存分配
+		self.__keyboard.press(self.__last_key_code, self.__last_report_id)
 
 	def __button_up_cb(self, pin: int):
-		modifier = 0b00000000
-		key_data = bytearray([modifier, 0x00]) + bytes(6)
-
-		print(f'[UP] report_id: {self.__last_report_id}, key_index: {self.__last_key_index}, key_code: {self.__last_key_code}\n')
+		print(f'[UP] report_id: {self.__last_report_id}, key_code: {self.__last_key_code}\n')
 
-		self.__keyboard.send_kb_key(key_data, self.__last_report_id)
+		self.__keyboard.release(self.__last_key_code, self.__last_report_id)
 
 	def __button_click_cb(self, pin: int):
 		modifier  = 0b00000000
@@ -96,7 +92,7 @@ class KeyboardTest2(object):
 			release_cb=self.__button_up_cb,
 		)
 
-		self.__keyboard.update_battery_level()
+		self.__keyboard.update_battery_level(randint(1, 80))
 
 	def __button_down_cb(self, pin: int):
 		modifier  = 0b00000000
@@ -121,16 +117,159 @@ class KeyboardTest2(object):
 		print('scroll_lock:', scroll_lock)
 
 
+class KeystrokeQueueTest(object):
+	# hello world（键值）
+	KEYCODES = bytes([0x0B, 0x08, 0x0F, 0x0F, 0x12, 0x2C, 0x1A, 0x12, 0x15, 0x0F, 0x07])
+
+	def __init__(self, button_pin: int = 9):
+		self.__keyboard  = BLEKeyboard104()
+		self.__scheduler = KeystrokeScheduler(self.__keyboard)
+
+		self.__button = Button(
+			pin=[button_pin],
+			click_cb=self.__button_click_cb,
+		)
+
+		self.__keyboard.update_battery_level(randint(1, 80))
+
+	def __button_click_cb(self, pin: int):
+		print(f'Typing {len(self.KEYCODES)} keys, connection interval: {self.__keyboard.connection_interval} ms')
+
+		# 首字母大写
+		self.__scheduler.tap(self.KEYCODES[0], 0xE1)
+
+		for keycode in self.KEYCODES[1:]:
+			self.__scheduler.tap(keycode)
+
+
+class MacroPlaybackTest(object):
+	MACRO_FILE = 'macro.bin'
+
+	def __init__(self, button_pin: int = 9):
+		self.__keyboard = BLEKeyboard104()
+		self.__player   = MacroPlayer(self.__keyboard, self.MACRO_FILE, done_cb=self.__done_cb)
+
+		self.__record_macro()
+
+		self.__button = Button(
+			pin=[button_pin],
+			click_cb=self.__button_click_cb,
+		)
+
+		self.__keyboard.update_battery_level(randint(1, 80))
+
+	def __record_macro(self):
+		'''录制 100 遍 hello world，每个按键按下 30ms，间隔 50ms'''
+		report_id = self.__keyboard.report_ids[0]
+		key_data  = bytearray(8)
+		recorder  = MacroRecorder(self.MACRO_FILE)
+
+		for _ in range(100):
+			for keycode in KeystrokeQueueTest.KEYCODES + bytes([0x28]): # Enter
+				key_data[2] = keycode
+				recorder.record(report_id, key_data, 50)
+				key_data[2] = 0
+				recorder.record(report_id, key_data, 30)
+
+		recorder.close()
+
+	def __button_click_cb(self, pin: int):
+		if self.__player.playing:
+			self.__player.stop()
+		else:
+			print('Playing macro, click again to stop')
+			self.__player.play()
+
+	def __done_cb(self, error):
+		print('Macro finished' if error is None else f'Macro failed: {error}')
+
+
+class CompositeTest(object):
+	def __init__(self, button_pin: int = 9):
+		self.__device = BLECompositeHID(led_status_cb=self.__led_status_cb)
+
+		self.__button = Button(
+			pin=[button_pin],
+			click_cb=self.__button_click_cb,
+		)
+
+		self.__device.update_battery_level(randint(1, 80))
+
+	def __button_click_cb(self, pin: int):
+		print('Keyboard: a')
+		self.__device.press(0x04)
+		self.__device.release(0x04)
+		sleep_ms(500)
+
+		print('Consumer: volume up')
+		self.__device.consumer_press(self.__device.CONSUMER_VOLUME_UP)
+		self.__device.consumer_release()
+		sleep_ms(500)
+
+		print('Mouse: draw a square')
+		for x, y in ((10, 0), (0, 10), (-10, 0), (0, -10)):
+			for _ in range(10):
+				self.__device.mouse_move(x, y)
+				sleep_ms(15)
+
+	def __led_status_cb(self, num_lock, caps_lock, scroll_lock):
+		print('   num_lock:', num_lock)
+		print('  caps_lock:', caps_lock)
+		print('scroll_lock:', scroll_lock)
+
+
+class MouseTest(object):
+	def __init__(self, button_pin: int = 9):
+		self.__mouse = BLEMouse()
+
+		self.__button = Button(
+			pin=[button_pin],
+			click_cb=self.__button_click_cb,
+		)
+
+		self.__mouse.update_battery_level(randint(1, 80))
+
+	def __button_click_cb(self, pin: int):
+		# 模拟 1kHz 传感器，每毫秒移动 1 个单位，由累加器合并为每个连接间隔一个 report
+		print('Mouse: draw a square at 1 kHz')
+
+		for x, y in ((1, 0), (0, 1), (-1, 0), (0, -1)):
+			for _ in range(500):
+				self.__mouse.move(x, y)
+				sleep_ms(1)
+
+		self.__mouse.click()
+
+
+class BatteryTest(object):
+	def __init__(self, button_pin: int = 9, adc_pin: int = 1):
+		self.__keyboard = BLEKeyboard104()
+		self.__monitor  = BatteryMonitor(self.__keyboard, ADCSource(adc_pin), period_ms=5000)
+
+		self.__button = Button(
+			pin=[button_pin],
+			click_cb=self.__button_click_cb,
+		)
+
+		self.__monitor.start()
+
+	def __button_click_cb(self, pin: int):
+		# 电量只在变化超过滞回范围时通知，已订阅的客户端才会收到
+		level = self.__monitor.sample()
+
+		print(f'Battery: {self.__monitor.millivolts} mV, {level}%')
+
+
 class ConsumerVolumeTest(object):
 	def __init__(self, button_pin: int = 9):
-		self.__volume = BLEVolumeKey(report_count=2)
+		self.__volume = BLEVolumeKey()
 
 		self.__button = Button(
 			pin=[button_pin],
 			click_cb=self.__button_click_cb,
 		)
 
-		self.__volume.update_battery_level()
+		self.__volume.update_battery_level(randint(1, 80))
 
 	def __button_click_cb(self, pin: int):
 		delay = 1000
@@ -175,7 +314,12 @@ if __name__ == '__main__':
 		'Using 3 HID report descriptors, randomly send a key code',
 		'Using 3 HID report descriptors, send 18 key codes at once',
 		'Using 1 HID report descriptor, send 95 key codes at once',
-		'Using 2 HID report descriptors, send volume up/down'
+		'Using 2 HID report descriptors, send volume up/down',
+		'Using keystroke queue, type a string at maximum rate',
+		'Using macro player, replay a recorded key sequence from flash',
+		'Using composite device, send keyboard, consumer and mouse reports',
+		'Using mouse device, accumulate 1 kHz motion into one report per interval',
+		'Using battery monitor, sample ADC and notify battery level changes',
 	]
 
 	mode = Utilities.choose_an_option('Keyboard Test Mode', options)
@@ -186,6 +330,24 @@ if __name__ == '__main__':
 			# https://key.motsuni.cn/
 			from devices.hid.keyboard_2.keyboard import BLEKeyboard104
 			test = KeyboardTest2(button_pin=button_pin)
+		elif mode == MODE_QUEUE_TYPING:
+			from devices.hid.keyboard_1.keyboard import BLEKeyboard104
+			from devices.hid.scheduler import KeystrokeScheduler
+			test = KeystrokeQueueTest(button_pin=button_pin)
+		elif mode == MODE_MACRO_PLAYBACK:
+			from devices.hid.keyboard_1.keyboard import BLEKeyboard104
+			from devices.hid.macro import MacroRecorder, MacroPlayer
+			test = MacroPlaybackTest(button_pin=button_pin)
+		elif mode == MODE_COMPOSITE:
+			from devices.hid.composite.composite import BLECompositeHID
+			test = CompositeTest(button_pin=button_pin)
+		elif mode == MODE_MOUSE:
+			from devices.hid.mouse.mouse import BLEMouse
+			test = MouseTest(button_pin=button_pin)
+		elif mode == MODE_BATTERY:
+			from devices.hid.keyboard_1.keyboard import BLEKeyboard104
+			from devices.hid.battery import BatteryMonitor, ADCSource
+			test = BatteryTest(button_pin=button_pin)
 		elif mode == MODE_CONSUMER_VOLUME:
 			from devices.hid.volume.volume import BLEVolumeKey
 			test = ConsumerVolumeTest(button_pin=button_pin)
@@ -86,6 +86,17 @@ def run_add_services_test():
 
 	preview(profile)
 
+	# 修改已添加到配置文件中的服务，预览结果应随之更新
+	service = profile.get_service(make_uuid(UUID_HUMAN_INTERFACE_DEVICE))
+	service.remove_characteristics(*[char for char in service.characteristics if isinstance(char, HIDControlPoint)])
+
+	preview(profile)
+
+	# 为已添加的特征追加描述符，预览结果同样应随之更新
+	service.characteristics[0].add_descriptors(ReportReference())
+
+	preview(profile)
+
 
 if __name__ == '__main__':
 	options = [
@@ -0,0 +1,97 @@
+"""
+Copyright © 2024 Walkline Wang (https://walkline.wang)
+Gitee: https://gitee.com/walkline/micropython-new-ble-library
+"""
+import bluetooth
+from time import ticks_ms
+
+
+class BLERecorder(object):
+	'''
+	包装 bluetooth.BLE 对象，统计 GATT 和广播操作的调用次数及时间，其余方法直接转发
+
+	设备在构造函数中调用 bluetooth.BLE() 获取蓝牙对象，
+	通过 install() 替换设备所在模块的 bluetooth.BLE()，之后构造的设备即使用本对象：
+
+		import profiles.hid
+
+		recorder = BLERecorder()
+		recorder.install(profiles.hid)
+		keyboard = BLEKeyboard104()
+		recorder.uninstall()
+
+		print(recorder.count('gatts_notify'))
+	'''
+	def __dir__(self):
+		return [attr for attr in dir(type(self)) if not attr.startswith('_')]
+
+	def __init__(self):
+		self.__ble    = bluetooth.BLE()
+		self.__module = None
+		self.reset()
+
+	def __getattr__(self, name):
+		return getattr(self.__ble, name)
+
+	def __record(self, name: str, start: int, result):
+		if name not in self.__started:
+			self.__started[name] = start
+
+		self.__finished[name] = ticks_ms()
+		self.__counts[name]   = self.__counts.get(name, 0) + 1
+
+		return result
+
+	def install(self, module):
+		'''使 module 中的 bluetooth.BLE() 返回本对象'''
+		recorder = self
+
+		class Bluetooth(object):
+			@staticmethod
+			def BLE():
+				return recorder
+
+		self.__module    = module
+		module.bluetooth = Bluetooth
+
+	def uninstall(self):
+		'''恢复 install() 替换的 bluetooth 模块'''
+		if self.__module is not None:
+			self.__module.bluetooth = bluetooth
+			self.__module = None
+
+	def reset(self):
+		'''清空统计结果'''
+		self.__counts   = {} # name: 调用次数
+		self.__started  = {} # name: 首次调用开始的时间
+		self.__finished = {} # name: 最近一次调用结束的时间
+
+	def count(self, name: str) -> int:
+		return self.__counts.get(name, 0)
+
+	def started(self, name: str) -> int:
+		'''首次调用开始时的 ticks_ms()，尚未调用时为 None'''
+		return self.__started.get(name)
+
+	def finished(self, name: str) -> int:
+		'''最近一次调用结束时的 ticks_ms()，尚未调用时为 None'''
+		return self.__finished.get(name)
+
+	def gatts_register_services(self, *args):
+		start = ticks_ms()
+		return self.__record('gatts_register_services', start, self.__ble.gatts_register_services(*args))
+
+	def gatts_write(self, *args):
+		start = ticks_ms()
+		return self.__record('gatts_write', start, self.__ble.gatts_write(*args))
+
+	def gatts_notify(self, *args):
+		start = ticks_ms()
+		return self.__record('gatts_notify', start, self.__ble.gatts_notify(*args))
+
+	def gap_advertise(self, interval_us, *args, **kwargs):
+		start  = ticks_ms()
+		result = self.__ble.gap_advertise(interval_us, *args, **kwargs)
+
+		# 停止广播不计入
+		return result if interval_us is None else self.__record('gap_advertise', start, result)